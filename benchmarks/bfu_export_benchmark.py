@@ -0,0 +1,606 @@
+# ====================== BEGIN GPL LICENSE BLOCK ============================
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.	 See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.	 If not, see <http://www.gnu.org/licenses/>.
+#  All rights reserved.
+#
+# ======================= END GPL LICENSE BLOCK =============================
+
+# Headless export benchmark of Blender For Unreal Engine.
+# Generate a synthetic scene, run the potential error check, the export and the text files
+# and write the throughput in a json file that can be compared between commits.
+#
+# Usage:
+# blender -b --factory-startup --python benchmarks/bfu_export_benchmark.py -- --preset medium --result result.json
+# blender -b --factory-startup --python benchmarks/bfu_export_benchmark.py -- --static-meshes 200 --rigs 0
+#
+# Compare two results (also works without Blender):
+# python benchmarks/bfu_export_benchmark.py --compare before.json after.json
+
+import os
+import sys
+import json
+import math
+import time
+import shutil
+import argparse
+import datetime
+import tempfile
+import importlib
+import statistics
+import subprocess
+
+try:
+    import bpy
+    import bmesh
+    import mathutils
+except ImportError:
+    # --compare can be used without Blender
+    bpy = None
+
+BENCHMARK_VERSION = 1
+ADDON_MODULE = "blender-for-unrealengine"
+REPOSITORY_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+benchmark_presets = {
+    # Preset name : scene size
+    "small": {
+        "static_meshes": 20,
+        "mesh_resolution": 16,
+        "collections": 2,
+        "collection_meshes": 4,
+        "rigs": 2,
+        "bones": 16,
+        "actions": 4,
+        "action_frames": 60,
+        "cameras": 2,
+        "camera_frames": 250,
+        },
+    "medium": {
+        "static_meshes": 100,
+        "mesh_resolution": 32,
+        "collections": 5,
+        "collection_meshes": 8,
+        "rigs": 5,
+        "bones": 64,
+        "actions": 10,
+        "action_frames": 120,
+        "cameras": 5,
+        "camera_frames": 1000,
+        },
+    "large": {
+        "static_meshes": 500,
+        "mesh_resolution": 64,
+        "collections": 20,
+        "collection_meshes": 16,
+        "rigs": 10,
+        "bones": 128,
+        "actions": 25,
+        "action_frames": 240,
+        "cameras": 10,
+        "camera_frames": 5000,
+        },
+}
+
+
+def GetBenchmarkParser():
+    parser = argparse.ArgumentParser(
+        prog="blender -b --factory-startup --python bfu_export_benchmark.py --",
+        description="Benchmark the export of Blender For Unreal Engine on a generated scene.")
+    parser.add_argument(
+        "--preset",
+        choices=list(benchmark_presets),
+        default="small",
+        help="Size of the generated scene, the values can be changed with the options below.")
+    for key, value in benchmark_presets["small"].items():
+        parser.add_argument(
+            "--" + key.replace("_", "-"),
+            type=int,
+            help="Override the preset value (small preset: " + str(value) + ").")
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="Number of exports, the median time is used for the throughput.")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of export worker processes.")
+    parser.add_argument(
+        "--export-path",
+        help="Folder of the exported files, a temporary folder is used by default.")
+    parser.add_argument(
+        "--result",
+        help="Write the json result at this path.")
+    parser.add_argument(
+        "--compare",
+        nargs=2,
+        metavar=("BEFORE", "AFTER"),
+        help="Compare two json results and exit.")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=10.0,
+        help="With --compare, exit with 1 if a result is slower by more than this percentage.")
+    return parser
+
+
+def GetBenchmarkArguments(argv=None):
+    # In Blender the script arguments are after "--"
+    if argv is None:
+        argv = sys.argv
+    if "--" in argv:
+        return argv[argv.index("--") + 1:]
+    if bpy is not None:
+        return []
+    return argv[1:]
+
+
+def GetSceneConfig(args):
+    config = dict(benchmark_presets[args.preset])
+    for key in config:
+        value = getattr(args, key)
+        if value is not None:
+            config[key] = max(0, value)
+    config["mesh_resolution"] = max(1, config["mesh_resolution"])
+    config["bones"] = max(1, config["bones"])
+    config["action_frames"] = max(2, config["action_frames"])
+    config["camera_frames"] = max(2, config["camera_frames"])
+    return config
+
+
+def GetGitCommit():
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "HEAD"],
+            cwd=REPOSITORY_PATH,
+            stderr=subprocess.DEVNULL,
+            universal_newlines=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def LoadAddon():
+    # Use the add-on of this repository even if an other version is installed
+    import addon_utils
+    if REPOSITORY_PATH not in sys.path:
+        sys.path.insert(0, REPOSITORY_PATH)
+    if not addon_utils.check(ADDON_MODULE)[1]:
+        addon_utils.enable(ADDON_MODULE, default_set=False)
+    if not addon_utils.check(ADDON_MODULE)[1]:
+        raise RuntimeError("Can't enable the add-on " + ADDON_MODULE + " from " + REPOSITORY_PATH)
+
+    addon = {}
+    addon["export_asset"] = importlib.import_module(ADDON_MODULE + ".export.bfu_export_asset")
+    addon["check_potential_error"] = importlib.import_module(ADDON_MODULE + ".bfu_check_potential_error")
+    addon["write_text"] = importlib.import_module(ADDON_MODULE + ".bfu_write_text")
+    addon["utils"] = importlib.import_module(ADDON_MODULE + ".bfu_utils")
+    return addon
+
+
+# Scene generator
+
+
+def ClearScene():
+    for obj in list(bpy.data.objects):
+        bpy.data.objects.remove(obj)
+    for action in list(bpy.data.actions):
+        bpy.data.actions.remove(action)
+    for col in list(bpy.data.collections):
+        bpy.data.collections.remove(col)
+
+
+def CreateCollection(name, parent):
+    col = bpy.data.collections.new(name)
+    parent.children.link(col)
+    return col
+
+
+def CreateGridMesh(name, resolution, size=1.0):
+    mesh = bpy.data.meshes.new(name)
+    bm = bmesh.new()
+    bmesh.ops.create_grid(bm, x_segments=resolution, y_segments=resolution, size=size, calc_uvs=True)
+    bm.to_mesh(mesh)
+    bm.free()
+    return mesh
+
+
+def CreateCubeMesh(name, size=1.0, matrix=None):
+    if matrix is None:
+        matrix = mathutils.Matrix.Identity(4)
+    mesh = bpy.data.meshes.new(name)
+    bm = bmesh.new()
+    bmesh.ops.create_cube(bm, size=size, matrix=matrix, calc_uvs=True)
+    bm.to_mesh(mesh)
+    bm.free()
+    return mesh
+
+
+def CreateObject(name, data, col, location=(0, 0, 0), parent=None):
+    obj = bpy.data.objects.new(name, data)
+    col.objects.link(obj)
+    obj.location = location
+    if parent is not None:
+        obj.parent = parent
+    return obj
+
+
+def SetFCurveKeys(fcurve, frames, values):
+    # Add all the keys in a single call
+    fcurve.keyframe_points.add(len(frames))
+    co = []
+    for frame, value in zip(frames, values):
+        co.extend((frame, value))
+    fcurve.keyframe_points.foreach_set("co", co)
+    fcurve.update()
+
+
+def CreateStaticMesh(name, col, config, location):
+    # StaticMesh with a collision and a socket
+    mesh = CreateGridMesh(name, config["mesh_resolution"])
+    obj = CreateObject(name, mesh, col, location)
+    obj.ExportEnum = "export_recursive"
+
+    collision = CreateObject("UCX_" + name + "_01", CreateCubeMesh("UCX_" + name + "_01"), col, parent=obj)
+    collision.display_type = 'WIRE'
+
+    socket = CreateObject("SOCKET_" + name + "_01", None, col, (0, 0, 1), parent=obj)
+    socket.empty_display_type = 'ARROWS'
+    return obj
+
+
+def CreateRig(name, col, config, location):
+    # Armature with a bone chain, a skinned mesh and config["actions"] actions
+    armature = bpy.data.armatures.new(name)
+    rig = CreateObject(name, armature, col, location)
+    rig.ExportEnum = "export_recursive"
+    rig.bfu_anim_action_export_enum = "export_auto"
+
+    bone_names = ["Bone_" + str(x).zfill(3) for x in range(config["bones"])]
+    bpy.context.view_layer.objects.active = rig
+    bpy.ops.object.mode_set(mode='EDIT')
+    parent_bone = None
+    for x, bone_name in enumerate(bone_names):
+        bone = armature.edit_bones.new(bone_name)
+        bone.head = (0, 0, x * 0.5)
+        bone.tail = (0, 0, x * 0.5 + 0.5)
+        if parent_bone is not None:
+            bone.parent = parent_bone
+            bone.use_connect = True
+        parent_bone = bone
+    bpy.ops.object.mode_set(mode='OBJECT')
+
+    # Skinned mesh, one cube per bone
+    mesh = bpy.data.meshes.new(name + "_Mesh")
+    bm = bmesh.new()
+    bone_verts = []
+    for x in range(len(bone_names)):
+        matrix = mathutils.Matrix.Translation((0, 0, x * 0.5 + 0.25))
+        bone_verts.append(bmesh.ops.create_cube(bm, size=0.4, matrix=matrix, calc_uvs=True)["verts"])
+    bm.verts.index_update()
+    bone_verts = [[v.index for v in verts] for verts in bone_verts]
+    bm.to_mesh(mesh)
+    bm.free()
+
+    skin = CreateObject(name + "_Mesh", mesh, col, parent=rig)
+    for bone_name, verts in zip(bone_names, bone_verts):
+        group = skin.vertex_groups.new(name=bone_name)
+        group.add(verts, 1.0, 'REPLACE')
+    modifier = skin.modifiers.new("Armature", 'ARMATURE')
+    modifier.object = rig
+
+    for pose_bone in rig.pose.bones:
+        pose_bone.rotation_mode = 'XYZ'
+
+    # Actions, a key each 10 frames
+    rig.animation_data_create()
+    frames = list(range(0, config["action_frames"] + 1, 10))
+    if frames[-1] != config["action_frames"]:
+        frames.append(config["action_frames"])
+    for action_index in range(config["actions"]):
+        action = bpy.data.actions.new(name + "_Action_" + str(action_index).zfill(2))
+        action.use_fake_user = True
+        for bone_index, bone_name in enumerate(bone_names):
+            data_path = 'pose.bones["' + bone_name + '"].rotation_euler'
+            for axis in range(3):
+                fcurve = action.fcurves.new(data_path, index=axis, action_group=bone_name)
+                phase = (action_index + bone_index + axis) * 0.37
+                values = [0.3 * math.sin(frame * 0.05 + phase) for frame in frames]
+                SetFCurveKeys(fcurve, frames, values)
+        if rig.animation_data.action is None:
+            rig.animation_data.action = action
+    return rig
+
+
+def CreateCamera(name, col, config, location):
+    # Camera with a key on each frame
+    camera = bpy.data.cameras.new(name)
+    obj = CreateObject(name, camera, col, location)
+    obj.ExportEnum = "export_recursive"
+
+    frames = list(range(config["camera_frames"] + 1))
+    action = bpy.data.actions.new(name + "_Action")
+    for axis in range(3):
+        fcurve = action.fcurves.new("location", index=axis, action_group="Object Transforms")
+        SetFCurveKeys(fcurve, frames, [location[axis] + math.sin(frame * 0.01 + axis) * 5 for frame in frames])
+        fcurve = action.fcurves.new("rotation_euler", index=axis, action_group="Object Transforms")
+        SetFCurveKeys(fcurve, frames, [math.cos(frame * 0.005 + axis) for frame in frames])
+    obj.animation_data_create()
+    obj.animation_data.action = action
+
+    lens_action = bpy.data.actions.new(name + "_LensAction")
+    fcurve = lens_action.fcurves.new("lens", index=0)
+    SetFCurveKeys(fcurve, frames, [35 + math.sin(frame * 0.02) * 15 for frame in frames])
+    camera.animation_data_create()
+    camera.animation_data.action = lens_action
+    return obj
+
+
+def GenerateBenchmarkScene(config, export_path):
+    ClearScene()
+    scene = bpy.context.scene
+    root = CreateCollection("BFU_Benchmark", scene.collection)
+
+    static_col = CreateCollection("BFU_Benchmark_StaticMeshes", root)
+    for x in range(config["static_meshes"]):
+        location = ((x % 20) * 3, (x // 20) * 3, 0)
+        CreateStaticMesh("SM_Benchmark_" + str(x).zfill(4), static_col, config, location)
+
+    scene.CollectionExportList.clear()
+    for x in range(config["collections"]):
+        col = CreateCollection("Col_Benchmark_" + str(x).zfill(3), root)
+        for y in range(config["collection_meshes"]):
+            name = "SM_Col_Benchmark_" + str(x).zfill(3) + "_" + str(y).zfill(3)
+            obj = CreateObject(name, CreateGridMesh(name, config["mesh_resolution"]), col, (y * 3, -10 - x * 3, 0))
+            obj.ExportEnum = "dont_export"
+        item = scene.CollectionExportList.add()
+        item.name = col.name
+        item.use = True
+
+    rig_col = CreateCollection("BFU_Benchmark_Rigs", root)
+    for x in range(config["rigs"]):
+        CreateRig("SK_Benchmark_" + str(x).zfill(3), rig_col, config, (x * 3, 20, 0))
+
+    camera_col = CreateCollection("BFU_Benchmark_Cameras", root)
+    for x in range(config["cameras"]):
+        CreateCamera("Cam_Benchmark_" + str(x).zfill(3), camera_col, config, (x * 3, -30, 2))
+
+    scene.frame_start = 0
+    scene.frame_end = max(config["action_frames"], config["camera_frames"])
+
+    # Export settings
+    scene.static_export = True
+    scene.static_collection_export = True
+    scene.skeletal_export = True
+    scene.anin_export = True
+    scene.alembic_export = False
+    scene.camera_export = True
+    scene.bfu_export_selection_filter = "default"
+    scene.bfu_export_incremental = False
+    scene.text_ExportLog = True
+    scene.text_ImportAssetScript = True
+    scene.text_ImportSequenceScript = True
+    scene.text_AdditionalData = True
+
+    scene.export_static_file_path = os.path.join(export_path, "StaticMesh", "")
+    scene.export_skeletal_file_path = os.path.join(export_path, "SkeletalMesh", "")
+    scene.export_alembic_file_path = os.path.join(export_path, "Alembic", "")
+    scene.export_camera_file_path = os.path.join(export_path, "Sequencer", "")
+    scene.export_other_file_path = os.path.join(export_path, "Other", "")
+
+    bpy.context.view_layer.update()
+
+
+def GetSceneStats():
+    stats = {}
+    stats["objects"] = len(bpy.data.objects)
+    stats["meshes"] = len(bpy.data.meshes)
+    stats["vertices"] = sum(len(mesh.vertices) for mesh in bpy.data.meshes)
+    stats["armatures"] = len(bpy.data.armatures)
+    stats["actions"] = len(bpy.data.actions)
+    stats["collections"] = len(bpy.data.collections)
+    return stats
+
+
+# Benchmark
+
+
+def GetExportedAssetsStats(config):
+    scene = bpy.context.scene
+    stats = {}
+    stats["assets"] = 0
+    stats["failed_assets"] = 0
+    stats["files"] = 0
+    stats["bytes"] = 0
+    stats["animation_frames"] = 0
+    for asset in scene.UnrealExportedAssetsList:
+        stats["assets"] += 1
+        if not asset.export_success:
+            stats["failed_assets"] += 1
+        for file in asset.files:
+            path = file.GetAbsolutePath()
+            if os.path.isfile(path):
+                stats["files"] += 1
+                stats["bytes"] += os.path.getsize(path)
+        if asset.asset_type == "Action":
+            stats["animation_frames"] += config["action_frames"] + 1
+        elif asset.asset_type == "Camera":
+            stats["animation_frames"] += config["camera_frames"] + 1
+    return stats
+
+
+def GetThroughput(value, elapsed):
+    if elapsed <= 0:
+        return None
+    return round(value / elapsed, 3)
+
+
+def RunBenchmark(args):
+    config = GetSceneConfig(args)
+    addon = LoadAddon()
+    addon_prefs = addon["utils"].GetAddonPrefs()
+    addon_prefs.exportWorkerCount = max(1, args.workers)
+    addon_prefs.revertExportPath = False
+
+    use_temp_path = args.export_path is None
+    export_path = tempfile.mkdtemp(prefix="bfu_benchmark_") if use_temp_path else os.path.abspath(args.export_path)
+
+    results = {}
+    try:
+        counter = time.perf_counter()
+        GenerateBenchmarkScene(config, export_path)
+        results["scene_generation"] = {"time": round(time.perf_counter() - counter, 4)}
+
+        if args.workers > 1:
+            # The export workers need a saved file
+            bpy.ops.wm.save_as_mainfile(filepath=os.path.join(export_path, "bfu_benchmark.blend"))
+
+        # Potential error check, without the cached results
+        check = addon["check_potential_error"]
+        check.MyPotentialErrorCheckCache.Clear()
+        counter = time.perf_counter()
+        potential_errors = check.UpdateUnrealPotentialError()
+        elapsed = time.perf_counter() - counter
+        results["potential_error_check"] = {
+            "time": round(elapsed, 4),
+            "objects_per_second": GetThroughput(len(bpy.data.objects), elapsed),
+            "potential_errors": len(potential_errors),
+            }
+
+        # Export
+        export_times = []
+        export_stats = None
+        for x in range(max(1, args.repeat)):
+            for folder in ["StaticMesh", "SkeletalMesh", "Alembic", "Sequencer", "Other"]:
+                shutil.rmtree(os.path.join(export_path, folder), ignore_errors=True)
+            bpy.context.scene.UnrealExportedAssetsList.clear()
+            check.UpdateNameHierarchy()
+            counter = time.perf_counter()
+            addon["export_asset"].ExportForUnrealEngine()
+            export_times.append(time.perf_counter() - counter)
+            export_stats = GetExportedAssetsStats(config)
+
+        elapsed = statistics.median(export_times)
+        results["export"] = {
+            "time": round(elapsed, 4),
+            "times": [round(t, 4) for t in export_times],
+            "assets": export_stats["assets"],
+            "failed_assets": export_stats["failed_assets"],
+            "files": export_stats["files"],
+            "bytes": export_stats["bytes"],
+            "animation_frames": export_stats["animation_frames"],
+            "assets_per_second": GetThroughput(export_stats["assets"], elapsed),
+            "megabytes_per_second": GetThroughput(export_stats["bytes"] / 1048576, elapsed),
+            "frames_per_second": GetThroughput(export_stats["animation_frames"], elapsed),
+            }
+
+        # Export log, import scripts and additional data
+        counter = time.perf_counter()
+        addon["write_text"].WriteAllTextFiles()
+        elapsed = time.perf_counter() - counter
+        results["text_files"] = {
+            "time": round(elapsed, 4),
+            "assets_per_second": GetThroughput(export_stats["assets"], elapsed),
+            }
+
+    finally:
+        if use_temp_path:
+            shutil.rmtree(export_path, ignore_errors=True)
+
+    data = {}
+    data["benchmark_version"] = BENCHMARK_VERSION
+    data["date"] = datetime.datetime.now().isoformat(timespec="seconds")
+    data["commit"] = GetGitCommit()
+    data["blender_version"] = bpy.app.version_string
+    data["platform"] = sys.platform
+    data["preset"] = args.preset
+    data["config"] = config
+    data["repeat"] = max(1, args.repeat)
+    data["workers"] = max(1, args.workers)
+    data["scene"] = GetSceneStats()
+    data["results"] = results
+    return data
+
+
+# Compare
+
+
+def IsHigherBetter(key):
+    return key.endswith("_per_second")
+
+
+def IsComparableResult(key):
+    return key == "time" or key.endswith("_per_second")
+
+
+def CompareResults(before, after, threshold):
+    # Print the change of each result and return the number of regressions
+    regressions = 0
+    if before.get("config") != after.get("config"):
+        print("Warning: the results don't use the same scene config.")
+
+    print("Result".ljust(44) + "Before".rjust(12) + "After".rjust(12) + "Change".rjust(10))
+    for section, values in after.get("results", {}).items():
+        for key, value in values.items():
+            if not IsComparableResult(key):
+                continue
+            old_value = before.get("results", {}).get(section, {}).get(key)
+            if not old_value or value is None:
+                continue
+
+            change = (value - old_value) / old_value * 100
+            if IsHigherBetter(key):
+                slower = change < -threshold
+            else:
+                slower = change > threshold
+            line = (section + "." + key).ljust(44)
+            line += str(round(old_value, 3)).rjust(12)
+            line += str(round(value, 3)).rjust(12)
+            line += ("%+.1f%%" % change).rjust(10)
+            if slower:
+                line += "  REGRESSION"
+                regressions += 1
+            print(line)
+    return regressions
+
+
+def Main(argv=None):
+    parser = GetBenchmarkParser()
+    args = parser.parse_args(GetBenchmarkArguments(argv))
+
+    if args.compare:
+        with open(args.compare[0], 'r') as json_file:
+            before = json.load(json_file)
+        with open(args.compare[1], 'r') as json_file:
+            after = json.load(json_file)
+        regressions = CompareResults(before, after, args.threshold)
+        sys.exit(1 if regressions > 0 else 0)
+
+    if bpy is None:
+        parser.error("The benchmark must be run in Blender: blender -b --factory-startup --python " + __file__ + " -- [options]")
+
+    data = RunBenchmark(args)
+    result_text = json.dumps(data, ensure_ascii=False, indent=4)
+    if args.result:
+        result_dir = os.path.dirname(os.path.abspath(args.result))
+        if not os.path.isdir(result_dir):
+            os.makedirs(result_dir)
+        with open(args.result, 'w') as json_file:
+            json_file.write(result_text)
+    print(result_text)
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    Main()
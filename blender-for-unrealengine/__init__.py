@@ -158,6 +158,7 @@ def register():
     bfu_export_logs.register()
     bfu_ui.register()
     bfu_check_potential_error.register()
+    bfu_utils.register()
 
 
 def unregister():
@@ -194,3 +195,4 @@ def unregister():
     bfu_export_logs.unregister()
     bfu_ui.unregister()
     bfu_check_potential_error.unregister()
+    bfu_utils.unregister()
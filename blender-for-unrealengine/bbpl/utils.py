@@ -114,10 +114,10 @@ class UserSelectSave():
         self.SaveMode()
         SafeModeSet("OBJECT", bpy.ops.object)
         bpy.ops.object.select_all(action='DESELECT')
-        for obj in bpy.data.objects:
-            if obj.name in self.user_selected_names:
-                if obj.name in bpy.context.view_layer.objects:
-                    bpy.data.objects[obj.name].select_set(True)  # Use the name because can be duplicated name
+        for obj_name in self.user_selected_names:
+            if obj_name in bpy.data.objects:
+                if obj_name in bpy.context.view_layer.objects:
+                    bpy.data.objects[obj_name].select_set(True)  # Use the name because can be duplicated name
 
         if self.user_active_name != "":
             if self.user_active_name in bpy.data.objects:
@@ -137,6 +137,124 @@ class UserSelectSave():
                 SafeModeSet(self.user_mode, bpy.ops.object)
 
 
+class SceneChangeJournal():
+    # Records the visibility properties changed with the Set functions
+    # and restores them with Rollback().
+    # Only the changed properties are saved so the cost don't depend on the file size.
+
+    def __init__(self):
+        self.entries = []  # (kind, key, property name, old value)
+        self.recorded = set()
+        self.layer_collection_paths = {}  # View layer name : {collection name : [layer collections]}
+
+    def Record(self, kind, key, prop, old_value):
+        # Only the first value is saved, it's the value before the changes
+        if (kind, key, prop) not in self.recorded:
+            self.recorded.add((kind, key, prop))
+            self.entries.append((kind, key, prop, old_value))
+
+    def GetLayerCollectionPath(self, view_layer, collection):
+        # Returns the layer collections from the view layer root to the collection
+        if view_layer.name not in self.layer_collection_paths:
+            paths = {}
+            stack = [(child, []) for child in view_layer.layer_collection.children]
+            while len(stack) > 0:
+                layer_collection, parent_path = stack.pop()
+                path = parent_path + [layer_collection]
+                if layer_collection.name not in paths:
+                    paths[layer_collection.name] = path
+                for child in layer_collection.children:
+                    stack.append((child, path))
+            self.layer_collection_paths[view_layer.name] = paths
+        return self.layer_collection_paths[view_layer.name].get(collection.name)
+
+    def SetCollectionVisible(self, collection, view_layer=None):
+        # Unhide and include the collection and its parents in the view layer
+        if view_layer is None:
+            view_layer = bpy.context.view_layer
+
+        path = self.GetLayerCollectionPath(view_layer, collection)
+        if path is None:
+            # Master collection or not used in this view layer
+            return
+
+        path_names = tuple(layer_collection.name for layer_collection in path)
+        for x, layer_collection in enumerate(path):
+            col = layer_collection.collection
+            if col.hide_select:
+                self.Record("COLLECTION", col.name, "hide_select", True)
+                col.hide_select = False
+            if col.hide_viewport:
+                self.Record("COLLECTION", col.name, "hide_viewport", True)
+                col.hide_viewport = False
+
+            key = (view_layer.name, path_names[:x+1])
+            if layer_collection.exclude:
+                self.Record("LAYER_COLLECTION", key, "exclude", True)
+                layer_collection.exclude = False
+            if layer_collection.hide_viewport:
+                self.Record("LAYER_COLLECTION", key, "hide_viewport", True)
+                layer_collection.hide_viewport = False
+
+    def SetObjectVisible(self, obj, view_layer=None):
+        # Unhide and make selectable the object in the view layer
+        if view_layer is None:
+            view_layer = bpy.context.view_layer
+
+        for col in obj.users_collection:
+            self.SetCollectionVisible(col, view_layer)
+
+        if obj.hide_select:
+            self.Record("OBJECT", obj.name, "hide_select", True)
+            obj.hide_select = False
+        if obj.hide_viewport:
+            self.Record("OBJECT", obj.name, "hide_viewport", True)
+            obj.hide_viewport = False
+        if obj.name in view_layer.objects:
+            if obj.hide_get(view_layer=view_layer):
+                self.Record("OBJECT_VIEW_LAYER", (obj.name, view_layer.name), "hide", True)
+                obj.hide_set(False, view_layer=view_layer)
+
+    def GetLayerCollection(self, key):
+        view_layer_name, path_names = key
+        view_layer = bpy.context.scene.view_layers.get(view_layer_name)
+        if view_layer is None:
+            return None
+        layer_collection = view_layer.layer_collection
+        for name in path_names:
+            layer_collection = layer_collection.children.get(name)
+            if layer_collection is None:
+                return None
+        return layer_collection
+
+    def Rollback(self):
+        # Restore in reverse order, objects before their collections
+        for kind, key, prop, old_value in reversed(self.entries):
+            if kind == "OBJECT":
+                data = bpy.data.objects.get(key)
+            elif kind == "COLLECTION":
+                data = bpy.data.collections.get(key)
+            elif kind == "LAYER_COLLECTION":
+                data = self.GetLayerCollection(key)
+            elif kind == "OBJECT_VIEW_LAYER":
+                obj = bpy.data.objects.get(key[0])
+                view_layer = bpy.context.scene.view_layers.get(key[1])
+                if obj is not None and view_layer is not None:
+                    if obj.name in view_layer.objects:
+                        obj.hide_set(old_value, view_layer=view_layer)
+                continue
+
+            if data is None:
+                print("/!\\ "+str(key)+" not found for restore "+prop)
+                continue
+            if getattr(data, prop) != old_value:
+                setattr(data, prop, old_value)
+
+        self.entries = []
+        self.recorded = set()
+        self.layer_collection_paths = {}
+
+
 class UserSceneSave():
 
     def __init__(self):
@@ -152,17 +270,16 @@ class UserSceneSave():
         self.use_simplify = False
 
         # Data
-        self.objects = []
         self.object_bones = []
-        self.collections = []
-        self.view_layer_collections = []
-        self.action_names = []
-        self.collection_names = []
+        self.action_names = set()
+        self.collection_names = set()
+
+        # Visibility changes, restored by ResetSceneAtSave()
+        self.journal = SceneChangeJournal()
 
     def SaveCurrentScene(self):
         # Save data (This can take time)
 
-        c = bpy.context
         # Select
         self.user_select_class.SaveCurrentSelect()
 
@@ -173,18 +290,10 @@ class UserSceneSave():
         self.use_simplify = bpy.context.scene.render.use_simplify
 
         # Data
-        for obj in bpy.data.objects:
-            self.objects.append(SavedObject(obj))
-        for col in bpy.data.collections:
-            self.collections.append(SavedCollection(col))
-        for vlayer in c.scene.view_layers:
-            layer_collections = getLayerCollectionsRecursive(vlayer.layer_collection)
-            for layer_collection in layer_collections:
-                self.view_layer_collections.append(SavedViewLayerChildren(vlayer, layer_collection))
-        for action in bpy.data.actions:
-            self.action_names.append(action.name)
-        for collection in bpy.data.collections:
-            self.collection_names.append(collection.name)
+        # The hide and select properties are not saved,
+        # change them with self.journal so they are restored by ResetSceneAtSave()
+        self.action_names = set(bpy.data.actions.keys())
+        self.collection_names = set(bpy.data.collections.keys())
 
         # Data for armature
         if self.user_select_class.user_active:
@@ -226,54 +335,12 @@ class UserSceneSave():
                 SafeModeSet(self.user_mode, bpy.ops.object)
 
     def ResetSceneAtSave(self):
-        scene = bpy.context.scene
         self.ResetModeAtSave()
 
         bpy.context.scene.render.use_simplify = self.use_simplify
 
-        # Reset hide and select (bpy.data.objects)
-        for obj in self.objects:
-            if obj.name in bpy.data.objects:
-                if bpy.data.objects[obj.name].hide_select != obj.hide_select:
-                    bpy.data.objects[obj.name].hide_select = obj.hide_select
-                if bpy.data.objects[obj.name].hide_viewport != obj.hide_viewport:
-                    bpy.data.objects[obj.name].hide_viewport = obj.hide_viewport
-                if bpy.data.objects[obj.name].hide_get() != obj.hide:
-                    bpy.data.objects[obj.name].hide_set(obj.hide)
-
-            else:
-                print("/!\\ "+obj.name+" not found in bpy.data.objects")
-
-        # Reset hide and select (bpy.data.collections)
-        for col in self.collections:
-            if col.name in bpy.data.collections:
-                if bpy.data.collections[col.name].hide_select != col.hide_select:
-                    bpy.data.collections[col.name].hide_select = col.hide_select
-                if bpy.data.collections[col.name].hide_viewport != col.hide_viewport:
-                    bpy.data.collections[col.name].hide_viewport = col.hide_viewport
-            else:
-                print("/!\\ "+col.name+" not found in bpy.data.collections")
-
-        # Reset hide in and viewport (collections from view_layers)
-
-        for vlayer in scene.view_layers:
-            layer_collections = getLayerCollectionsRecursive(vlayer.layer_collection)
-
-            def getLayerCollectionInList(name):
-                for layer_collection in layer_collections:
-                    if layer_collection.name == name:
-                        return layer_collection
-
-            for view_layer_collection in self.view_layer_collections:
-                if view_layer_collection.vlayer_name in scene.view_layers:
-
-                    layer_collection = getLayerCollectionInList(view_layer_collection.name)
-
-                    if layer_collection:
-                        if layer_collection.exclude != view_layer_collection.exclude:
-                            layer_collection.exclude = view_layer_collection.exclude
-                        if layer_collection.hide_viewport != view_layer_collection.hide_viewport:
-                            layer_collection.hide_viewport = view_layer_collection.hide_viewport
+        # Reset hide, select and exclude
+        self.journal.Rollback()
 
 
 class UserArmatureDataSave():
@@ -169,6 +169,23 @@ class BFU_AP_AddonPreferences(bpy.types.AddonPreferences):
         default=True,
         )
 
+    cameraTrackFormat: EnumProperty(
+        name=(ti('camera_track_format_name')),
+        description=(tt('camera_track_format_desc')),
+        items=[
+            ("per_frame",
+                ti('camera_track_format_per_frame_name'),
+                tt('camera_track_format_per_frame_desc'),
+                "KEYFRAME",
+                1),
+            ("columnar",
+                ti('camera_track_format_columnar_name'),
+                tt('camera_track_format_columnar_desc'),
+                "LINENUMBERS_ON",
+                2),
+            ]
+        )
+
     ignoreNLAForAction: BoolProperty(
         name=(ti('ignore_nla_for_action_name')),
         description=(tt('ignore_nla_for_action_desc')),
@@ -199,6 +216,45 @@ class BFU_AP_AddonPreferences(bpy.types.AddonPreferences):
         default=True,
         )
 
+    exportWorkerCount: IntProperty(
+        name=(ti('export_worker_count_name')),
+        description=(tt('export_worker_count_desc')),
+        default=1,
+        min=1,
+        max=64,
+        )
+
+    exportWorkerTimeout: IntProperty(
+        name=(ti('export_worker_timeout_name')),
+        description=(tt('export_worker_timeout_desc')),
+        default=60,
+        min=0,
+        )
+
+    exportActionsInBatch: BoolProperty(
+        name=(ti('export_actions_in_batch_name')),
+        description=(tt('export_actions_in_batch_desc')),
+        default=False,
+        )
+
+    exportLodChain: BoolProperty(
+        name=(ti('export_lod_chain_name')),
+        description=(tt('export_lod_chain_desc')),
+        default=False,
+        )
+
+    exportProfiling: BoolProperty(
+        name=(ti('export_profiling_name')),
+        description=(tt('export_profiling_desc')),
+        default=False,
+        )
+
+    exportProfilingMemory: BoolProperty(
+        name=(ti('export_profiling_memory_name')),
+        description=(tt('export_profiling_memory_desc')),
+        default=False,
+        )
+
     collisionColor:  FloatVectorProperty(
         name=ti('collision_color_name'),
         description='Color of the collision in Blender',
@@ -268,14 +324,23 @@ class BFU_AP_AddonPreferences(bpy.types.AddonPreferences):
         camera.label(text='CAMERA')
         camera.prop(self, "exportCameraAsFBX")
         camera.prop(self, "bakeOnlyKeyVisibleInCut")
+        camera.prop(self, "cameraTrackFormat")
 
         data = ColumnRight.box()
         data.label(text='DATA')
         data.prop(self, "ignoreNLAForAction")
         data.prop(self, "bakeArmatureAction")
+        data.prop(self, "exportActionsInBatch")
+        data.prop(self, "exportLodChain")
         data.prop(self, "exportWithCustomProps")
         data.prop(self, "exportWithMetaData")
         data.prop(self, "revertExportPath")
+        data.prop(self, "exportWorkerCount")
+        if self.exportWorkerCount > 1:
+            data.prop(self, "exportWorkerTimeout")
+        data.prop(self, "exportProfiling")
+        if self.exportProfiling:
+            data.prop(self, "exportProfilingMemory")
 
         other = ColumnRight.box()
         other.label(text='OTHER')
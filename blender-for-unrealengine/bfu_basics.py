@@ -45,6 +45,10 @@ def CheckPluginIsActivated(PluginName):
 
 def MoveToGlobalView():
     local_view_areas = []
+    if bpy.context.screen is None:
+        # Background mode (Export workers)
+        return local_view_areas
+
     for area in bpy.context.screen.areas:
         if area.type == 'VIEW_3D':
             space = area.spaces[0]
@@ -107,7 +111,7 @@ def SetCurrentSelection(selection):
     bpy.ops.object.select_all(action='DESELECT')
     for x, obj in enumerate(selection.selected_objects):
         if not is_deleted(obj):
-            if obj.name in bpy.context.window.view_layer.objects:
+            if obj.name in bpy.context.view_layer.objects:
                 obj.select_set(True)
 
     if selection.active:
@@ -122,7 +126,7 @@ def SetCurrentSelection(selection):
 def SelectSpecificObject(obj):
 
     bpy.ops.object.select_all(action='DESELECT')
-    if obj.name in bpy.context.window.view_layer.objects:
+    if obj.name in bpy.context.view_layer.objects:
         obj.select_set(True)
     bpy.context.view_layer.objects.active = obj
 
@@ -211,6 +215,24 @@ def getFirstDeformBoneParent(bone):
     return bone
 
 
+def getFirstDeformBoneParents(armature):
+    # getFirstDeformBoneParent() for all the bones of the armature
+    # Each bone of the hierarchy is visited only once.
+    deform_parents = {}
+
+    def getDeformParent(bone):
+        if bone.name not in deform_parents:
+            if bone.parent is not None and bone.use_deform is not True:
+                deform_parents[bone.name] = getDeformParent(bone.parent)
+            else:
+                deform_parents[bone.name] = bone
+        return deform_parents[bone.name]
+
+    for bone in armature.bones:
+        getDeformParent(bone)
+    return deform_parents
+
+
 def SetCollectionUse(collection):
     # Set if collection is hide and selectable
     collection.hide_viewport = False
@@ -319,6 +341,19 @@ def GetIfActionIsAssociated(action, bone_names):
     return False
 
 
+def GetActionAssociatedBoneNames(action):
+    # Returns the names of the bones used by the action groups
+    bone_names = set()
+    for group in action.groups:
+        for fcurve in group.channels:
+            s = fcurve.data_path
+            start = s.find('["')
+            end = s.rfind('"]')
+            if start > 0 and end > 0:
+                bone_names.add(s[start+2:end])
+    return bone_names
+
+
 def GetSurfaceArea(obj):
     bm = bmesh.new()
     bm.from_mesh(obj.data)
@@ -24,6 +24,8 @@ import mathutils
 import math
 import time
 import sys
+import numpy
+import itertools
 
 if "bpy" in locals():
     import importlib
@@ -63,37 +65,71 @@ def UpdateNameHierarchy(list=None):
         objs = GetAllCollisionAndSocketsObj()
 
     UpdatedHierarchy = 0
-    for obj in objs:
-        if fnmatch.fnmatchcase(obj.name, "UBX*"):
-            UpdateUe4Name("Box", [obj])
-            UpdatedHierarchy += 1
-        if fnmatch.fnmatchcase(obj.name, "UCP*"):
-            UpdateUe4Name("Capsule", [obj])
-            UpdatedHierarchy += 1
-        if fnmatch.fnmatchcase(obj.name, "USP*"):
-            UpdateUe4Name("Sphere", [obj])
-            UpdatedHierarchy += 1
-        if fnmatch.fnmatchcase(obj.name, "UCX*"):
-            UpdateUe4Name("Convex", [obj])
-            UpdatedHierarchy += 1
-        if fnmatch.fnmatchcase(obj.name, "SOCKET*"):
-            UpdateUe4Name("Socket", [obj])
-            UpdatedHierarchy += 1
-        return UpdatedHierarchy
+    MyObjectNameIndex.Begin()
+    try:
+        for obj in objs:
+            if fnmatch.fnmatchcase(obj.name, "UBX*"):
+                UpdateUe4Name("Box", [obj])
+                UpdatedHierarchy += 1
+            if fnmatch.fnmatchcase(obj.name, "UCP*"):
+                UpdateUe4Name("Capsule", [obj])
+                UpdatedHierarchy += 1
+            if fnmatch.fnmatchcase(obj.name, "USP*"):
+                UpdateUe4Name("Sphere", [obj])
+                UpdatedHierarchy += 1
+            if fnmatch.fnmatchcase(obj.name, "UCX*"):
+                UpdateUe4Name("Convex", [obj])
+                UpdatedHierarchy += 1
+            if fnmatch.fnmatchcase(obj.name, "SOCKET*"):
+                UpdateUe4Name("Socket", [obj])
+                UpdatedHierarchy += 1
+    finally:
+        MyObjectNameIndex.End()
+    return UpdatedHierarchy
+
+
+def GetValidVertexGroupMask(Armature, Mesh):
+    # Vertex groups are valid when a bone use the same name
+    bone_names = set(bone.name for bone in Armature.data.bones)
+    return numpy.array(
+        [vertex_group.name in bone_names for vertex_group in Mesh.vertex_groups],
+        dtype=bool)
+
+
+def GetVertexWithZeroWeightIndices(Armature, Mesh):
+    # Returns the indices of the vertices with zero cumulative valid weight as numpy array
+    vertices = Mesh.data.vertices
+    valid_group_mask = GetValidVertexGroupMask(Armature, Mesh)
+
+    # bpy has no bulk access to the vertex group elements (no foreach_get),
+    # so they are read in one flat python pass straight into numpy arrays.
+    group_counts = numpy.fromiter(
+        (len(vertex.groups) for vertex in vertices),
+        dtype=numpy.int64,
+        count=len(vertices))
+    element_count = int(group_counts.sum())
+    if element_count == 0 or not valid_group_mask.any():
+        return numpy.arange(len(vertices))
+
+    elements = numpy.fromiter(
+        itertools.chain.from_iterable(
+            (group_elem.group, group_elem.weight)
+            for vertex in vertices for group_elem in vertex.groups),
+        dtype=numpy.float64,
+        count=element_count * 2).reshape(element_count, 2)
+    vertex_indices = numpy.repeat(numpy.arange(len(vertices)), group_counts)
+    valid = valid_group_mask[elements[:, 0].astype(numpy.int64)]
+
+    cumulate_weights = numpy.bincount(
+        vertex_indices[valid],
+        weights=elements[:, 1][valid],
+        minlength=len(vertices))
+    return numpy.flatnonzero(cumulate_weights == 0)
 
 
 def GetVertexWithZeroWeight(Armature, Mesh):
-    vertices = []
-    for vertex in Mesh.data.vertices:
-        cumulateWeight = 0
-        if len(vertex.groups) > 0:
-            for GroupElem in vertex.groups:
-                if (Mesh.vertex_groups[GroupElem.group].name in
-                        Armature.data.bones):
-                    cumulateWeight += GroupElem.weight
-        if cumulateWeight == 0:
-            vertices.append(vertex)
-    return vertices
+    vertices = Mesh.data.vertices
+    return [vertices[index] for index in GetVertexWithZeroWeightIndices(Armature, Mesh)]
 
 
 def ContainsArmatureModifier(obj):
@@ -113,432 +149,588 @@ def GetSkeletonMeshs(obj):
     return meshs
 
 
-def UpdateUnrealPotentialError():
-    # Find and reset list of all potential error in scene
-
+class PotentialErrorData():
+    # Python copy of a BFU_OT_UnrealPotentialError.
+    # Stored in the check cache and written in scene.potentialErrorList.
+
+    error_properties = [
+        "name",
+        "type",
+        "selectObjectButton",
+        "selectVertexButton",
+        "selectPoseBoneButton",
+        "selectOption",
+        "itemName",
+        "text",
+        "correctRef",
+        "correctlabel",
+        "correctDesc",
+        "docsOcticon",
+        ]
+
+    def __init__(self, check_order):
+        self.check_order = check_order
+        self.name = ""
+        self.type = 0
+        self.object_name = ""
+        self.selectObjectButton = True
+        self.selectVertexButton = False
+        self.selectPoseBoneButton = False
+        self.selectOption = "None"
+        self.itemName = "None"
+        self.text = "Unknown"
+        self.correctRef = "None"
+        self.correctlabel = "Fix it !"
+        self.correctDesc = "Correct target error"
+        self.docsOcticon = "None"
+
+    @property
+    def object(self):
+        # Stored by name because the cache can live longer than the object
+        if self.object_name:
+            return bpy.data.objects.get(self.object_name)
+        return None
+
+    @object.setter
+    def object(self, obj):
+        if obj is not None:
+            self.object_name = obj.name
+        else:
+            self.object_name = ""
+
+    def WriteError(self, PotentialErrors):
+        MyError = PotentialErrors.add()
+        for prop in self.error_properties:
+            setattr(MyError, prop, getattr(self, prop))
+        MyError.object = self.object
+        return MyError
+
+
+def AddPotentialError(errors, check_order):
+    MyError = PotentialErrorData(check_order)
+    errors.append(MyError)
+    return MyError
+
+
+class PotentialErrorCheckCache():
+
+    '''
+    Results of the potential error checks by object and by action.
+    The results are used again while the fingerprint of the checked data
+    don't change. The fingerprints use the depsgraph update counters of bfu_utils.
+    '''
+
+    def __init__(self):
+        self.object_results = {}
+        self.action_results = {}
+
+    def Clear(self):
+        self.object_results.clear()
+        self.action_results.clear()
+
+    def GetIDUpdateCount(self, id_data):
+        return MyIDUpdateCounter.GetIDUpdateCount(id_data)
+
+    def GetSingleObjectFingerprint(self, obj):
+        fingerprint = [
+            obj.name,
+            obj.type,
+            obj.parent.name if obj.parent else None,
+            obj.parent_type,
+            self.GetIDUpdateCount(obj),
+            self.GetIDUpdateCount(obj.data),
+            ]
+        if obj.type == "MESH":
+            fingerprint.append(self.GetIDUpdateCount(obj.data.shape_keys))
+        return tuple(fingerprint)
+
+    def GetObjectFingerprint(self, obj, is_collision):
+        # Skeletal mesh checks also use the children
+        fingerprint = [GetAssetType(obj), is_collision, self.GetSingleObjectFingerprint(obj)]
+        if GetAssetType(obj) == "SkeletalMesh":
+            for child in GetExportDesiredChilds(obj):
+                fingerprint.append(self.GetSingleObjectFingerprint(child))
+            if GetExportAsProxy(obj):
+                proxy_child = GetExportProxyChild(obj)
+                if proxy_child is not None:
+                    fingerprint.append(proxy_child.name)
+        return tuple(fingerprint)
+
+    def GetActionFingerprint(self, action):
+        return (self.GetIDUpdateCount(action), len(action.fcurves))
+
+    def GetResult(self, results, key, fingerprint):
+        result = results.get(key)
+        if result is not None and result[0] == fingerprint:
+            return result[1]
+        return None
+
+    def StoreResult(self, results, key, fingerprint, errors):
+        results[key] = (fingerprint, errors)
+
+
+MyPotentialErrorCheckCache = PotentialErrorCheckCache()
+
+
+def CheckUnitScale(errors):
+    # Check if the unit scale is equal to 0.01.
     addon_prefs = GetAddonPrefs()
-    PotentialErrors = bpy.context.scene.potentialErrorList
-    PotentialErrors.clear()
-
-    # prepares the data to avoid unnecessary loops
-    objToCheck = []
-    for Asset in GetFinalAssetToExport():
-        if Asset.obj in GetAllobjectsByExportType("export_recursive"):
-            if Asset.obj not in objToCheck:
-                objToCheck.append(Asset.obj)
-            for child in GetExportDesiredChilds(Asset.obj):
-                if child not in objToCheck:
-                    objToCheck.append(child)
-
-    MeshTypeToCheck = []
-    for obj in objToCheck:
-        if obj.type == 'MESH':
-            MeshTypeToCheck.append(obj)
-
-    MeshTypeWithoutCol = []  # is Mesh Type To Check Without Collision
-    for obj in MeshTypeToCheck:
-        if not CheckIsCollision(obj):
-            MeshTypeWithoutCol.append(obj)
-
-    def CheckUnitScale():
-        # Check if the unit scale is equal to 0.01.
-        if addon_prefs.notifyUnitScalePotentialError:
-            if not math.isclose(
-                    bpy.context.scene.unit_settings.scale_length,
-                    0.01,
-                    rel_tol=1e-5):
-                MyError = PotentialErrors.add()
-                MyError.name = bpy.context.scene.name
+    if addon_prefs.notifyUnitScalePotentialError:
+        if not math.isclose(
+                bpy.context.scene.unit_settings.scale_length,
+                0.01,
+                rel_tol=1e-5):
+            MyError = AddPotentialError(errors, 0)
+            MyError.name = bpy.context.scene.name
+            MyError.type = 1
+            MyError.text = (
+                'Scene "'+bpy.context.scene.name +
+                '" has a UnitScale egal to ' +
+                str(bpy.context.scene.unit_settings.scale_length))
+            MyError.text += (
+                '\nFor Unreal unit scale equal to 0.01 is recommended.')
+            MyError.text += (
+                '\n(You can disable this potential error in addon_prefs)')
+            MyError.object = None
+            MyError.correctRef = "SetUnrealUnit"
+            MyError.correctlabel = 'Set Unreal Unit'
+
+
+def CheckObjType(obj, errors):
+    # Check if objects use a non-recommended type
+    if (obj.type == "SURFACE" or
+            obj.type == "META" or
+            obj.type == "FONT"):
+        MyError = AddPotentialError(errors, 1)
+        MyError.name = obj.name
+        MyError.type = 1
+        MyError.text = (
+            'Object "'+obj.name +
+            '" is a '+obj.type +
+            '. The object of the type SURFACE,' +
+            ' META and FONT is not recommended.')
+        MyError.object = obj
+        MyError.correctRef = "ConvertToMesh"
+        MyError.correctlabel = 'Convert to mesh'
+
+
+def CheckShapeKeys(obj, errors):
+    if obj.data.shape_keys is not None:
+        # Check that no modifiers is destructive for the key shapes
+        if len(obj.data.shape_keys.key_blocks) > 0:
+            for modif in obj.modifiers:
+                if modif.type != "ARMATURE":
+                    MyError = AddPotentialError(errors, 2)
+                    MyError.name = obj.name
+                    MyError.type = 2
+                    MyError.object = obj
+                    MyError.itemName = modif.name
+                    MyError.text = (
+                        'In object "'+obj.name +
+                        '" the modifier '+modif.type +
+                        ' named "'+modif.name +
+                        '" can destroy shape keys.' +
+                        ' Please use only Armature modifier' +
+                        ' with shape keys.')
+                    MyError.correctRef = "RemoveModfier"
+                    MyError.correctlabel = 'Remove modifier'
+
+        # Check that the key shapes are not out of bounds for Unreal
+        for key in obj.data.shape_keys.key_blocks:
+            # Min
+            if key.slider_min < -5:
+                MyError = AddPotentialError(errors, 2)
+                MyError.name = obj.name
                 MyError.type = 1
+                MyError.object = obj
+                MyError.itemName = key.name
                 MyError.text = (
-                    'Scene "'+bpy.context.scene.name +
-                    '" has a UnitScale egal to ' +
-                    str(bpy.context.scene.unit_settings.scale_length))
-                MyError.text += (
-                    '\nFor Unreal unit scale equal to 0.01 is recommended.')
-                MyError.text += (
-                    '\n(You can disable this potential error in addon_prefs)')
-                MyError.object = None
-                MyError.correctRef = "SetUnrealUnit"
-                MyError.correctlabel = 'Set Unreal Unit'
-
-    def CheckObjType():
-        # Check if objects use a non-recommended type
-        for obj in objToCheck:
-            if (obj.type == "SURFACE" or
-                    obj.type == "META" or
-                    obj.type == "FONT"):
-                MyError = PotentialErrors.add()
+                    'In object "'+obj.name +
+                    '" the shape key "'+key.name +
+                    '" is out of bounds for Unreal.' +
+                    ' The min range of must not be inferior to -5.')
+                MyError.correctRef = "SetKeyRangeMin"
+                MyError.correctlabel = 'Set min range to -5'
+
+            # Max
+            if key.slider_max > 5:
+                MyError = AddPotentialError(errors, 2)
                 MyError.name = obj.name
                 MyError.type = 1
-                MyError.text = (
-                    'Object "'+obj.name +
-                    '" is a '+obj.type +
-                    '. The object of the type SURFACE,' +
-                    ' META and FONT is not recommended.')
                 MyError.object = obj
-                MyError.correctRef = "ConvertToMesh"
-                MyError.correctlabel = 'Convert to mesh'
-
-    def CheckShapeKeys():
-        for obj in MeshTypeToCheck:
-            if obj.data.shape_keys is not None:
-                # Check that no modifiers is destructive for the key shapes
-                if len(obj.data.shape_keys.key_blocks) > 0:
-                    for modif in obj.modifiers:
-                        if modif.type != "ARMATURE":
-                            MyError = PotentialErrors.add()
-                            MyError.name = obj.name
-                            MyError.type = 2
-                            MyError.object = obj
-                            MyError.itemName = modif.name
-                            MyError.text = (
-                                'In object "'+obj.name +
-                                '" the modifier '+modif.type +
-                                ' named "'+modif.name +
-                                '" can destroy shape keys.' +
-                                ' Please use only Armature modifier' +
-                                ' with shape keys.')
-                            MyError.correctRef = "RemoveModfier"
-                            MyError.correctlabel = 'Remove modifier'
-
-                # Check that the key shapes are not out of bounds for Unreal
-                for key in obj.data.shape_keys.key_blocks:
-                    # Min
-                    if key.slider_min < -5:
-                        MyError = PotentialErrors.add()
-                        MyError.name = obj.name
-                        MyError.type = 1
-                        MyError.object = obj
-                        MyError.itemName = key.name
-                        MyError.text = (
-                            'In object "'+obj.name +
-                            '" the shape key "'+key.name +
-                            '" is out of bounds for Unreal.' +
-                            ' The min range of must not be inferior to -5.')
-                        MyError.correctRef = "SetKeyRangeMin"
-                        MyError.correctlabel = 'Set min range to -5'
-
-                    # Max
-                    if key.slider_max > 5:
-                        MyError = PotentialErrors.add()
-                        MyError.name = obj.name
-                        MyError.type = 1
-                        MyError.object = obj
-                        MyError.itemName = key.name
-                        MyError.text = (
-                            'In object "'+obj.name +
-                            '" the shape key "'+key.name +
-                            '" is out of bounds for Unreal.' +
-                            ' The max range of must not be superior to 5.')
-                        MyError.correctRef = "SetKeyRangeMax"
-                        MyError.correctlabel = 'Set max range to -5'
-
-    def CheckUVMaps():
-        # Check that the objects have at least one UV map valid
-        for obj in MeshTypeWithoutCol:
-            if len(obj.data.uv_layers) < 1:
-                MyError = PotentialErrors.add()
+                MyError.itemName = key.name
+                MyError.text = (
+                    'In object "'+obj.name +
+                    '" the shape key "'+key.name +
+                    '" is out of bounds for Unreal.' +
+                    ' The max range of must not be superior to 5.')
+                MyError.correctRef = "SetKeyRangeMax"
+                MyError.correctlabel = 'Set max range to -5'
+
+
+def CheckUVMaps(obj, errors):
+    # Check that the objects have at least one UV map valid
+    if len(obj.data.uv_layers) < 1:
+        MyError = AddPotentialError(errors, 3)
+        MyError.name = obj.name
+        MyError.type = 1
+        MyError.text = (
+            'Object "'+obj.name +
+            '" does not have any UV Layer.')
+        MyError.object = obj
+        MyError.correctRef = "CreateUV"
+        MyError.correctlabel = 'Create Smart UV Project'
+
+
+def CheckBadStaicMeshExportedLikeSkeletalMesh(obj, errors):
+    # Check if the correct object is defined as exportable
+    for modif in obj.modifiers:
+        if modif.type == "ARMATURE":
+            if obj.ExportEnum == "export_recursive":
+                MyError = AddPotentialError(errors, 4)
                 MyError.name = obj.name
                 MyError.type = 1
                 MyError.text = (
-                    'Object "'+obj.name +
-                    '" does not have any UV Layer.')
+                    'In object "'+obj.name +
+                    '" the modifier '+modif.type +
+                    ' named "'+modif.name +
+                    '" will not be applied when exported' +
+                    ' with StaticMesh assets.\nNote: with armature' +
+                    ' if you want export objets as skeletal mesh you' +
+                    ' need set only the armature as' +
+                    ' export_recursive not the childs')
                 MyError.object = obj
-                MyError.correctRef = "CreateUV"
-                MyError.correctlabel = 'Create Smart UV Project'
 
-    def CheckBadStaicMeshExportedLikeSkeletalMesh():
-        # Check if the correct object is defined as exportable
-        for obj in MeshTypeToCheck:
-            for modif in obj.modifiers:
-                if modif.type == "ARMATURE":
-                    if obj.ExportEnum == "export_recursive":
-                        MyError = PotentialErrors.add()
-                        MyError.name = obj.name
-                        MyError.type = 1
-                        MyError.text = (
-                            'In object "'+obj.name +
-                            '" the modifier '+modif.type +
-                            ' named "'+modif.name +
-                            '" will not be applied when exported' +
-                            ' with StaticMesh assets.\nNote: with armature' +
-                            ' if you want export objets as skeletal mesh you' +
-                            ' need set only the armature as' +
-                            ' export_recursive not the childs')
-                        MyError.object = obj
-
-    def CheckArmatureScale():
-        # Check if the ARMATURE use the same value on all scale axes
-        for obj in objToCheck:
-            if GetAssetType(obj) == "SkeletalMesh":
-                if obj.scale.z != obj.scale.y or obj.scale.z != obj.scale.x:
-                    MyError = PotentialErrors.add()
-                    MyError.name = obj.name
-                    MyError.type = 2
-                    MyError.text = (
-                        'In object "'+obj.name +
-                        '" do not use the same value on all scale axes ')
-                    MyError.text += (
-                        '\nScale x:' +
-                        str(obj.scale.x)+' y:'+str(obj.scale.y) +
-                        ' z:'+str(obj.scale.z))
-                    MyError.object = obj
 
-    def CheckArmatureNumber():
-        # check Modifier or Constraint ARMATURE number = 1
-        for obj in objToCheck:
-            meshs = GetSkeletonMeshs(obj)
-            for mesh in meshs:
-                # Count
-                armature_modifiers = 0
-                armature_constraint = 0
-                for mod in mesh.modifiers:
-                    if mod.type == "ARMATURE":
-                        armature_modifiers += 1
-                for const in mesh.constraints:
-                    if const.type == "ARMATURE":
-                        armature_constraint += 1
-
-                # Check result > 1
-                if armature_modifiers + armature_constraint > 1:
-                    MyError = PotentialErrors.add()
-                    MyError.name = mesh.name
-                    MyError.type = 2
-                    MyError.text = (
-                        'In object "'+mesh.name + '" ' +
-                        str(armature_modifiers) + ' Armature modifier(s) and ' +
-                        str(armature_modifiers) + ' Armature constraint(s) was found. ' +
-                        ' Please use only one Armature modifier or one Armature constraint.')
-                    MyError.object = mesh
-
-                # Check result == 0
-                if armature_modifiers + armature_constraint == 0:
-                    MyError = PotentialErrors.add()
-                    MyError.name = mesh.name
-                    MyError.type = 2
-                    MyError.text = (
-                        'In object "'+mesh.name + '" ' +
-                        ' no Armature modifiers or constraints was found. ' +
-                        ' Please use only one Armature modifier or one Armature constraint.')
-                    MyError.object = mesh
-
-    def CheckArmatureModData():
-        # check the parameter of Modifier ARMATURE
-        for obj in MeshTypeToCheck:
-            for mod in obj.modifiers:
-                if mod.type == "ARMATURE":
-                    if mod.use_deform_preserve_volume:
-                        MyError = PotentialErrors.add()
-                        MyError.name = obj.name
-                        MyError.type = 2
-                        MyError.text = (
-                            'In object "'+obj.name +
-                            '" the modifier '+mod.type +
-                            ' named "'+mod.name +
-                            '". The parameter Preserve Volume' +
-                            ' must be set to False.')
-                        MyError.object = obj
-                        MyError.itemName = mod.name
-                        MyError.correctRef = "PreserveVolume"
-                        MyError.correctlabel = 'Set Preserve Volume to False'
-
-    def CheckArmatureConstData():
-        # check the parameter of constraint ARMATURE
-        for obj in MeshTypeToCheck:
-            for const in obj.constraints:
-                if const.type == "ARMATURE":
-                    pass
-                    # TO DO.
-
-    def CheckArmatureBoneData():
-        # check the parameter of the ARMATURE bones
-        for obj in objToCheck:
-            if GetAssetType(obj) == "SkeletalMesh":
-                for bone in obj.data.bones:
-                    if (not obj.exportDeformOnly or
-                            (bone.use_deform and obj.exportDeformOnly)):
-
-                        if bone.bbone_segments > 1:
-                            MyError = PotentialErrors.add()
-                            MyError.name = obj.name
-                            MyError.type = 1
-                            MyError.text = (
-                                'In object3 "'+obj.name +
-                                '" the bone named "'+bone.name +
-                                '". The parameter Bendy Bones / Segments' +
-                                ' must be set to 1.')
-                            MyError.text += (
-                                '\nBendy bones are not supported by' +
-                                ' Unreal Engine, so that better to disable' +
-                                ' it if you want the same animation preview' +
-                                ' in Unreal and blender.')
-                            MyError.object = obj
-                            MyError.itemName = bone.name
-                            MyError.selectPoseBoneButton = True
-                            MyError.correctRef = "BoneSegments"
-                            MyError.correctlabel = 'Set Bone Segments to 1'
-                            MyError.docsOcticon = 'bendy-bone'
-
-    def CheckArmatureValidChild():
-        # Check that skeleton also has a mesh to export
-
-        for obj in objToCheck:
-            export_as_proxy = GetExportAsProxy(obj)
-            if GetAssetType(obj) == "SkeletalMesh":
-                childs = GetExportDesiredChilds(obj)
-                validChild = 0
-                for child in childs:
-                    if child.type == "MESH":
-                        validChild += 1
-                if export_as_proxy:
-                    if GetExportProxyChild(obj) is not None:
-                        validChild += 1
-                if validChild < 1:
-                    MyError = PotentialErrors.add()
-                    MyError.name = obj.name
-                    MyError.type = 2
-                    MyError.text = (
-                        'Object "'+obj.name +
-                        '" is an Armature and does not have' +
-                        ' any valid children.')
-                    MyError.object = obj
+def CheckArmatureScale(obj, errors):
+    # Check if the ARMATURE use the same value on all scale axes
+    if obj.scale.z != obj.scale.y or obj.scale.z != obj.scale.x:
+        MyError = AddPotentialError(errors, 5)
+        MyError.name = obj.name
+        MyError.type = 2
+        MyError.text = (
+            'In object "'+obj.name +
+            '" do not use the same value on all scale axes ')
+        MyError.text += (
+            '\nScale x:' +
+            str(obj.scale.x)+' y:'+str(obj.scale.y) +
+            ' z:'+str(obj.scale.z))
+        MyError.object = obj
+
+
+def CheckArmatureNumber(obj, errors):
+    # check Modifier or Constraint ARMATURE number = 1
+    meshs = GetSkeletonMeshs(obj)
+    for mesh in meshs:
+        # Count
+        armature_modifiers = 0
+        armature_constraint = 0
+        for mod in mesh.modifiers:
+            if mod.type == "ARMATURE":
+                armature_modifiers += 1
+        for const in mesh.constraints:
+            if const.type == "ARMATURE":
+                armature_constraint += 1
+
+        # Check result > 1
+        if armature_modifiers + armature_constraint > 1:
+            MyError = AddPotentialError(errors, 6)
+            MyError.name = mesh.name
+            MyError.type = 2
+            MyError.text = (
+                'In object "'+mesh.name + '" ' +
+                str(armature_modifiers) + ' Armature modifier(s) and ' +
+                str(armature_modifiers) + ' Armature constraint(s) was found. ' +
+                ' Please use only one Armature modifier or one Armature constraint.')
+            MyError.object = mesh
+
+        # Check result == 0
+        if armature_modifiers + armature_constraint == 0:
+            MyError = AddPotentialError(errors, 6)
+            MyError.name = mesh.name
+            MyError.type = 2
+            MyError.text = (
+                'In object "'+mesh.name + '" ' +
+                ' no Armature modifiers or constraints was found. ' +
+                ' Please use only one Armature modifier or one Armature constraint.')
+            MyError.object = mesh
+
+
+def CheckArmatureModData(obj, errors):
+    # check the parameter of Modifier ARMATURE
+    for mod in obj.modifiers:
+        if mod.type == "ARMATURE":
+            if mod.use_deform_preserve_volume:
+                MyError = AddPotentialError(errors, 7)
+                MyError.name = obj.name
+                MyError.type = 2
+                MyError.text = (
+                    'In object "'+obj.name +
+                    '" the modifier '+mod.type +
+                    ' named "'+mod.name +
+                    '". The parameter Preserve Volume' +
+                    ' must be set to False.')
+                MyError.object = obj
+                MyError.itemName = mod.name
+                MyError.correctRef = "PreserveVolume"
+                MyError.correctlabel = 'Set Preserve Volume to False'
 
-    def CheckArmatureChildWithBoneParent():
-        # If you use Parent Bone to parent your mesh to your armature the import will fail.
-        for obj in objToCheck:
-            if GetAssetType(obj) == "SkeletalMesh":
-                childs = GetExportDesiredChilds(obj)
-                for child in childs:
-                    if child.type == "MESH":
-                        if child.parent_type == 'BONE':
-                            MyError = PotentialErrors.add()
-                            MyError.name = child.name
-                            MyError.type = 2
-                            MyError.text = (
-                                'Object "'+child.name +
-                                '" use Parent Bone to parent. ' +
-                                '\n If you use Parent Bone to parent your mesh to your armature the import will fail.')
-                            MyError.object = child
-                            MyError.docsOcticon = 'armature-child-with-bone-parent'
-
-    def CheckArmatureMultipleRoots():
-        # Check that skeleton have multiples roots
-        for obj in objToCheck:
-            if GetAssetType(obj) == "SkeletalMesh":
-                rootBones = GetArmatureRootBones(obj)
-
-                if len(rootBones) > 1:
-                    MyError = PotentialErrors.add()
-                    MyError.name = obj.name
+
+def CheckArmatureConstData(obj, errors):
+    # check the parameter of constraint ARMATURE
+    for const in obj.constraints:
+        if const.type == "ARMATURE":
+            pass
+            # TO DO.
+
+
+def CheckArmatureBoneData(obj, errors):
+    # check the parameter of the ARMATURE bones
+    for bone in obj.data.bones:
+        if (not obj.exportDeformOnly or
+                (bone.use_deform and obj.exportDeformOnly)):
+
+            if bone.bbone_segments > 1:
+                MyError = AddPotentialError(errors, 9)
+                MyError.name = obj.name
+                MyError.type = 1
+                MyError.text = (
+                    'In object3 "'+obj.name +
+                    '" the bone named "'+bone.name +
+                    '". The parameter Bendy Bones / Segments' +
+                    ' must be set to 1.')
+                MyError.text += (
+                    '\nBendy bones are not supported by' +
+                    ' Unreal Engine, so that better to disable' +
+                    ' it if you want the same animation preview' +
+                    ' in Unreal and blender.')
+                MyError.object = obj
+                MyError.itemName = bone.name
+                MyError.selectPoseBoneButton = True
+                MyError.correctRef = "BoneSegments"
+                MyError.correctlabel = 'Set Bone Segments to 1'
+                MyError.docsOcticon = 'bendy-bone'
+
+
+def CheckArmatureValidChild(obj, errors):
+    # Check that skeleton also has a mesh to export
+    export_as_proxy = GetExportAsProxy(obj)
+    childs = GetExportDesiredChilds(obj)
+    validChild = 0
+    for child in childs:
+        if child.type == "MESH":
+            validChild += 1
+    if export_as_proxy:
+        if GetExportProxyChild(obj) is not None:
+            validChild += 1
+    if validChild < 1:
+        MyError = AddPotentialError(errors, 10)
+        MyError.name = obj.name
+        MyError.type = 2
+        MyError.text = (
+            'Object "'+obj.name +
+            '" is an Armature and does not have' +
+            ' any valid children.')
+        MyError.object = obj
+
+
+def CheckArmatureMultipleRoots(obj, errors):
+    # Check that skeleton have multiples roots
+    rootBones = GetArmatureRootBones(obj)
+
+    if len(rootBones) > 1:
+        MyError = AddPotentialError(errors, 11)
+        MyError.name = obj.name
+        MyError.type = 1
+        MyError.text = (
+            'Object "'+obj.name +
+            '" have Multiple roots bones.' +
+            ' Unreal only support single root bone')
+        MyError.text += '\nA custom root bone will be added at the export.'
+        MyError.text += ' '+str(len(rootBones))+' root bones found: '
+        MyError.text += '\n'
+        for rootBone in rootBones:
+            MyError.text += rootBone.name+', '
+        MyError.object = obj
+
+
+def CheckArmatureChildWithBoneParent(obj, errors):
+    # If you use Parent Bone to parent your mesh to your armature the import will fail.
+    childs = GetExportDesiredChilds(obj)
+    for child in childs:
+        if child.type == "MESH":
+            if child.parent_type == 'BONE':
+                MyError = AddPotentialError(errors, 12)
+                MyError.name = child.name
+                MyError.type = 2
+                MyError.text = (
+                    'Object "'+child.name +
+                    '" use Parent Bone to parent. ' +
+                    '\n If you use Parent Bone to parent your mesh to your armature the import will fail.')
+                MyError.object = child
+                MyError.docsOcticon = 'armature-child-with-bone-parent'
+
+
+def CheckArmatureNoDeformBone(obj, errors):
+    # Check that skeleton have at less one deform bone
+    if obj.exportDeformOnly:
+        for bone in obj.data.bones:
+            if bone.use_deform:
+                return
+        MyError = AddPotentialError(errors, 13)
+        MyError.name = obj.name
+        MyError.type = 2
+        MyError.text = (
+            'Object "'+obj.name +
+            '" don\'t have any deform bones.' +
+            ' Unreal will import it like a StaticMesh.')
+        MyError.object = obj
+
+
+def CheckMarkerOverlay(errors):
+    # Check that there is no overlap with the Marker
+    usedFrame = set()
+    for marker in bpy.context.scene.timeline_markers:
+        if marker.frame in usedFrame:
+            MyError = AddPotentialError(errors, 14)
+            MyError.type = 2
+            MyError.text = (
+                'In the scene timeline the frame "' +
+                str(marker.frame)+'" contains overlaped Markers' +
+                '\n To avoid camera conflict in the generation' +
+                ' of sequencer you must use max one marker per frame.')
+        else:
+            usedFrame.add(marker.frame)
+
+
+def CheckVertexGroupWeight(obj, errors):
+    # Check that all vertex have a weight
+    meshs = GetSkeletonMeshs(obj)
+    for meshs in meshs:
+        if meshs.type == "MESH":
+            if ContainsArmatureModifier(meshs):
+                # Result data
+                VertexWithZeroWeight = GetVertexWithZeroWeightIndices(
+                    obj,
+                    meshs)
+                if len(VertexWithZeroWeight) > 0:
+                    MyError = AddPotentialError(errors, 15)
+                    MyError.name = meshs.name
                     MyError.type = 1
                     MyError.text = (
-                        'Object "'+obj.name +
-                        '" have Multiple roots bones.' +
-                        ' Unreal only support single root bone')
-                    MyError.text += '\nA custom root bone will be added at the export.'
-                    MyError.text += ' '+str(len(rootBones))+' root bones found: '
-                    MyError.text += '\n'
-                    for rootBone in rootBones:
-                        MyError.text += rootBone.name+', '
-                    MyError.object = obj
-
-    def CheckArmatureNoDeformBone():
-        # Check that skeleton have at less one deform bone
-        for obj in objToCheck:
-            if GetAssetType(obj) == "SkeletalMesh":
-                if obj.exportDeformOnly:
-                    for bone in obj.data.bones:
-                        if bone.use_deform:
-                            return
-                    MyError = PotentialErrors.add()
-                    MyError.name = obj.name
+                        'Object named "'+meshs.name +
+                        '" contains '+str(len(VertexWithZeroWeight)) +
+                        ' vertex with zero cumulative valid weight.')
+                    MyError.text += (
+                        '\nNote: Vertex groups must have' +
+                        ' a bone with the same name to be valid.')
+                    MyError.object = meshs
+                    MyError.selectVertexButton = True
+                    MyError.selectOption = "VertexWithZeroWeight"
+
+
+def CheckZeroScaleKeyframe(action, errors):
+    # Check that animations do not use a invalid value
+    for fcurve in action.fcurves:
+        if fcurve.data_path.split(".")[-1] == "scale":
+            for key in fcurve.keyframe_points:
+                xCurve, yCurve = key.co
+                if key.co[1] == 0:
+                    MyError = AddPotentialError(errors, 16)
                     MyError.type = 2
                     MyError.text = (
-                        'Object "'+obj.name +
-                        '" don\'t have any deform bones.' +
-                        ' Unreal will import it like a StaticMesh.')
-                    MyError.object = obj
+                        'In action "'+action.name +
+                        '" at frame '+str(key.co[0]) +
+                        ', the bone named "' +
+                        fcurve.data_path.split('"')[1] +
+                        '" has a zero value in scale' +
+                        ' transform. ' +
+                        'This is invalid in Unreal.')
+
+
+def CheckObjectPotentialErrors(obj, is_collision):
+    # Run all the checks that use this object
+    errors = []
+    CheckObjType(obj, errors)
+    if obj.type == 'MESH':
+        CheckShapeKeys(obj, errors)
+        if not is_collision:
+            CheckUVMaps(obj, errors)
+        CheckBadStaicMeshExportedLikeSkeletalMesh(obj, errors)
+        CheckArmatureModData(obj, errors)
+        CheckArmatureConstData(obj, errors)
+    if GetAssetType(obj) == "SkeletalMesh":
+        CheckArmatureScale(obj, errors)
+        CheckArmatureNumber(obj, errors)
+        CheckArmatureBoneData(obj, errors)
+        CheckArmatureValidChild(obj, errors)
+        CheckArmatureMultipleRoots(obj, errors)
+        CheckArmatureChildWithBoneParent(obj, errors)
+        CheckArmatureNoDeformBone(obj, errors)
+        CheckVertexGroupWeight(obj, errors)
+    return errors
+
+
+def UpdateUnrealPotentialError(dirty_only=False):
+    # Find and reset list of all potential error in scene
+    # With dirty_only the objects and actions that haven't changed since the last check use the cached result
 
-    def CheckMarkerOverlay():
-        # Check that there is no overlap with the Marker
-        usedFrame = []
-        for marker in bpy.context.scene.timeline_markers:
-            if marker.frame in usedFrame:
-                MyError = PotentialErrors.add()
-                MyError.type = 2
-                MyError.text = (
-                    'In the scene timeline the frame "' +
-                    str(marker.frame)+'" contains overlaped Markers' +
-                    '\n To avoid camera conflict in the generation' +
-                    ' of sequencer you must use max one marker per frame.')
-            else:
-                usedFrame.append(marker.frame)
-
-    def CheckVertexGroupWeight():
-        # Check that all vertex have a weight
-        for obj in objToCheck:
-            meshs = GetSkeletonMeshs(obj)
-            for meshs in meshs:
-                if meshs.type == "MESH":
-                    if ContainsArmatureModifier(meshs):
-                        # Result data
-                        VertexWithZeroWeight = GetVertexWithZeroWeight(
-                            obj,
-                            meshs)
-                        if len(VertexWithZeroWeight) > 0:
-                            MyError = PotentialErrors.add()
-                            MyError.name = meshs.name
-                            MyError.type = 1
-                            MyError.text = (
-                                'Object named "'+meshs.name +
-                                '" contains '+str(len(VertexWithZeroWeight)) +
-                                ' vertex with zero cumulative valid weight.')
-                            MyError.text += (
-                                '\nNote: Vertex groups must have' +
-                                ' a bone with the same name to be valid.')
-                            MyError.object = meshs
-                            MyError.selectVertexButton = True
-                            MyError.selectOption = "VertexWithZeroWeight"
-
-    def CheckZeroScaleKeyframe():
-        # Check that animations do not use a invalid value
-        for obj in objToCheck:
-            if GetAssetType(obj) == "SkeletalMesh":
-                for action in GetActionToExport(obj):
-                    for fcurve in action.fcurves:
-                        if fcurve.data_path.split(".")[-1] == "scale":
-                            for key in fcurve.keyframe_points:
-                                xCurve, yCurve = key.co
-                                if key.co[1] == 0:
-                                    MyError = PotentialErrors.add()
-                                    MyError.type = 2
-                                    MyError.text = (
-                                        'In action "'+action.name +
-                                        '" at frame '+str(key.co[0]) +
-                                        ', the bone named "' +
-                                        fcurve.data_path.split('"')[1] +
-                                        '" has a zero value in scale' +
-                                        ' transform. ' +
-                                        'This is invalid in Unreal.')
-
-    CheckUnitScale()
-    CheckObjType()
-    CheckShapeKeys()
-    CheckUVMaps()
-    CheckBadStaicMeshExportedLikeSkeletalMesh()
-    CheckArmatureScale()
-    CheckArmatureNumber()
-    CheckArmatureModData()
-    CheckArmatureConstData()
-    CheckArmatureBoneData()
-    CheckArmatureValidChild()
-    CheckArmatureMultipleRoots()
-    CheckArmatureChildWithBoneParent()
-    CheckArmatureNoDeformBone()
-    CheckMarkerOverlay()
-    CheckVertexGroupWeight()
-    CheckZeroScaleKeyframe()
+    PotentialErrors = bpy.context.scene.potentialErrorList
+    PotentialErrors.clear()
+
+    cache = MyPotentialErrorCheckCache
+    if not dirty_only:
+        cache.object_results.clear()
+        cache.action_results.clear()
+
+    # prepares the data to avoid unnecessary loops
+    recursive_objs = set(GetAllobjectsByExportType("export_recursive"))
+    objToCheck = []
+    objToCheckSet = set()
+    for Asset in GetFinalAssetToExport():
+        if Asset.obj in recursive_objs:
+            for obj in [Asset.obj] + GetExportDesiredChilds(Asset.obj):
+                if obj not in objToCheckSet:
+                    objToCheck.append(obj)
+                    objToCheckSet.add(obj)
+
+    collision_objs = set(GetAllCollisionObj())
+
+    # List of (owner order, errors)
+    results = []
+
+    scene_errors = []
+    CheckUnitScale(scene_errors)
+    CheckMarkerOverlay(scene_errors)
+    results.append((0, scene_errors))
+
+    for x, obj in enumerate(objToCheck):
+        is_collision = obj in collision_objs
+        fingerprint = cache.GetObjectFingerprint(obj, is_collision)
+        errors = cache.GetResult(cache.object_results, obj.name, fingerprint)
+        if errors is None:
+            errors = CheckObjectPotentialErrors(obj, is_collision)
+            cache.StoreResult(cache.object_results, obj.name, fingerprint, errors)
+        results.append((x, errors))
+
+        if GetAssetType(obj) == "SkeletalMesh":
+            for action in GetActionToExport(obj):
+                fingerprint = cache.GetActionFingerprint(action)
+                errors = cache.GetResult(cache.action_results, action.name, fingerprint)
+                if errors is None:
+                    errors = []
+                    CheckZeroScaleKeyframe(action, errors)
+                    cache.StoreResult(cache.action_results, action.name, fingerprint, errors)
+                results.append((x, errors))
+
+    # Same order as the checks
+    all_errors = []
+    for owner_order, errors in results:
+        for error in errors:
+            all_errors.append((error.check_order, owner_order, error))
+    all_errors.sort(key=lambda item: (item[0], item[1]))
+    for check_order, owner_order, error in all_errors:
+        error.WriteError(PotentialErrors)
 
     return PotentialErrors
 
@@ -579,8 +771,12 @@ def SelectPotentialErrorVertex(errorIndex):
 
     bbpl.utils.SafeModeSet('OBJECT')
     if error.selectOption == "VertexWithZeroWeight":
-        for vertex in GetVertexWithZeroWeight(obj.parent, obj):
-            vertex.select = True
+        # Add to the current selection like vertex.select = True (hidden vertices are not deselected)
+        vertices = obj.data.vertices
+        select = numpy.empty(len(vertices), dtype=bool)
+        vertices.foreach_get("select", select)
+        select[GetVertexWithZeroWeightIndices(obj.parent, obj)] = True
+        vertices.foreach_set("select", select)
     bbpl.utils.SafeModeSet('EDIT')
     bpy.ops.view3d.view_selected()
     return obj
@@ -32,6 +32,7 @@ class BFU_OT_UnrealExportedAsset(bpy.types.PropertyGroup):
     export_start_time: bpy.props.FloatProperty(default=0)
     export_end_time: bpy.props.FloatProperty(default=0)
     export_success: bpy.props.BoolProperty(default=False)
+    export_skipped: bpy.props.BoolProperty(default=False)  # Unchanged since the last incremental export
 
     def StartAssetExport(self, obj=None, action=None, collection=None):
 
@@ -2490,7 +2490,7 @@ class BFU_PT_Export(bpy.types.Panel):
         def execute(self, context):
             correctedProperty = bfu_check_potential_error.CorrectBadProperty()
             bfu_check_potential_error.UpdateNameHierarchy()
-            bfu_check_potential_error.UpdateUnrealPotentialError()
+            bfu_check_potential_error.UpdateUnrealPotentialError(context.scene.bfu_check_dirty_only)
             bpy.ops.object.openpotentialerror("INVOKE_DEFAULT", correctedProperty=correctedProperty)
             return {'FINISHED'}
 
@@ -2767,37 +2767,43 @@ class BFU_PT_Export(bpy.types.Panel):
     bpy.types.Scene.static_export = bpy.props.BoolProperty(
         name="StaticMesh(s)",
         description="Check mark to export StaticMesh(s)",
-        default=True
+        default=True,
+        update=InvalidateExportPlanCache
         )
 
     bpy.types.Scene.static_collection_export = bpy.props.BoolProperty(
         name="Collection(s) ",
         description="Check mark to export Collection(s)",
-        default=True
+        default=True,
+        update=InvalidateExportPlanCache
         )
 
     bpy.types.Scene.skeletal_export = bpy.props.BoolProperty(
         name="SkeletalMesh(s)",
         description="Check mark to export SkeletalMesh(s)",
-        default=True
+        default=True,
+        update=InvalidateExportPlanCache
         )
 
     bpy.types.Scene.anin_export = bpy.props.BoolProperty(
         name="Animation(s)",
         description="Check mark to export Animation(s)",
-        default=True
+        default=True,
+        update=InvalidateExportPlanCache
         )
 
     bpy.types.Scene.alembic_export = bpy.props.BoolProperty(
         name="Alembic animation(s)",
         description="Check mark to export Alembic animation(s)",
-        default=True
+        default=True,
+        update=InvalidateExportPlanCache
         )
 
     bpy.types.Scene.camera_export = bpy.props.BoolProperty(
         name="Camera(s)",
         description="Check mark to export Camera(s)",
-        default=True
+        default=True,
+        update=InvalidateExportPlanCache
         )
 
     # Additional file
@@ -2838,7 +2844,26 @@ class BFU_PT_Export(bpy.types.Panel):
             ],
         description=(
             "Choose what need be export from asset list."),
-        default="default"
+        default="default",
+        update=InvalidateExportPlanCache
+        )
+
+    bpy.types.Scene.bfu_check_dirty_only = bpy.props.BoolProperty(
+        name="Check dirty only",
+        description=(
+            "Check potential errors only on the objects and actions" +
+            " modified since the last check." +
+            " The others use the result of the last check"),
+        default=False
+        )
+
+    bpy.types.Scene.bfu_export_incremental = bpy.props.BoolProperty(
+        name="Incremental export",
+        description=(
+            "Skip the assets that haven't changed since the last export." +
+            " Fingerprints of the exported assets are saved" +
+            " in a manifest next to the export log"),
+        default=False
         )
 
     def draw(self, context):
@@ -2955,6 +2980,11 @@ class BFU_PT_Export(bpy.types.Panel):
             checkButton = layout.row(align=True)
             checkButton.operator("object.checkpotentialerror", icon='FILE_TICK')
             checkButton.operator("object.openpotentialerror", icon='LOOP_BACK', text="")
+            layout.prop(scene, 'bfu_check_dirty_only')
+
+            layout.prop(scene, 'bfu_export_incremental')
+            if scene.bfu_export_incremental and addon_prefs.revertExportPath:
+                layout.label(text="Incremental export keep the export folders (Revert export path is ignored).", icon='INFO')
 
             exportButton = layout.row()
             exportButton.scale_y = 2.0
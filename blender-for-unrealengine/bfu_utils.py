@@ -23,6 +23,8 @@ import mathutils
 import math
 import time
 import sys
+import bisect
+import numpy
 from . import bbpl
 
 from math import degrees, radians, tan
@@ -39,6 +41,8 @@ if "bpy" in locals():
 from . import bfu_write_text
 from . import bfu_basics
 from .bfu_basics import *
+from .export import bfu_export_profiler
+from .export.bfu_export_profiler import ProfileExport
 
 
 class SavedBones():
@@ -76,47 +80,22 @@ class MarkerSequence():
 
 
 class TimelineMarkerSequence():
+    # Frame intervals of the timeline markers, sorted by start frame.
+    # A marker owns the frames until the next marker or the scene end.
 
     def __init__(self):
         scene = bpy.context.scene
         timeline = scene.timeline_markers
         self.marker_sequences = self.GetMarkerSequences(timeline)
+        self.marker_starts = [marker_sequence.start for marker_sequence in self.marker_sequences]
 
     def GetMarkerSequences(self, timeline_markers):
         if len(timeline_markers) == 0:
             print("Scene has no timeline_markers.")
             return []
 
-        def GetFisrtMarket(marker_list):
-            if len(marker_list) == 0:
-                return None
-
-            best_marker = ""
-            best_marker_frame = 0
-            init = False
-
-            for marker in marker_list:
-
-                if init:
-                    if marker.frame < best_marker_frame:
-                        best_marker = marker
-                        best_marker_frame = marker.frame
-                else:
-                    best_marker = marker
-                    best_marker_frame = marker.frame
-                    init = True
-
-            return best_marker
-
-        marker_list = []
-        for marker in timeline_markers:
-            marker_list.append(marker)
-
-        order_marker_list = []
-        while len(marker_list) != 0:
-            first_marker = GetFisrtMarket(marker_list)
-            order_marker_list.append(first_marker)
-            marker_list.remove(first_marker)
+        # Stable sort, markers on the same frame keep the timeline order
+        order_marker_list = sorted(timeline_markers, key=lambda marker: marker.frame)
 
         marker_sequences = []
 
@@ -132,13 +111,26 @@ class TimelineMarkerSequence():
         return marker_sequences
 
     def GetMarkerSequenceAtFrame(self, frame):
-        if self.marker_sequences:
-            for marker_sequence in self.marker_sequences:
-                # print(marker_sequence.start, marker_sequence.end, frame)
-                if frame >= marker_sequence.start and frame <= marker_sequence.end:
-                    return marker_sequence
+        # Last sequence that start before the frame
+        index = bisect.bisect_right(self.marker_starts, frame) - 1
+        if index < 0:
+            return None
+        marker_sequence = self.marker_sequences[index]
+        if frame <= marker_sequence.end:
+            return marker_sequence
         return None
 
+    def GetCameraFrames(self, camera, frame_start, frame_end):
+        # Frames between frame_start and frame_end (included) owned by a marker of the camera
+        frames = []
+        for marker_sequence in self.marker_sequences:
+            if marker_sequence.marker.camera != camera:
+                continue
+            start = max(marker_sequence.start, frame_start)
+            end = min(marker_sequence.end, frame_end)
+            frames.extend(range(start, end+1))
+        return frames
+
 
 class CounterTimer():
 
@@ -266,7 +258,7 @@ def GetExportDesiredChilds(obj):
     DesiredObj = []
     for child in GetRecursiveChilds(obj):
         if child.ExportEnum != "dont_export":
-            if child.name in bpy.context.window.view_layer.objects:
+            if child.name in bpy.context.view_layer.objects:
                 DesiredObj.append(child)
 
     return DesiredObj
@@ -298,23 +290,46 @@ def GetSkeletalMeshSockets(obj):
     data['Sockets'] = []
     # config.set('Sockets', '; SocketName, BoneName, Location, Rotation, Scale')
 
+    # Reset the pose of each armature once, the sockets use the rest pose
+    armatures = []
+    for socket in sockets:
+        if socket.parent not in armatures:
+            armatures.append(socket.parent)
+    for armature in armatures:
+        ResetArmaturePose(armature)
+    if len(armatures) > 0:
+        bpy.context.view_layer.update()
+
+    deform_parents = {}  # Armature name: bone name: first deform bone parent
+    for armature in armatures:
+        if armature.exportDeformOnly:
+            deform_parents[armature.name] = getFirstDeformBoneParents(armature.data)
+
+    # Inverted bone and armature matrix, shared by the sockets of the same bone
+    bone_space_matrices = {}
+
+    def GetBoneSpaceMatrix(armature, bone):
+        key = (armature.name, bone.name)
+        if key not in bone_space_matrices:
+            bml = bone.matrix_local  # Bone
+            am = armature.matrix_world  # Armature
+            bone_space_matrices[key] = bml.inverted() @ am.inverted()
+        return bone_space_matrices[key]
+
     for i, socket in enumerate(sockets):
         if IsASocket(socket):
             SocketName = socket.name[7:]
         else:
-            socket.name
+            SocketName = socket.name
 
         if socket.parent.exportDeformOnly:
-            b = getFirstDeformBoneParent(socket.parent.data.bones[socket.parent_bone])
+            b = deform_parents[socket.parent.name][socket.parent_bone]
         else:
             b = socket.parent.data.bones[socket.parent_bone]
 
-        ResetArmaturePose(socket.parent)
         # GetRelativePostion
-        bml = b.matrix_local  # Bone
-        am = socket.parent.matrix_world  # Armature
         em = socket.matrix_world  # Socket
-        RelativeMatrix = (bml.inverted() @ am.inverted() @ em)
+        RelativeMatrix = GetBoneSpaceMatrix(socket.parent, b) @ em
         t = RelativeMatrix.to_translation()
         r = RelativeMatrix.to_euler()
         s = socket.scale*addon_prefs.skeletalSocketsImportedSize
@@ -335,6 +350,15 @@ def GetSkeletalMeshSockets(obj):
     return data['Sockets']
 
 
+def GetObjLods(obj):
+    # Returns [(lod number, lod object)] of the level of details used by the object
+    lods = []
+    for lod_number, lod in enumerate([obj.Ue4Lod1, obj.Ue4Lod2, obj.Ue4Lod3, obj.Ue4Lod4, obj.Ue4Lod5], 1):
+        if lod is not None:
+            lods.append((lod_number, lod))
+    return lods
+
+
 def GetSubObjectDesiredChild(targetObj):
     sub_objects = []
     for obj in GetExportDesiredChilds(targetObj):
@@ -413,70 +437,257 @@ def GetCollectionToExport(scene):
     return colExport
 
 
+def GetAssetCollection(asset):
+    # Collection of a "Collection StaticMesh" asset, GetFinalAssetToExport() use the collection name
+    if isinstance(asset.obj, str):
+        return bpy.data.collections[asset.obj]
+    return asset.obj
+
+
 class CachedAction():
 
     '''
     I can't use bpy.types.Scene or bpy.types.Object Property.
     "Writing to ID classes in this context is not allowed"
     So I use simple python var
+
+    Index of the bones used by each action.
+    Actions are only parsed again when they change
+    and an armature gets its actions from the index of its bones.
     '''
 
     class ActionFromCache():
         # Info about actions from last cache.
         def __init__(self, action):
-            self.total_action_fcurves_len = len(action.fcurves)
+            self.signature = self.GetSignature(action)
+            self.bone_names = frozenset(GetActionAssociatedBoneNames(action))
+
+        @staticmethod
+        def GetSignature(action):
+            # Group names are the bone names for armature actions
+            return (
+                len(action.fcurves),
+                hash(tuple(group.name for group in action.groups))
+                )
 
     def __init__(self):
-        self.name = ""
-        self.is_cached = False
-        self.stored_actions = []
-        self.total_actions = []
-        self.total_rig_bone_len = 0
-
-    def CheckCache(self, obj):
-        # Check if the cache need update
-        if self.name != obj.name:
-            self.is_cached = False
-        if len(bpy.data.actions) != len(self.total_actions):
-            self.is_cached = False
-        if len(obj.data.bones) != self.total_rig_bone_len:
-            self.is_cached = False
-        for action_name in self.stored_actions:
-            if action_name not in bpy.data.actions:
-                self.is_cached = False
-
-        return self.is_cached
-
-    def StoreActions(self, obj, actions):
-        # Update new cache
-        self.name = obj.name
-        action_name_list = []
-        for action in actions:
-            action_name_list.append(action.name)
-        self.stored_actions = action_name_list
-        self.total_actions.clear()
+        self.actions = {}  # Action name: ActionFromCache
+        self.bone_actions = {}  # Bone name: set of action names
+        self.stored_actions = {}  # Armature name: (index version, bones, action names)
+        self.index_version = 0
+
+    def AddActionToIndex(self, action_name, action_info):
+        self.actions[action_name] = action_info
+        for bone_name in action_info.bone_names:
+            self.bone_actions.setdefault(bone_name, set()).add(action_name)
+
+    def RemoveActionFromIndex(self, action_name):
+        action_info = self.actions.pop(action_name)
+        for bone_name in action_info.bone_names:
+            bone_action_names = self.bone_actions.get(bone_name)
+            if bone_action_names is not None:
+                bone_action_names.discard(action_name)
+                if len(bone_action_names) == 0:
+                    del self.bone_actions[bone_name]
+
+    def UpdateIndex(self):
+        # Parse only the new and modified actions
+        changed = False
+        local_action_names = set()
         for action in bpy.data.actions:
-            self.total_actions.append(self.ActionFromCache(action))
-        self.total_rig_bone_len = len(obj.data.bones)
-        self.is_cached = True
-        # print("Stored action cache updated.")
-
-    def GetStoredActions(self):
+            if action.library is not None:
+                continue
+            local_action_names.add(action.name)
+            action_info = self.actions.get(action.name)
+            if action_info is not None:
+                if action_info.signature == self.ActionFromCache.GetSignature(action):
+                    continue
+                self.RemoveActionFromIndex(action.name)
+            self.AddActionToIndex(action.name, self.ActionFromCache(action))
+            changed = True
+
+        for action_name in list(self.actions.keys()):
+            if action_name not in local_action_names:
+                self.RemoveActionFromIndex(action_name)
+                changed = True
+
+        if changed:
+            self.index_version += 1
+
+    def GetActions(self, obj):
+        self.UpdateIndex()
+
+        bone_names = frozenset(bone.name for bone in obj.data.bones)
+        stored = self.stored_actions.get(obj.name)
+        if stored is not None:
+            if stored[0] == self.index_version and stored[1] == bone_names:
+                return self.GetStoredActions(stored[2])
+
+        action_names = set()
+        for bone_name in bone_names.intersection(self.bone_actions.keys()):
+            action_names.update(self.bone_actions[bone_name])
+
+        # Keep the bpy.data.actions order
+        sorted_action_names = [
+            action.name for action in bpy.data.actions
+            if action.library is None and action.name in action_names
+            ]
+        self.stored_actions[obj.name] = (self.index_version, bone_names, sorted_action_names)
+        return self.GetStoredActions(sorted_action_names)
+
+    def GetStoredActions(self, action_names):
         actions = []
-        for action_name in self.stored_actions:
+        for action_name in action_names:
             if action_name in bpy.data.actions:
                 actions.append(bpy.data.actions[action_name])
         return actions
 
     def Clear(self):
-        pass
+        self.actions.clear()
+        self.bone_actions.clear()
+        self.stored_actions.clear()
+        self.index_version += 1
 
 
 MyCachedActions = CachedAction()
 
 
+class IDUpdateCounter():
+
+    '''
+    Counts the depsgraph updates of each ID.
+    Caches use the counts to know if their data are still valid.
+    The generation changes after undo and load because the IDs are recreated.
+    '''
+
+    def __init__(self):
+        self.generation = 0
+        self.counters = {}
+
+    @staticmethod
+    def GetIDKey(id_data):
+        return (id_data.rna_type.identifier, id_data.name)
+
+    def TagIDUpdate(self, id_data):
+        key = self.GetIDKey(id_data)
+        self.counters[key] = self.counters.get(key, 0) + 1
+
+    def NewGeneration(self):
+        self.generation += 1
+        self.counters.clear()
+
+    def GetIDUpdateCount(self, id_data):
+        if id_data is None:
+            return None
+        return (id_data.name, self.generation, self.counters.get(self.GetIDKey(id_data), 0))
+
+
+MyIDUpdateCounter = IDUpdateCounter()
+
+
+@bpy.app.handlers.persistent
+def IDUpdateCounterHandler(scene, depsgraph=None):
+    if depsgraph is None:
+        return
+    for update in depsgraph.updates:
+        MyIDUpdateCounter.TagIDUpdate(update.id.original)
+
+
+@bpy.app.handlers.persistent
+def IDUpdateCounterResetHandler(*args):
+    MyIDUpdateCounter.NewGeneration()
+
+
+id_update_counter_reset_handlers = (
+    bpy.app.handlers.undo_post,
+    bpy.app.handlers.redo_post,
+    bpy.app.handlers.load_post,
+)
+
+
+class ExportPlanCache():
+
+    '''
+    Cached result of GetFinalAssetToExport() and GetActionToExport()
+    used by the UI, the potential error check and the export.
+    Invalidated by the depsgraph, undo and load handlers and
+    by the update of the export properties.
+    '''
+
+    def __init__(self):
+        self.is_valid = False
+        self.validation_key = None
+        self.final_assets = None
+        self.object_actions = {}
+
+    def Invalidate(self):
+        self.is_valid = False
+
+    def GetValidationKey(self):
+        # Cheap check for changes not notified by the handlers
+        scene = bpy.context.scene
+        key = [
+            scene.name,
+            len(bpy.data.objects),
+            len(bpy.data.actions),
+            len(bpy.data.collections),
+            scene.bfu_export_selection_filter,
+            scene.static_export,
+            scene.static_collection_export,
+            scene.skeletal_export,
+            scene.anin_export,
+            scene.alembic_export,
+            scene.camera_export,
+        ]
+        if scene.bfu_export_selection_filter != "default":
+            key.append(tuple(obj.name for obj in bpy.context.selected_objects))
+        return tuple(key)
+
+    def CheckCache(self):
+        validation_key = self.GetValidationKey()
+        if not self.is_valid or self.validation_key != validation_key:
+            self.final_assets = None
+            self.object_actions.clear()
+            self.validation_key = validation_key
+            self.is_valid = True
+
+    def GetFinalAssetToExport(self):
+        self.CheckCache()
+        if self.final_assets is None:
+            self.final_assets = ComputeFinalAssetToExport()
+        return list(self.final_assets)
+
+    def GetActionToExport(self, obj):
+        self.CheckCache()
+        if obj.name not in self.object_actions:
+            self.object_actions[obj.name] = ComputeActionToExport(obj)
+        return list(self.object_actions[obj.name])
+
+
+MyExportPlanCache = ExportPlanCache()
+
+
+def InvalidateExportPlanCache(self=None, context=None):
+    # Can be used as property update function
+    MyExportPlanCache.Invalidate()
+
+
+@bpy.app.handlers.persistent
+def ExportPlanCacheHandler(*args):
+    MyExportPlanCache.Invalidate()
+
+
+export_plan_cache_handlers = (
+    bpy.app.handlers.depsgraph_update_post,
+    bpy.app.handlers.undo_post,
+    bpy.app.handlers.redo_post,
+    bpy.app.handlers.load_post,
+)
+
+
 def UpdateActionCache(obj):
     # Force update cache export auto action list
+    MyExportPlanCache.Invalidate()
     return GetCachedExportAutoActionList(obj, True)
 
 
@@ -484,30 +695,21 @@ def GetCachedExportAutoActionList(obj, force_update_cache=False):
     # This will cheak if the action contains
     # the same bones of the armature
 
-    actions = []
-
     # Use the cache
     if force_update_cache:
-        MyCachedActions.is_cached = False
-
-    if MyCachedActions.CheckCache(obj):
-        actions = MyCachedActions.GetStoredActions()
-
-    else:
         MyCachedActions.Clear()
 
-        objBoneNames = [bone.name for bone in obj.data.bones]
-        for action in bpy.data.actions:
-            if action.library is None:
-                if GetIfActionIsAssociated(action, objBoneNames):
-                    actions.append(action)
-        # Update the cache
-        MyCachedActions.StoreActions(obj, actions)
-    return actions
+    return MyCachedActions.GetActions(obj)
 
 
-def GetActionToExport(obj):
+def GetActionToExport(obj, use_cache=True):
     # Returns only the actions that will be exported with the Armature
+    if use_cache:
+        return MyExportPlanCache.GetActionToExport(obj)
+    return ComputeActionToExport(obj)
+
+
+def ComputeActionToExport(obj):
 
     if obj.ExportAsLod:
         return []
@@ -636,47 +838,141 @@ def GetUseCustomLightMapResolution(obj):
     return True
 
 
-def GetExportRealSurfaceArea(obj):
-    scene = bpy.context.scene
+class SurfaceAreaCache():
+    # Computed surface areas by object name, with the fingerprint of the evaluated meshes
 
-    local_view_areas = MoveToGlobalView()
-    bbpl.utils.SafeModeSet('OBJECT')
+    def __init__(self):
+        self.areas = {}
 
-    SavedSelect = GetCurrentSelection()
-    SelectParentAndDesiredChilds(obj)
+    def GetArea(self, obj, fingerprint):
+        cached = self.areas.get(obj.name)
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+        return None
 
-    bpy.ops.object.duplicate()
-    bpy.ops.object.duplicates_make_real(
-        use_base_parent=True,
-        use_hierarchy=True
-        )
+    def StoreArea(self, obj, fingerprint, area):
+        self.areas[obj.name] = (fingerprint, area)
 
-    ApplyNeededModifierToSelect()
-    bpy.ops.object.parent_clear(type='CLEAR_KEEP_TRANSFORM')
-    for selectObj in bpy.context.selected_objects:
-        # Remove unable to convert mesh
-        if selectObj.type == "EMPTY" or selectObj.type == "CURVE":
-            CleanDeleteObjects([selectObj])
-
-    for selectObj in bpy.context.selected_objects:
-        # Remove collision box
-        if CheckIsCollision(selectObj):
-            CleanDeleteObjects([selectObj])
-
-    if bpy.context.view_layer.objects.active is None:
-        # When the active id a empty
-        bpy.context.view_layer.objects.active = bpy.context.selected_objects[0]
-    bpy.ops.object.convert(target='MESH')
-
-    active = bpy.context.view_layer.objects.active
-
-    CleanJoinSelect()
-    active = bpy.context.view_layer.objects.active
-    area = GetSurfaceArea(active)
-    CleanDeleteObjects(bpy.context.selected_objects)
-    SetCurrentSelection(SavedSelect)
-    MoveToLocalView(local_view_areas)
-    return area
+
+MySurfaceAreaCache = SurfaceAreaCache()
+
+
+def GetSurfaceAreaObjects(obj):
+    # Objects used for the surface area of obj, like in the export without collisions
+    objs = [obj] + GetExportDesiredChilds(obj)
+    if GetExportAsProxy(obj):
+        proxy_child = GetExportProxyChild(obj)
+        if proxy_child is not None:
+            objs.append(proxy_child)
+
+    collisions = set(GetAllCollisionObj())
+    surface_objs = []
+    for surface_obj in objs:
+        if surface_obj.name not in bpy.context.view_layer.objects:
+            continue
+        if surface_obj in collisions or surface_obj in surface_objs:
+            continue
+        surface_objs.append(surface_obj)
+    return surface_objs
+
+
+def GetSurfaceAreaFingerprint(obj, surface_objs):
+    inverted_matrix = obj.matrix_world.inverted()
+    fingerprint = []
+    for surface_obj in surface_objs:
+        relative_matrix = inverted_matrix @ surface_obj.matrix_world
+        fingerprint.append((
+            MyIDUpdateCounter.GetIDUpdateCount(surface_obj),
+            MyIDUpdateCounter.GetIDUpdateCount(surface_obj.data),
+            surface_obj.instance_collection.name if surface_obj.instance_collection else None,
+            tuple(tuple(row) for row in relative_matrix),
+            ))
+    return tuple(fingerprint)
+
+
+def GetEvaluatedMeshArea(eval_obj, matrix):
+    # Area of the evaluated object mesh transformed by matrix
+    # to_mesh() use a temporary mesh, no data-block is added in bpy.data
+    if eval_obj.type in ["EMPTY", "CURVE", "ARMATURE", "CAMERA", "LIGHT"]:
+        return 0.0
+    try:
+        mesh = eval_obj.to_mesh()
+    except RuntimeError:
+        return 0.0
+    if mesh is None:
+        return 0.0
+
+    mesh.calc_loop_triangles()
+    co = numpy.empty(len(mesh.vertices) * 3, dtype=numpy.float64)
+    mesh.vertices.foreach_get("co", co)
+    triangles = numpy.empty(len(mesh.loop_triangles) * 3, dtype=numpy.int64)
+    mesh.loop_triangles.foreach_get("vertices", triangles)
+    eval_obj.to_mesh_clear()
+
+    if len(triangles) == 0:
+        return 0.0
+
+    matrix = numpy.array(matrix, dtype=numpy.float64)
+    co = co.reshape(-1, 3) @ matrix[:3, :3].T + matrix[:3, 3]
+    corners = co[triangles].reshape(-1, 3, 3)
+    cross = numpy.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+    return float(numpy.linalg.norm(cross, axis=1).sum() * 0.5)
+
+
+def GetExportRealSurfaceAreas(objs, use_cache=True):
+    # Returns a dict with object name: surface area.
+    # The area is computed from the evaluated meshes of the depsgraph in the object space
+    # without duplicate, convert or join objects.
+
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    areas = {}
+    to_compute = []
+    for obj in objs:
+        surface_objs = GetSurfaceAreaObjects(obj)
+        fingerprint = GetSurfaceAreaFingerprint(obj, surface_objs)
+        area = MySurfaceAreaCache.GetArea(obj, fingerprint) if use_cache else None
+        if area is not None:
+            areas[obj.name] = area
+        else:
+            to_compute.append((obj, surface_objs, fingerprint))
+
+    if len(to_compute) == 0:
+        return areas
+
+    # Instances are read in a single pass on the depsgraph.
+    # The instance objects are only valid during the iteration, so their areas are computed in the loop.
+    instancer_owners = {}  # Instancer name: [(object name, inverted object matrix)]
+    for obj, surface_objs, fingerprint in to_compute:
+        inverted_matrix = obj.matrix_world.inverted()
+        for surface_obj in surface_objs:
+            if surface_obj.instance_type != "NONE":
+                instancer_owners.setdefault(surface_obj.name, []).append((obj.name, inverted_matrix))
+
+    collisions = set(obj.name for obj in GetAllCollisionObj())
+    instance_areas = {}  # Object name: area of the instances
+    if len(instancer_owners) > 0:
+        for instance in depsgraph.object_instances:
+            if instance.is_instance and instance.parent.original.name in instancer_owners:
+                if instance.object.original.name in collisions:
+                    continue
+                for owner_name, inverted_matrix in instancer_owners[instance.parent.original.name]:
+                    instance_area = GetEvaluatedMeshArea(instance.object, inverted_matrix @ instance.matrix_world)
+                    instance_areas[owner_name] = instance_areas.get(owner_name, 0.0) + instance_area
+
+    for obj, surface_objs, fingerprint in to_compute:
+        inverted_matrix = obj.matrix_world.inverted()
+        area = instance_areas.get(obj.name, 0.0)
+        for surface_obj in surface_objs:
+            eval_obj = surface_obj.evaluated_get(depsgraph)
+            area += GetEvaluatedMeshArea(eval_obj, inverted_matrix @ eval_obj.matrix_world)
+        MySurfaceAreaCache.StoreArea(obj, fingerprint, area)
+        areas[obj.name] = area
+
+    return areas
+
+
+def GetExportRealSurfaceArea(obj):
+    return GetExportRealSurfaceAreas([obj])[obj.name]
 
 
 def GetCompuntedLightMap(obj):
@@ -849,6 +1145,7 @@ def GoToMeshEditMode():
     return False
 
 
+@ProfileExport()
 def ApplyNeededModifierToSelect():
 
     SavedSelect = GetCurrentSelection()
@@ -869,89 +1166,105 @@ def ApplyNeededModifierToSelect():
     SetCurrentSelection(SavedSelect)
 
 
-def CorrectExtremeUV(stepScale=2):
-
-    def GetHaveConnectedLoop(faceTarget):
-        # In bmesh faces
-        for loop in faceTarget.loops:
-            uv = loop[uv_lay].uv
-            for face in bm.faces:
-                if face.select:
-                    if faceTarget != face:
-                        for loop in face.loops:
-                            if uv == loop[uv_lay].uv:
-                                return True
+def GetMeshUVIslands(mesh, uvs):
+    # Returns the island index of each face.
+    # Faces are in the same island when they share a vertex with the same UV coordinates.
+
+    loop_num = len(mesh.loops)
+    face_num = len(mesh.polygons)
+
+    loop_vertices = numpy.empty(loop_num, dtype=numpy.int64)
+    mesh.loops.foreach_get("vertex_index", loop_vertices)
+    loop_starts = numpy.empty(face_num, dtype=numpy.int64)
+    mesh.polygons.foreach_get("loop_start", loop_starts)
+    loop_totals = numpy.empty(face_num, dtype=numpy.int64)
+    mesh.polygons.foreach_get("loop_total", loop_totals)
+
+    # The loops of a face are contiguous
+    face_order = numpy.argsort(loop_starts)
+    loop_faces = numpy.repeat(face_order, loop_totals[face_order])
+
+    # Same vertex and same UV (+0.0 for merge -0.0 and 0.0)
+    uv_bits = (uvs.reshape(-1, 2) + 0.0).astype(numpy.float32).view(numpy.uint32).astype(numpy.int64)
+    loop_keys = numpy.column_stack((loop_vertices, uv_bits))
+    key_indices = numpy.unique(loop_keys, axis=0, return_inverse=True)[1].reshape(-1)
+
+    # Union-find on the faces that use the same key
+    sorted_loops = numpy.argsort(key_indices, kind="stable")
+    same_key = key_indices[sorted_loops[1:]] == key_indices[sorted_loops[:-1]]
+    face_links = numpy.column_stack((
+        loop_faces[sorted_loops[:-1]][same_key],
+        loop_faces[sorted_loops[1:]][same_key]))
+
+    parents = list(range(face_num))
+
+    def FindRoot(face):
+        root = face
+        while parents[root] != root:
+            root = parents[root]
+        while parents[face] != root:
+            parents[face], face = root, parents[face]
+        return root
+
+    for face_a, face_b in face_links.tolist():
+        root_a = FindRoot(face_a)
+        root_b = FindRoot(face_b)
+        if root_a != root_b:
+            parents[max(root_a, root_b)] = min(root_a, root_b)
+
+    islands = numpy.array([FindRoot(face) for face in range(face_num)], dtype=numpy.int64)
+    return islands, loop_faces, loop_starts, loop_totals
+
+
+def CorrectExtremeUVOnMesh(mesh, stepScale=2):
+    # Move each UV island near the center of the UV space by steps of stepScale.
+    # Work on the mesh data, the object must not be in edit mode.
+    uv_layer = mesh.uv_layers.active
+    if uv_layer is None or len(mesh.polygons) == 0:
         return False
 
-    def SelectRecursiveUVLinked(uv_lay):
-
-        AddedFaces = []
-        for v in [v for v in bm.verts if v.select]:
-            for f in v.link_faces:
-                if not f.select:
-                    if GetHaveConnectedLoop(f):
-                        AddedFaces.append(f)
-                        f.select = True
-
-        if len(AddedFaces) == 0:
-            return AddedFaces
-        else:
-            for addedFace in SelectRecursiveUVLinked(uv_lay):
-                AddedFaces.append(addedFace)
-            return AddedFaces
-
-    def GetAllIsland(bm, uv_lay):
-        ToCheakFace = []
-        Islands = []
-        for face in bm.faces:
-            ToCheakFace.append(face)
+    uvs = numpy.empty(len(mesh.loops) * 2, dtype=numpy.float32)
+    uv_layer.data.foreach_get("uv", uvs)
+    islands, loop_faces, loop_starts, loop_totals = GetMeshUVIslands(mesh, uvs)
 
-        while len(ToCheakFace) > 0:
-            for face in bm.faces:
-                face.select = False
+    # Use the last loop of the last face of each island as reference
+    island_last_faces = numpy.full(len(mesh.polygons), -1, dtype=numpy.int64)
+    numpy.maximum.at(island_last_faces, islands, numpy.arange(len(mesh.polygons)))
+    island_last_loops = loop_starts + loop_totals - 1
+    uvs = uvs.reshape(-1, 2)
 
-            ToCheakFace[-1].select = True
-            SelectRecursiveUVLinked(uv_lay)
+    island_offsets = numpy.zeros((len(mesh.polygons), 2), dtype=numpy.float64)
+    used_islands = numpy.flatnonzero(island_last_faces >= 0)
+    reference_uvs = uvs[island_last_loops[island_last_faces[used_islands]]].astype(numpy.float64)
+    island_offsets[used_islands] = numpy.round(reference_uvs / stepScale, 0) * stepScale
 
-            Island = []
-            for face in bm.faces:
-                if face.select:
-                    Island.append(face)
-                    if face in ToCheakFace:
-                        ToCheakFace.remove(face)
-            Islands.append(Island)
-
-        return Islands
-
-    def MoveItlandToCenter(faces, uv_lay, minDistance):
-        loop = faces[-1].loops[-1]
+    uvs = uvs - island_offsets[islands[loop_faces]]
+    uv_layer.data.foreach_set("uv", uvs.astype(numpy.float32).reshape(-1))
+    mesh.update()
+    return True
 
-        x = round(loop[uv_lay].uv[0]/minDistance, 0)*minDistance
-        y = round(loop[uv_lay].uv[1]/minDistance, 0)*minDistance
 
-        for face in faces:
-            for loop in face.loops:
-                loop[uv_lay].uv[0] -= x
-                loop[uv_lay].uv[1] -= y
+def CorrectExtremeUV(stepScale=2):
 
     def IsValidForUvEdit(obj):
         if obj.type == "MESH":
             return True
         return False
 
-    for obj in bpy.context.selected_objects:
-        if IsValidForUvEdit(obj):
-            bm = bmesh.from_edit_mesh(obj.data)
+    objs = [obj for obj in bpy.context.selected_objects if IsValidForUvEdit(obj)]
+    if len(objs) == 0:
+        return
 
-            uv_lay = bm.loops.layers.uv.active
-            if uv_lay is None:
-                return
+    # UV are edited on the mesh data
+    use_edit_mode = bpy.context.mode == "EDIT_MESH"
+    if use_edit_mode:
+        bbpl.utils.SafeModeSet('OBJECT')
 
-            for faces in GetAllIsland(bm, uv_lay):
-                uv_lay = bm.loops.layers.uv.active
-                MoveItlandToCenter(faces, uv_lay, stepScale)
+    for obj in objs:
+        CorrectExtremeUVOnMesh(obj.data, stepScale)
 
-            obj.data.update()
+    if use_edit_mode:
+        bbpl.utils.SafeModeSet('EDIT')
 
 
 def ApplyExportTransform(obj, use_type="Object"):
@@ -999,6 +1312,7 @@ def ApplyExportTransform(obj, use_type="Object"):
     obj.scale = saveScale
 
 
+@ProfileExport()
 def ApplySkeletalExportScale(armature, rescale, target_animation_data=None, is_a_proxy=False):
 
     # This function will rescale the armature and applys the new scale
@@ -1107,38 +1421,94 @@ def RescaleActionCurve(action, scale):
                     mod.strength *= scale
 
 
-def RescaleAllActionCurve(bone_scale, scene_scale=1):
-    for action in bpy.data.actions:
-        print(action.name)
-        for fcurve in action.fcurves:
-            if fcurve.data_path == "location":
-                # Curve
-                for key in fcurve.keyframe_points:
-                    key.co[1] *= scene_scale
-                    key.handle_left[1] *= scene_scale
-                    key.handle_right[1] *= scene_scale
+def GetActionsUsedByObjects(objs):
+    # Returns the active and NLA actions of the objects, without duplicate
 
-                # Modifier
-                for mod in fcurve.modifiers:
-                    if mod.type == "NOISE":
-                        mod.strength *= scene_scale
+    actions = []
 
-            elif fcurve.data_path.split(".")[-1] == "location":
+    def AddAction(action):
+        if action is not None and action not in actions:
+            actions.append(action)
 
-                # Curve
-                for key in fcurve.keyframe_points:
-                    key.co[1] *= bone_scale
-                    key.handle_left[1] *= bone_scale
-                    key.handle_right[1] *= bone_scale
+    def AddStripsActions(strips):
+        for strip in strips:
+            AddAction(strip.action)
+            AddStripsActions(strip.strips)
 
-                # Modifier
-                for mod in fcurve.modifiers:
-                    if mod.type == "NOISE":
-                        mod.strength *= bone_scale
+    for obj in objs:
+        if obj.animation_data is not None:
+            AddAction(obj.animation_data.action)
+            for nla_track in obj.animation_data.nla_tracks:
+                AddStripsActions(nla_track.strips)
+    return actions
+
+
+class ActionCurveRescale():
+
+    '''
+    Rescale the location curves of the actions used by an export.
+    The keyframes are saved before the rescale and written back by Restore(),
+    so the actions get exactly their original values after the export.
+    '''
 
+    def __init__(self):
+        self.actions = []
+        self.fcurves_data = []
+        self.modifiers_data = []
 
-def GetFinalAssetToExport():
+    @ProfileExport("ActionCurveRescale.Rescale")
+    def Rescale(self, actions, bone_scale, scene_scale=1):
+        for action in actions:
+            for fcurve in action.fcurves:
+                if fcurve.data_path == "location":
+                    self.RescaleFCurve(fcurve, scene_scale)
+                elif fcurve.data_path.split(".")[-1] == "location":
+                    self.RescaleFCurve(fcurve, bone_scale)
+            action.update_tag()
+            self.actions.append(action)
+
+    def RescaleFCurve(self, fcurve, scale):
+        # Curve
+        keyframe_points = fcurve.keyframe_points
+        saved_keys = {}
+        for prop in ["co", "handle_left", "handle_right"]:
+            values = numpy.empty(len(keyframe_points) * 2, dtype=numpy.float32)
+            keyframe_points.foreach_get(prop, values)
+            saved_keys[prop] = values
+            scaled_values = values.copy()
+            scaled_values[1::2] *= scale
+            keyframe_points.foreach_set(prop, scaled_values)
+        self.fcurves_data.append((fcurve, saved_keys))
+
+        # Modifier
+        for mod in fcurve.modifiers:
+            if mod.type == "NOISE":
+                self.modifiers_data.append((mod, mod.strength))
+                mod.strength *= scale
+
+    @ProfileExport("ActionCurveRescale.Restore")
+    def Restore(self):
+        for fcurve, saved_keys in self.fcurves_data:
+            for prop, values in saved_keys.items():
+                fcurve.keyframe_points.foreach_set(prop, values)
+        for mod, strength in self.modifiers_data:
+            mod.strength = strength
+        for action in self.actions:
+            action.update_tag()
+
+        self.actions = []
+        self.fcurves_data = []
+        self.modifiers_data = []
+
+
+def GetFinalAssetToExport(use_cache=True):
     # Returns all assets that will be exported
+    if use_cache:
+        return MyExportPlanCache.GetFinalAssetToExport()
+    return ComputeFinalAssetToExport()
+
+
+def ComputeFinalAssetToExport():
 
     def getHaveParentToExport(obj):
         if obj.parent is not None:
@@ -1246,6 +1616,46 @@ def GetFinalAssetToExport():
     return TargetAssetToExport
 
 
+def GetExportNeededObjects(assets):
+    # Returns the objects that must be visible and selectable for export the assets
+    # (Assets objects, their children, proxy children and collections objects)
+
+    scene = bpy.context.scene
+    needed_objs = []
+    needed_names = set()
+
+    def AddObject(obj):
+        if obj is not None and obj.name not in needed_names:
+            needed_names.add(obj.name)
+            needed_objs.append(obj)
+
+    def AddRecursiveChilds(obj):
+        for child in obj.children:
+            if child.library is None and child.name in scene.objects:
+                if child.ExportEnum != "dont_export":
+                    AddObject(child)
+                AddRecursiveChilds(child)
+
+    for asset in assets:
+        if asset.type == "Collection StaticMesh":
+            for obj in GetAssetCollection(asset).all_objects:
+                if obj.ExportEnum != "dont_export":
+                    AddObject(obj)
+        elif asset.obj.name not in needed_names:
+            AddObject(asset.obj)
+            AddRecursiveChilds(asset.obj)
+            if GetExportAsProxy(asset.obj):
+                AddObject(GetExportProxyChild(asset.obj))
+            if asset.type == "StaticMesh" and GetAddonPrefs().exportLodChain:
+                # The lods are exported with the StaticMesh in the same lod chain
+                for lod_number, lod in GetObjLods(asset.obj):
+                    if lod.library is None and lod.name in scene.objects:
+                        AddObject(lod)
+                        AddRecursiveChilds(lod)
+
+    return needed_objs
+
+
 def ValidFilenameForUnreal(filename):
     # valid file name for unreal assets
     extension = os.path.splitext(filename)[1]
@@ -1586,35 +1996,96 @@ def GetObjExportScale(obj):
     return obj.exportGlobalScale
 
 
-def GenerateUe4Name(name):
-    # Generate a new name with suffix number
-
-    def IsValidName(testedName):
-        # Checks if objet end with number suffix
+class ObjectNameIndex():
+    # Object names used by GenerateUe4Name()
+    # The index is only valid between Begin() and End(),
+    # the objects must be renamed with Rename() during this time.
 
-        if (testedName.split("_")[-1]).isnumeric():
-            number = int(testedName.split("_")[-1])
-        else:
-            # Last suffix is not a number
+    def __init__(self):
+        self.depth = 0
+        self.names = None
+        self.next_suffix = {}  # Name without suffix : all lower suffix numbers are used
+
+    def IsActive(self):
+        return self.names is not None
+
+    def Begin(self):
+        if self.depth == 0:
+            self.names = set(bpy.data.objects.keys())
+            self.next_suffix = {}
+        self.depth += 1
+
+    def End(self):
+        self.depth = max(0, self.depth - 1)
+        if self.depth == 0:
+            self.names = None
+            self.next_suffix = {}
+
+    def IsUsedName(self, name, ignored_obj=None):
+        if ignored_obj is not None and ignored_obj.name == name:
             return False
+        return name in self.names
 
-        # Checks if an object uses this name. (If not is a valid name)
-        for obj in bpy.context.scene.objects:
-            if testedName == obj.name:
-                return False
+    def GetFreeName(self, name, ignored_obj=None):
+        # Returns the lowest free suffix name or None
+        num = self.next_suffix.get(name, 0)
+        while num < 1000:
+            newName = name+"_"+str('%02d' % num)  # Min two pad
+            if not self.IsUsedName(newName, ignored_obj):
+                self.next_suffix[name] = num
+                return newName
+            num += 1
+        self.next_suffix[name] = num
+        return None
 
-        return True
+    def Rename(self, obj, newName):
+        oldName = obj.name
+        obj.name = newName
+        self.names.discard(oldName)
+        self.names.add(obj.name)
+
+        # The old suffix number can be used again
+        base, sep, suffix = oldName.rpartition("_")
+        if sep and suffix.isnumeric() and base in self.next_suffix:
+            self.next_suffix[base] = min(self.next_suffix[base], int(suffix))
+
+
+MyObjectNameIndex = ObjectNameIndex()
+
+
+def GenerateUe4Name(name, ignored_obj=None):
+    # Generate a new name with suffix number
+    # ignored_obj is the object that will use the name, its current name is considered as free
 
-    newName = ""
-    if IsValidName(name):
+    MyObjectNameIndex.Begin()
+    try:
+        # Checks if objet end with number suffix
+        if (name.split("_")[-1]).isnumeric():
+            # Checks if an object uses this name. (If not is a valid name)
+            if not MyObjectNameIndex.IsUsedName(name, ignored_obj):
+                return name
+
+        newName = MyObjectNameIndex.GetFreeName(name, ignored_obj)
+        if newName is not None:
+            return newName
         return name
-    else:
-        for num in range(0, 1000):
-            newName = name+"_"+str('%02d' % num)  # Min two pad
-            if IsValidName(newName):
-                return newName
+    finally:
+        MyObjectNameIndex.End()
 
-    return name
+
+def SetUe4Name(obj, name):
+    # Rename obj with GenerateUe4Name(name)
+    # A name that already use this name with a number suffix is kept
+
+    base, sep, suffix = obj.name.rpartition("_")
+    if base == name and suffix.isnumeric():
+        return
+
+    MyObjectNameIndex.Begin()
+    try:
+        MyObjectNameIndex.Rename(obj, GenerateUe4Name(name, obj))
+    finally:
+        MyObjectNameIndex.End()
 
 
 def CreateCollisionMaterial():
@@ -1667,78 +2138,24 @@ def Ue4SubObj_set(SubType):
 
     ConvertedObjs = []
 
-    for obj in objList:
-        DeselectAllWithoutActive()
-        obj.select_set(True)
-        if obj != ownerObj:
-
-            # SkeletalMesh Colider
-            if obj.type == 'MESH':
-                ConvertToConvexHull(obj)
-                obj.modifiers.clear()
-                obj.data
-                obj.data.materials.clear()
-                obj.active_material_index = 0
-                obj.data.materials.append(CreateCollisionMaterial())
-
-                # Set the name of the Prefix depending on the
-                # type of collision in agreement with unreal FBX Pipeline
-                if SubType == "Box":
-                    prefixName = "UBX_"
-                elif SubType == "Capsule":
-                    prefixName = "UCP_"
-                elif SubType == "Sphere":
-                    prefixName = "USP_"
-                elif SubType == "Convex":
-                    prefixName = "UCX_"
-
-                obj.name = GenerateUe4Name(prefixName+ownerObj.name)
-                obj.show_wire = True
-                obj.show_transparent = True
-                bpy.ops.object.parent_set(type='OBJECT', keep_transform=True)
-                ConvertedObjs.append(obj)
-
-            # StaticMesh Socket
-            if obj.type == 'EMPTY' and SubType == "ST_Socket":
-                if ownerObj.type == 'MESH':
-                    if not IsASocket(obj):
-                        obj.name = GenerateUe4Name("SOCKET_"+obj.name)
-                    bpy.ops.object.parent_set(
-                        type='OBJECT',
-                        keep_transform=True)
-                    ConvertedObjs.append(obj)
-
-            # SkeletalMesh Socket
-            if obj.type == 'EMPTY' and SubType == "SK_Socket":
-                if ownerObj.type == 'ARMATURE':
-
-                    if not IsASocket(obj):
-                        obj.name = GenerateUe4Name("SOCKET_"+obj.name)
-                    bpy.ops.object.parent_set(type='BONE')
-                    ConvertedObjs.append(obj)
-
-    DeselectAllWithoutActive()
-    for obj in objList:
-        obj.select_set(True)  # Resets previous selected object
-    return ConvertedObjs
-
-
-def UpdateUe4Name(SubType, objList):
-    # Convect obj to ue4 sub objects (Collisions Shapes or Socket)
-
-    for obj in objList:
-        ownerObj = obj.parent
-
-        if ownerObj is not None:
+    MyObjectNameIndex.Begin()
+    try:
+        for obj in objList:
+            DeselectAllWithoutActive()
+            obj.select_set(True)
             if obj != ownerObj:
 
                 # SkeletalMesh Colider
                 if obj.type == 'MESH':
-
-                    # Set the name of the Prefix depending
-                    # on the type of collision in agreement
-                    # with unreal FBX Pipeline
-
+                    ConvertToConvexHull(obj)
+                    obj.modifiers.clear()
+                    obj.data
+                    obj.data.materials.clear()
+                    obj.active_material_index = 0
+                    obj.data.materials.append(CreateCollisionMaterial())
+
+                    # Set the name of the Prefix depending on the
+                    # type of collision in agreement with unreal FBX Pipeline
                     if SubType == "Box":
                         prefixName = "UBX_"
                     elif SubType == "Capsule":
@@ -1748,19 +2165,81 @@ def UpdateUe4Name(SubType, objList):
                     elif SubType == "Convex":
                         prefixName = "UCX_"
 
-                    obj.name = GenerateUe4Name(prefixName+ownerObj.name)
+                    SetUe4Name(obj, prefixName+ownerObj.name)
+                    obj.show_wire = True
+                    obj.show_transparent = True
+                    bpy.ops.object.parent_set(type='OBJECT', keep_transform=True)
+                    ConvertedObjs.append(obj)
 
                 # StaticMesh Socket
                 if obj.type == 'EMPTY' and SubType == "ST_Socket":
                     if ownerObj.type == 'MESH':
                         if not IsASocket(obj):
-                            obj.name = GenerateUe4Name("SOCKET_"+obj.name)
+                            SetUe4Name(obj, "SOCKET_"+obj.name)
+                        bpy.ops.object.parent_set(
+                            type='OBJECT',
+                            keep_transform=True)
+                        ConvertedObjs.append(obj)
 
                 # SkeletalMesh Socket
                 if obj.type == 'EMPTY' and SubType == "SK_Socket":
                     if ownerObj.type == 'ARMATURE':
+
                         if not IsASocket(obj):
-                            obj.name = GenerateUe4Name("SOCKET_"+obj.name)
+                            SetUe4Name(obj, "SOCKET_"+obj.name)
+                        bpy.ops.object.parent_set(type='BONE')
+                        ConvertedObjs.append(obj)
+    finally:
+        MyObjectNameIndex.End()
+
+    DeselectAllWithoutActive()
+    for obj in objList:
+        obj.select_set(True)  # Resets previous selected object
+    return ConvertedObjs
+
+
+def UpdateUe4Name(SubType, objList):
+    # Convect obj to ue4 sub objects (Collisions Shapes or Socket)
+
+    MyObjectNameIndex.Begin()
+    try:
+        for obj in objList:
+            ownerObj = obj.parent
+
+            if ownerObj is not None:
+                if obj != ownerObj:
+
+                    # SkeletalMesh Colider
+                    if obj.type == 'MESH':
+
+                        # Set the name of the Prefix depending
+                        # on the type of collision in agreement
+                        # with unreal FBX Pipeline
+
+                        if SubType == "Box":
+                            prefixName = "UBX_"
+                        elif SubType == "Capsule":
+                            prefixName = "UCP_"
+                        elif SubType == "Sphere":
+                            prefixName = "USP_"
+                        elif SubType == "Convex":
+                            prefixName = "UCX_"
+
+                        SetUe4Name(obj, prefixName+ownerObj.name)
+
+                    # StaticMesh Socket
+                    if obj.type == 'EMPTY' and SubType == "ST_Socket":
+                        if ownerObj.type == 'MESH':
+                            if not IsASocket(obj):
+                                SetUe4Name(obj, "SOCKET_"+obj.name)
+
+                    # SkeletalMesh Socket
+                    if obj.type == 'EMPTY' and SubType == "SK_Socket":
+                        if ownerObj.type == 'ARMATURE':
+                            if not IsASocket(obj):
+                                SetUe4Name(obj, "SOCKET_"+obj.name)
+    finally:
+        MyObjectNameIndex.End()
 
 
 def IsASocket(obj):
@@ -1819,8 +2298,9 @@ def UpdateAreaLightMapList(list=None):
     UpdatedRes = 0
 
     counter = CounterTimer()
+    areas = GetExportRealSurfaceAreas(objs)
     for obj in objs:
-        obj.computedStaticMeshLightMapRes = GetExportRealSurfaceArea(obj)
+        obj.computedStaticMeshLightMapRes = areas[obj.name]
         UpdatedRes += 1
         UpdateProgress(
             "Update LightMap",
@@ -1899,3 +2379,27 @@ def ClearAllBFUTempVars(obj):
     ClearVarOnObject(obj, "BFU_OriginName")
     ClearVarOnObject(obj, "BFU_ExportAsProxy")
     ClearVarOnObject(obj, "BFU_ExportProxyChild")
+
+
+def register():
+    for handler_list in export_plan_cache_handlers:
+        if ExportPlanCacheHandler not in handler_list:
+            handler_list.append(ExportPlanCacheHandler)
+
+    if IDUpdateCounterHandler not in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.append(IDUpdateCounterHandler)
+    for handler_list in id_update_counter_reset_handlers:
+        if IDUpdateCounterResetHandler not in handler_list:
+            handler_list.append(IDUpdateCounterResetHandler)
+
+
+def unregister():
+    for handler_list in export_plan_cache_handlers:
+        if ExportPlanCacheHandler in handler_list:
+            handler_list.remove(ExportPlanCacheHandler)
+
+    if IDUpdateCounterHandler in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(IDUpdateCounterHandler)
+    for handler_list in id_update_counter_reset_handlers:
+        if IDUpdateCounterResetHandler in handler_list:
+            handler_list.remove(IDUpdateCounterResetHandler)
@@ -31,6 +31,7 @@ from . import bfu_write_utils
 from .bfu_write_utils import *
 from .export import bfu_export_get_info
 from .export.bfu_export_get_info import *
+from .export import bfu_export_incremental
 
 if "bpy" in locals():
     import importlib
@@ -44,6 +45,8 @@ if "bpy" in locals():
         importlib.reload(languages)
     if "bfu_export_get_info" in locals():
         importlib.reload(bfu_export_get_info)
+    if "bfu_export_incremental" in locals():
+        importlib.reload(bfu_export_incremental)
 
 
 def WriteImportAssetScript():
@@ -84,6 +87,7 @@ def WriteImportAssetScript():
         full_import_path = "/" + scene.unreal_import_module + "/" + os.path.join(scene.unreal_import_location, relative_import_path)
         full_import_path = full_import_path.replace('\\', '/').rstrip('/')
         asset_data["full_import_path"] = full_import_path
+        asset_data["export_skipped"] = asset.export_skipped
 
         if asset.GetFileByType("FBX"):
             asset_data["fbx_path"] = asset.GetFileByType("FBX").GetAbsolutePath()
@@ -101,6 +105,11 @@ def WriteImportAssetScript():
         else:
             asset_data["additional_tracks_path"] = None
 
+        # Used by the import script to skip the assets with unchanged files
+        asset_data["file_hashes"] = {}
+        for file in asset.files:
+            asset_data["file_hashes"][file.type] = bfu_export_incremental.MyFileHashCache.GetHash(file.GetAbsolutePath())
+
         if GetIsAnimation(asset.asset_type) or asset.asset_type == "SkeletalMesh":
             if(asset.object.bfu_skeleton_search_mode) == "auto":
                 customName = scene.skeleton_prefix_export_name+ValidUnrealAssetsName(asset.skeleton_name)+"_Skeleton"
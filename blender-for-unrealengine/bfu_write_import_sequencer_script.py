@@ -76,33 +76,18 @@ def WriteImportSequencerTracks():
 
     def getMarkerSceneSections():
         scene = bpy.context.scene
-        markersOrderly = []
-        firstMarkersFrame = scene.frame_start
-        lastMarkersFrame = scene.frame_end+1
 
         # If the scene don't use marker
         if len(bpy.context.scene.timeline_markers) < 1:
             return ([[scene.frame_start, scene.frame_end+1, bpy.context.scene.camera]])
 
-        for marker in scene.timeline_markers:
-            # Re set first frame
-            if marker.frame < firstMarkersFrame:
-                firstMarkersFrame = marker.frame
-
-        for x in range(firstMarkersFrame, lastMarkersFrame):
-            for marker in scene.timeline_markers:
-                if marker.frame == x:
-                    markersOrderly.append(marker)
-        # ---
+        # Markers after the scene end are ignored
         sectionCuts = []
-        for x in range(len(markersOrderly)):
-            if scene.frame_end+1 > markersOrderly[x].frame:
-                startTime = markersOrderly[x].frame
-                if x+1 != len(markersOrderly):
-                    EndTime = markersOrderly[x+1].frame
-                else:
-                    EndTime = scene.frame_end+1
-                sectionCuts.append([startTime, EndTime, markersOrderly[x].camera])
+        for marker_sequence in TimelineMarkerSequence().marker_sequences:
+            if scene.frame_end+1 > marker_sequence.start:
+                startTime = marker_sequence.start
+                EndTime = min(marker_sequence.end, scene.frame_end)+1
+                sectionCuts.append([startTime, EndTime, marker_sequence.marker.camera])
 
         return sectionCuts
 
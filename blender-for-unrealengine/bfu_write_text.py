@@ -19,6 +19,7 @@
 
 import bpy
 import time
+import numpy
 from math import degrees, radians, tan
 from mathutils import Matrix
 import json
@@ -34,6 +35,7 @@ from . import bfu_write_import_asset_script
 from . import bfu_write_import_sequencer_script
 from .export import bfu_export_get_info
 from .export.bfu_export_get_info import *
+from .export import bfu_export_profiler
 
 if "bpy" in locals():
     import importlib
@@ -49,6 +51,8 @@ if "bpy" in locals():
         importlib.reload(languages)
     if "bfu_export_get_info" in locals():
         importlib.reload(bfu_export_get_info)
+    if "bfu_export_profiler" in locals():
+        importlib.reload(bfu_export_profiler)
 
 
 def ExportSingleText(text, dirpath, filename):
@@ -68,7 +72,7 @@ def ExportSingleText(text, dirpath, filename):
     return([filename, "TextFile", absdirpath, exportTime])
 
 
-def ExportSingleJson(json_data, dirpath, filename):
+def ExportSingleJson(json_data, dirpath, filename, compact=False):
     # Export single Json
 
     counter = CounterTimer()
@@ -78,7 +82,10 @@ def ExportSingleJson(json_data, dirpath, filename):
     fullpath = os.path.join(absdirpath, filename)
 
     with open(fullpath, 'w') as json_file:
-        json.dump(json_data, json_file, ensure_ascii=False, sort_keys=False, indent=4)
+        if compact:
+            json.dump(json_data, json_file, ensure_ascii=False, sort_keys=False, separators=(',', ':'))
+        else:
+            json.dump(json_data, json_file, ensure_ascii=False, sort_keys=False, indent=4)
 
     exportTime = counter.GetTime()
     # This return [AssetName , AssetType , ExportPath, ExportTime]
@@ -94,9 +101,12 @@ def WriteExportLog():
     AlembicNum = 0
     AnimNum = 0
     CameraNum = 0
+    SkippedNum = 0
 
     # Get number per asset type
     for assets in scene.UnrealExportedAssetsList:
+        if assets.export_skipped:
+            SkippedNum += 1
         if assets.asset_type == "StaticMesh":
             StaticNum += 1
         if assets.asset_type == "SkeletalMesh":
@@ -120,6 +130,8 @@ def WriteExportLog():
     AssetNumberByType += str(AnimNum)+" Animation(s) | "
     AssetNumberByType += str(CameraNum)+" Camera(s) | "
     AssetNumberByType += str(OtherNum)+" Other(s)" + "\n"
+    if SkippedNum > 0:
+        AssetNumberByType += str(SkippedNum)+" asset(s) skipped (unchanged since the last export)" + "\n"
 
     ExportLog = ""
     ExportLog += AssetNumberByType
@@ -141,202 +153,298 @@ def WriteExportLog():
             else:
                 primaryInfo = asset.asset_type
 
-        ExportLog += (
-            asset.asset_name+" ["+primaryInfo+"] EXPORTED IN " + str(round(asset.GetExportTime(), 2))+"s\r\n")
+        if asset.export_skipped:
+            ExportLog += (
+                asset.asset_name+" ["+primaryInfo+"] SKIPPED (unchanged)\r\n")
+        else:
+            ExportLog += (
+                asset.asset_name+" ["+primaryInfo+"] EXPORTED IN " + str(round(asset.GetExportTime(), 2))+"s\r\n")
         for file in asset.files:
             ExportLog += (file.path + "\\" + file.name + "\n")
         ExportLog += "\n"
 
+    if bfu_export_profiler.MyExportProfiler.HasData():
+        ExportLog += "Export profile:" + "\n"
+        ExportLog += bfu_export_profiler.MyExportProfiler.GetSummaryText()
+
     return ExportLog
 
 
-def WriteCameraAnimationTracks(obj, target_frame_start=None, target_frame_end=None):
-    # Write as json file
-
-    scene = bpy.context.scene
-    if target_frame_start is None:
-        target_frame_start = scene.frame_start
-    if target_frame_end is None:
-        target_frame_end = scene.frame_end+1
-
-    def getCameraFocusDistance(Camera, Target):
-        transA = Camera.matrix_world.copy()
-        transB = Target.matrix_world.copy()
-        transA.invert()
-        distance = (transA @ transB).translation.z  # Z is the Fosrward
-        if distance < 0:
-            distance *= -1
-        return distance
-
-    def getAllCamDistKeys(Camera, Target):
-        scene = bpy.context.scene
-        saveFrame = scene.frame_current  # Save current frame
-        keys = []
-        for frame in range(target_frame_start, target_frame_end):
-            scene.frame_set(frame)
-            v = getCameraFocusDistance(Camera, Target)
-            keys.append((frame, v))
-        scene.frame_set(saveFrame)  # Resets previous start frame
-        return keys
-
-    def getAllKeysByMatrix(obj):
-        scene = bpy.context.scene
-        saveFrame = scene.frame_current  # Save current frame
-        keys = []
-        for frame in range(target_frame_start, target_frame_end):
-            scene.frame_set(frame)
-            v = obj.matrix_world*1
-            keys.append((frame, v))
-        scene.frame_set(saveFrame)  # Resets previous start frame
-        return keys
-
-    def getOneKeysByFcurves(obj, DataPath, DataValue, Frame, IsData=True):
-        scene = bpy.context.scene
-        if IsData:
-            if obj.data.animation_data is not None:
-                if obj.data.animation_data.action is not None:
-                    f = obj.data.animation_data.action.fcurves.find(DataPath)
-                    if f is not None:
-                        return f.evaluate(Frame)
+def GetCameraFocusDistance(camera, target):
+    transA = camera.matrix_world.copy()
+    transB = target.matrix_world.copy()
+    transA.invert()
+    distance = (transA @ transB).translation.z  # Z is the Fosrward
+    if distance < 0:
+        distance *= -1
+    return distance
+
+
+def GetCameraTrackFCurve(camera, data_path, is_data=True):
+    id_data = camera.data if is_data else camera
+    if id_data.animation_data is not None:
+        if id_data.animation_data.action is not None:
+            return id_data.animation_data.action.fcurves.find(data_path)
+    return None
+
+
+def GetCameraTrackValueAtFrame(camera, data_path, frame, is_data=True):
+    # Need scene.frame_set(frame) when the value is not from a fcurve
+    fcurve = GetCameraTrackFCurve(camera, data_path, is_data)
+    if fcurve is not None:
+        return fcurve.evaluate(frame)
+    id_data = camera.data if is_data else camera
+    return id_data.path_resolve(data_path)
+
+
+def GetCameraTrackValues(camera, data_path, frames, is_data=True):
+    # Evaluate the channel on all frames without change the current frame
+    fcurve = GetCameraTrackFCurve(camera, data_path, is_data)
+    if fcurve is not None:
+        return numpy.fromiter((fcurve.evaluate(frame) for frame in frames), dtype=numpy.float64, count=len(frames))
+    id_data = camera.data if is_data else camera
+    return numpy.full(len(frames), float(id_data.path_resolve(data_path)))
+
+
+def GetIfCameraNeedFrameEvaluation(camera):
+    # Drivers and NLA strips can only be evaluated with scene.frame_set()
+    for id_data in [camera, camera.data]:
+        animation_data = id_data.animation_data
+        if animation_data is not None:
+            if len(animation_data.drivers) > 0 or len(animation_data.nla_tracks) > 0:
+                return True
+    return False
+
+
+class CameraAnimationTracks():
+    # Tracks of a camera, values are stored by frame
+
+    channel_names = [
+        "near_clipping_plane",
+        "far_clipping_plane",
+        "fov",
+        "angle",
+        "lens",
+        "sensor_width",
+        "sensor_height",
+        "focus_distance",
+        "aperture_fstop",
+        "hide_viewport",
+        ]
+
+    def __init__(self, camera):
+        self.camera = camera
+        self.frames = []
+        self.transform_track = {}
+        self.channels = {}
+        self.use_frame_evaluation = GetIfCameraNeedFrameEvaluation(camera)
+        self.use_focus_object = camera.data.dof.focus_object is not None
+        for channel_name in self.channel_names:
+            self.channels[channel_name] = []
+
+    def EvaluateTransformAtFrame(self, frame):
+        camera = self.camera
+        array_transform = EvaluateCameraPositionForUnreal(camera)
+        array_location = array_transform[0]
+        array_rotation = array_transform[1]
+        array_scale = array_transform[2]
+
+        # Fix axis flippings
+        if camera.bfu_fix_axis_flippings:
+            if frame-1 in self.transform_track:  # Previous frame
+                previous_rotation_x = self.transform_track[frame-1]["rotation_x"]
+                previous_rotation_y = self.transform_track[frame-1]["rotation_y"]
+                previous_rotation_z = self.transform_track[frame-1]["rotation_z"]
+                diff = round((array_rotation[0] - previous_rotation_x) / 180.0) * 180.0
+                array_rotation[0] = array_rotation[0] - diff
+                diff = round((array_rotation[1] - previous_rotation_y) / 180.0) * 180.0
+                array_rotation[1] = array_rotation[1] - diff
+                diff = round((array_rotation[2] - previous_rotation_z) / 180.0) * 180.0
+                array_rotation[2] = array_rotation[2] - diff
+
+        transform = {}
+        transform["location_x"] = array_location.x
+        transform["location_y"] = array_location.y
+        transform["location_z"] = array_location.z
+        transform["rotation_x"] = array_rotation[0]
+        transform["rotation_y"] = array_rotation[1]
+        transform["rotation_z"] = array_rotation[2]
+        transform["scale_x"] = array_scale.x
+        transform["scale_y"] = array_scale.y
+        transform["scale_z"] = array_scale.z
+        self.transform_track[frame] = transform
+
+        if self.use_focus_object and not self.use_frame_evaluation:
+            self.channels["focus_distance"].append(GetCameraFocusDistance(camera, camera.data.dof.focus_object))
+
+    def EvaluateChannelsAtFrame(self, frame):
+        # Slow path, used only when the camera need scene.frame_set()
+        camera = self.camera
+        channels = self.channels
+        channels["angle"].append(GetCameraTrackValueAtFrame(camera, "angle", frame))
+        channels["lens"].append(GetCameraTrackValueAtFrame(camera, "lens", frame))
+        channels["sensor_width"].append(GetCameraTrackValueAtFrame(camera, "sensor_width", frame))
+        channels["sensor_height"].append(GetCameraTrackValueAtFrame(camera, "sensor_height", frame))
+        channels["near_clipping_plane"].append(GetCameraTrackValueAtFrame(camera, "clip_start", frame))
+        channels["far_clipping_plane"].append(GetCameraTrackValueAtFrame(camera, "clip_end", frame))
+        if self.use_focus_object:
+            channels["focus_distance"].append(GetCameraFocusDistance(camera, camera.data.dof.focus_object))
+        else:
+            channels["focus_distance"].append(GetCameraTrackValueAtFrame(camera, "dof.focus_distance", frame))
+        channels["aperture_fstop"].append(GetCameraTrackValueAtFrame(camera, "dof.aperture_fstop", frame))
+        channels["hide_viewport"].append(GetCameraTrackValueAtFrame(camera, "hide_viewport", frame, False))
+
+    def EvaluateChannels(self):
+        # Fast path, fcurves are evaluated on all frames without scene.frame_set()
+        camera = self.camera
+        frames = self.frames
+        channels = self.channels
+        channels["lens"] = GetCameraTrackValues(camera, "lens", frames)
+        channels["sensor_width"] = GetCameraTrackValues(camera, "sensor_width", frames)
+        channels["sensor_height"] = GetCameraTrackValues(camera, "sensor_height", frames)
+        if GetCameraTrackFCurve(camera, "angle") is not None:
+            channels["angle"] = GetCameraTrackValues(camera, "angle", frames)
         else:
-            if obj.animation_data is not None:
-                if obj.animation_data.action is not None:
-                    f = obj.animation_data.action.fcurves.find(DataPath)
-                    if f is not None:
-                        return f.evaluate(Frame)
-        return DataValue
-
-    def getAllKeysByFcurves(obj, DataPath, DataValue, IsData=True):
+            # Camera.angle is computed from the lens and the sensor
+            if camera.data.sensor_fit == "VERTICAL":
+                sensor = channels["sensor_height"]
+            else:
+                sensor = channels["sensor_width"]
+            channels["angle"] = 2.0 * numpy.arctan(sensor / (2.0 * channels["lens"]))
+        channels["near_clipping_plane"] = GetCameraTrackValues(camera, "clip_start", frames)
+        channels["far_clipping_plane"] = GetCameraTrackValues(camera, "clip_end", frames)
+        if not self.use_focus_object:
+            channels["focus_distance"] = GetCameraTrackValues(camera, "dof.focus_distance", frames)
+        channels["aperture_fstop"] = GetCameraTrackValues(camera, "dof.aperture_fstop", frames)
+        channels["hide_viewport"] = GetCameraTrackValues(camera, "hide_viewport", frames, False)
+
+    def ConvertChannelsForUnreal(self):
         scene = bpy.context.scene
-        keys = []
-        f = None
-        if IsData:
-            if obj.data.animation_data is not None:
-                if obj.data.animation_data.action is not None:
-                    f = obj.data.animation_data.action.fcurves.find(DataPath)
+        scale_length = scene.unit_settings.scale_length
+        channels = {}
+        for channel_name in self.channel_names:
+            channels[channel_name] = numpy.asarray(self.channels[channel_name], dtype=numpy.float64)
+
+        channels["fov"] = numpy.degrees(channels["angle"])
+
+        # Get Clip
+        channels["near_clipping_plane"] = channels["near_clipping_plane"] * 100 * scale_length
+        channels["far_clipping_plane"] = channels["far_clipping_plane"] * 100 * scale_length
+
+        # Get FocusDistance
+        focus_distance = channels["focus_distance"] * 100 * scale_length
+        channels["focus_distance"] = numpy.where(focus_distance > 0, focus_distance, 100000)  # 100000 is default value in ue4
+
+        # Write Aperture (Depth of Field) keys
+        render_engine = scene.render.engine
+        if render_engine == "BLENDER_EEVEE" or render_engine == "CYCLES" or render_engine == "BLENDER_WORKBENCH":
+            channels["aperture_fstop"] = channels["aperture_fstop"] / scale_length
         else:
-            if obj.animation_data is not None:
-                if obj.animation_data.action is not None:
-                    f = obj.animation_data.action.fcurves.find(DataPath)
-
-        if f is not None:
-            for frame in range(target_frame_start, target_frame_end):
-                v = f.evaluate(frame)
-                keys.append((frame, v))
-            return keys
-        return[(target_frame_start, DataValue)]
-
-    class CameraDataAtFrame():
-
-        def __init__(self):
-            scene = bpy.context.scene
-            self.transform_track = {}
-            self.near_clipping_plane = {}
-            self.far_clipping_plane = {}
-            self.fov = {}
-            self.angle = {}
-            self.lens = {}
-            self.sensor_width = {}
-            self.sensor_height = {}
-            self.focus_distance = {}
-            self.aperture_fstop = {}
-            self.hide_viewport = {}
-
-        def EvaluateTracksAtFrame(self, camera, frame):
-            scene.frame_set(frame)
-
-            array_transform = EvaluateCameraPositionForUnreal(camera)
-            array_location = array_transform[0]
-            array_rotation = array_transform[1]
-            array_scale = array_transform[2]
-
-            # Fix axis flippings
-            if camera.bfu_fix_axis_flippings:
-                if frame-1 in self.transform_track:  # Previous frame
-                    previous_rotation_x = self.transform_track[frame-1]["rotation_x"]
-                    previous_rotation_y = self.transform_track[frame-1]["rotation_y"]
-                    previous_rotation_z = self.transform_track[frame-1]["rotation_z"]
-                    diff = round((array_rotation[0] - previous_rotation_x) / 180.0) * 180.0
-                    array_rotation[0] = array_rotation[0] - diff
-                    diff = round((array_rotation[1] - previous_rotation_y) / 180.0) * 180.0
-                    array_rotation[1] = array_rotation[1] - diff
-                    diff = round((array_rotation[2] - previous_rotation_z) / 180.0) * 180.0
-                    array_rotation[2] = array_rotation[2] - diff
-
-            transform = {}
-            transform["location_x"] = array_location.x
-            transform["location_y"] = array_location.y
-            transform["location_z"] = array_location.z
-            transform["rotation_x"] = array_rotation[0]
-            transform["rotation_y"] = array_rotation[1]
-            transform["rotation_z"] = array_rotation[2]
-            transform["scale_x"] = array_scale.x
-            transform["scale_y"] = array_scale.y
-            transform["scale_z"] = array_scale.z
-            self.transform_track[frame] = transform
-
-            # Get FOV FocalLength SensorWidth SensorHeight
-            self.angle[frame] = getOneKeysByFcurves(camera, "angle", camera.data.angle, frame)
-            self.lens[frame] = getOneKeysByFcurves(camera, "lens", camera.data.lens, frame)
-            self.sensor_width[frame] = getOneKeysByFcurves(camera, "sensor_width", camera.data.sensor_width, frame)
-            self.sensor_height[frame] = getOneKeysByFcurves(camera, "sensor_height", camera.data.sensor_height, frame)
-            self.fov[frame] = math.degrees(self.angle[frame])
-
-            # Get Clip
-            self.near_clipping_plane[frame] = getOneKeysByFcurves(camera, "clip_start", camera.data.clip_start, frame) * 100 * bpy.context.scene.unit_settings.scale_length
-            self.far_clipping_plane[frame] = getOneKeysByFcurves(camera, "clip_end", camera.data.clip_end, frame) * 100 * bpy.context.scene.unit_settings.scale_length
-
-            # Get FocusDistance
-            scale_length = bpy.context.scene.unit_settings.scale_length
-
-            if camera.data.dof.focus_object is not None:
-                key = getCameraFocusDistance(camera, camera.data.dof.focus_object)
-                key = key * 100 * scale_length
+            channels["aperture_fstop"] = numpy.full(len(self.frames), 2.8)  # 2.8 is default value in ue4
 
-            else:
-                key = getOneKeysByFcurves(camera, "dof.focus_distance", camera.data.dof.focus_distance, frame)
-                key = key * 100 * scale_length
+        channels["hide_viewport"] = channels["hide_viewport"] < 1  # Inversed for convert hide to spawn
+        self.channels = channels
 
-            if key > 0:
-                self.focus_distance[frame] = key
-            else:
-                self.focus_distance[frame] = 100000  # 100000 is default value in ue4
+    def GetTrack(self, channel_name):
+        # Returns the channel as dict frame: value
+        return dict(zip(self.frames, self.channels[channel_name].tolist()))
 
-            # Write Aperture (Depth of Field) keys
-            render_engine = scene.render.engine
-            if render_engine == "BLENDER_EEVEE" or render_engine == "CYCLES" or render_engine == "BLENDER_WORKBENCH":
-                key = getOneKeysByFcurves(camera, "dof.aperture_fstop", camera.data.dof.aperture_fstop, frame)
-                self.aperture_fstop[frame] = key / scale_length
-            else:
-                self.aperture_fstop[frame] = 2.8  # 2.8 is default value in ue4
-
-            boolKey = getOneKeysByFcurves(camera, "hide_viewport", camera.hide_viewport, frame, False)
-            self.hide_viewport[frame] = (boolKey < 1)  # Inversed for convert hide to spawn
-
-        def EvaluateTracks(self, camera, frame_start, frame_end):
-            scene = bpy.context.scene
-            addon_prefs = GetAddonPrefs()
-
-            saveFrame = scene.frame_current
-            if camera is None:
-                return
-
-            slms = TimelineMarkerSequence()
-            for frame in range(frame_start, frame_end+1):
-                if len(slms.marker_sequences) > 0 and addon_prefs.bakeOnlyKeyVisibleInCut:
-                    marker_sequence = slms.GetMarkerSequenceAtFrame(frame)
-                    if marker_sequence:
-                        marker = marker_sequence.marker
-                        if marker.camera == camera:
-                            self.EvaluateTracksAtFrame(camera, frame)
-                else:
-                    self.EvaluateTracksAtFrame(camera, frame)
+    def GetColumn(self, channel_name):
+        # Returns the channel as list of values, in the order of self.frames
+        return self.channels[channel_name].tolist()
+
+    def GetTransformColumns(self):
+        columns = {}
+        transforms = [self.transform_track[frame] for frame in self.frames]
+        if len(transforms) > 0:
+            for channel_name in transforms[0].keys():
+                columns[channel_name] = [transform[channel_name] for transform in transforms]
+        return columns
 
-            scene.frame_set(saveFrame)
 
-        pass
+def BakeCamerasAnimationTracks(cameras, frame_start, frame_end):
+    # Evaluate the tracks of all cameras with a single pass on the frames.
+    # Returns a dict with camera name: CameraAnimationTracks
 
     scene = bpy.context.scene
+    addon_prefs = GetAddonPrefs()
+
+    slms = TimelineMarkerSequence()
+    use_marker_cut = len(slms.marker_sequences) > 0 and addon_prefs.bakeOnlyKeyVisibleInCut
+
+    tracks = {}
+    frame_cameras = {}  # Cameras to evaluate at each frame
+    for camera in cameras:
+        camera_tracks = CameraAnimationTracks(camera)
+        tracks[camera.name] = camera_tracks
+        if use_marker_cut:
+            frames = slms.GetCameraFrames(camera, frame_start, frame_end)
+        else:
+            frames = range(frame_start, frame_end+1)
+        for frame in frames:
+            camera_tracks.frames.append(frame)
+            frame_cameras.setdefault(frame, []).append(camera_tracks)
+
+    saveFrame = scene.frame_current
+    for frame in sorted(frame_cameras.keys()):
+        scene.frame_set(frame)
+        for camera_tracks in frame_cameras[frame]:
+            camera_tracks.EvaluateTransformAtFrame(frame)
+            if camera_tracks.use_frame_evaluation:
+                camera_tracks.EvaluateChannelsAtFrame(frame)
+    scene.frame_set(saveFrame)
+
+    for camera_tracks in tracks.values():
+        if not camera_tracks.use_frame_evaluation:
+            camera_tracks.EvaluateChannels()
+        camera_tracks.ConvertChannelsForUnreal()
+
+    return tracks
+
+
+class BakedCameraTracks():
+
+    '''
+    Tracks baked before the export of the cameras,
+    all cameras are baked with the same pass on the frames.
+    '''
+
+    def __init__(self):
+        self.frame_range = None
+        self.tracks = {}
+
+    def Bake(self, cameras, frame_start, frame_end):
+        self.frame_range = (frame_start, frame_end)
+        self.tracks = BakeCamerasAnimationTracks(cameras, frame_start, frame_end)
+
+    def GetTracks(self, camera, frame_start, frame_end):
+        if self.frame_range == (frame_start, frame_end):
+            return self.tracks.get(camera.name)
+        return None
+
+    def Clear(self):
+        self.frame_range = None
+        self.tracks = {}
+
+
+MyBakedCameraTracks = BakedCameraTracks()
+
+
+def GetCameraAnimationTracksFrameRange():
+    scene = bpy.context.scene
+    return (scene.frame_start, scene.frame_end+1)
+
+
+def WriteCameraAnimationTracks(obj, target_frame_start=None, target_frame_end=None, columnar=False):
+    # Write as json file
+    # With columnar each track is a list of values for the frames in data["frames"]
+
+    scene = bpy.context.scene
+    if target_frame_start is None:
+        target_frame_start = GetCameraAnimationTracksFrameRange()[0]
+    if target_frame_end is None:
+        target_frame_end = GetCameraAnimationTracksFrameRange()[1]
+
     data = {}
     data['Coment'] = {
         '1/3': ti('write_text_additional_track_start'),
@@ -357,20 +465,29 @@ def WriteCameraAnimationTracks(obj, target_frame_start=None, target_frame_end=No
         'frame_end': target_frame_end,
     })
 
-    camera_tracks = CameraDataAtFrame()
-    camera_tracks.EvaluateTracks(obj, target_frame_start, target_frame_end)
-
-    data['Camera transform'] = camera_tracks.transform_track
-    data["Camera NearClippingPlane"] = camera_tracks.near_clipping_plane
-    data["Camera FarClippingPlane"] = camera_tracks.far_clipping_plane
-    data["Camera FieldOfView"] = camera_tracks.fov
-    data["Camera FocalAngle"] = camera_tracks.angle
-    data['Camera FocalLength'] = camera_tracks.lens
-    data['Camera SensorWidth'] = camera_tracks.sensor_width
-    data['Camera SensorHeight'] = camera_tracks.sensor_height
-    data['Camera FocusDistance'] = camera_tracks.focus_distance
-    data['Camera Aperture'] = camera_tracks.aperture_fstop
-    data['Camera Spawned'] = camera_tracks.hide_viewport
+    camera_tracks = MyBakedCameraTracks.GetTracks(obj, target_frame_start, target_frame_end)
+    if camera_tracks is None:
+        camera_tracks = BakeCamerasAnimationTracks([obj], target_frame_start, target_frame_end)[obj.name]
+
+    if columnar:
+        data["track_format"] = "columnar"
+        data["frames"] = camera_tracks.frames
+        data['Camera transform'] = camera_tracks.GetTransformColumns()
+        GetTrack = camera_tracks.GetColumn
+    else:
+        data['Camera transform'] = camera_tracks.transform_track
+        GetTrack = camera_tracks.GetTrack
+
+    data["Camera NearClippingPlane"] = GetTrack("near_clipping_plane")
+    data["Camera FarClippingPlane"] = GetTrack("far_clipping_plane")
+    data["Camera FieldOfView"] = GetTrack("fov")
+    data["Camera FocalAngle"] = GetTrack("angle")
+    data['Camera FocalLength'] = GetTrack("lens")
+    data['Camera SensorWidth'] = GetTrack("sensor_width")
+    data['Camera SensorHeight'] = GetTrack("sensor_height")
+    data['Camera FocusDistance'] = GetTrack("focus_distance")
+    data['Camera Aperture'] = GetTrack("aperture_fstop")
+    data['Camera Spawned'] = GetTrack("hide_viewport")
 
     return data
 
@@ -397,21 +514,11 @@ def WriteSingleMeshAdditionalParameter(unreal_exported_asset):
     # Level of detail
     if obj:
         data['LevelOfDetail'] = {}
-        if obj.Ue4Lod1 is not None:
-            loc = os.path.join(GetObjExportDir(obj.Ue4Lod1, True), GetObjExportFileName(obj.Ue4Lod1))
-            data['LevelOfDetail']['lod_1'] = loc
-        if obj.Ue4Lod2 is not None:
-            loc = os.path.join(GetObjExportDir(obj.Ue4Lod2, True), GetObjExportFileName(obj.Ue4Lod2))
-            data['LevelOfDetail']['lod_2'] = loc
-        if obj.Ue4Lod3 is not None:
-            loc = os.path.join(GetObjExportDir(obj.Ue4Lod3, True), GetObjExportFileName(obj.Ue4Lod3))
-            data['LevelOfDetail']['lod_3'] = loc
-        if obj.Ue4Lod4 is not None:
-            loc = os.path.join(GetObjExportDir(obj.Ue4Lod4, True), GetObjExportFileName(obj.Ue4Lod4))
-            data['LevelOfDetail']['lod_4'] = loc
-        if obj.Ue4Lod5 is not None:
-            loc = os.path.join(GetObjExportDir(obj.Ue4Lod5, True), GetObjExportFileName(obj.Ue4Lod5))
-            data['LevelOfDetail']['lod_5'] = loc
+        for lod_number, lod in GetObjLods(obj):
+            loc = os.path.join(GetObjExportDir(lod, True), GetObjExportFileName(lod))
+            data['LevelOfDetail']['lod_'+str(lod_number)] = loc
+        # The lods of a lod chain are imported directly in the lod slots
+        data['LodChain'] = addon_prefs.exportLodChain and GetAssetType(obj) == "StaticMesh"
 
     # Sockets
     if obj:
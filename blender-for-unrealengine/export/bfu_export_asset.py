@@ -20,6 +20,8 @@ if "bpy" in locals():
     import importlib
     if "bfu_write_text" in locals():
         importlib.reload(bfu_write_text)
+    if "bfu_check_potential_error" in locals():
+        importlib.reload(bfu_check_potential_error)
     if "bfu_basics" in locals():
         importlib.reload(bfu_basics)
     if "bfu_utils" in locals():
@@ -38,14 +40,27 @@ if "bpy" in locals():
         importlib.reload(bfu_export_single_static_mesh)
     if "bfu_export_single_static_mesh_collection" in locals():
         importlib.reload(bfu_export_single_static_mesh_collection)
+    if "bfu_export_utils" in locals():
+        importlib.reload(bfu_export_utils)
+    if "bfu_export_incremental" in locals():
+        importlib.reload(bfu_export_incremental)
+    if "bfu_export_parallel" in locals():
+        importlib.reload(bfu_export_parallel)
+    if "bfu_export_profiler" in locals():
+        importlib.reload(bfu_export_profiler)
 
 import bpy
+import os
+import sys
+import json
 import time
 import math
+import argparse
 
 import addon_utils
 
 from .. import bfu_write_text
+from .. import bfu_check_potential_error
 from .. import bfu_basics
 from ..bfu_basics import *
 from .. import bfu_utils
@@ -67,6 +82,11 @@ from . import bfu_export_single_static_mesh
 from .bfu_export_single_static_mesh import *
 from . import bfu_export_single_static_mesh_collection
 from .bfu_export_single_static_mesh_collection import *
+from . import bfu_export_utils
+from . import bfu_export_incremental
+from . import bfu_export_parallel
+from . import bfu_export_profiler
+from .bfu_export_profiler import ExportSpan
 
 
 class ExportSigleObjects():
@@ -132,8 +152,35 @@ def IsValidObjectForExport(scene, obj):
     return False
 
 
-def ExportAllAssetByList(targetobjects, targetActionName, targetcollection):
+def GetStaticMeshLodChains(targetobjects):
+    # Returns a dict StaticMesh: [(lod number, lod object)] of the lods exported with the StaticMesh
+    # Only the lods that are exported as lod (ExportAsLod) are in the chains.
+
+    scene = bpy.context.scene
+    addon_prefs = GetAddonPrefs()
+    lod_chains = {}
+    if not addon_prefs.exportLodChain:
+        return lod_chains
+
+    exported_objects = set(targetobjects)
+
+    def IsExportedStaticMesh(obj):
+        if obj.ExportEnum == "export_recursive" and obj in exported_objects:
+            return GetAssetType(obj) == "StaticMesh" and IsValidObjectForExport(scene, obj)
+        return False
+
+    for obj in targetobjects:
+        if IsExportedStaticMesh(obj) and not obj.ExportAsLod:
+            lods = [(lod_number, lod) for lod_number, lod in GetObjLods(obj) if lod.ExportAsLod and IsExportedStaticMesh(lod)]
+            if len(lods) > 0:
+                lod_chains[obj] = lods
+    return lod_chains
+
+
+def ExportAllAssetByList(targetobjects, targetActionName, targetcollection, manifest=None, asset_filter=None):
     # Export all objects that need to be exported from a list
+    # With a manifest, the assets that haven't changed since the last export are skipped
+    # asset_filter is a set of bfu_export_incremental.GetAssetKey() for export only a part of the assets
 
     if len(targetobjects) < 1 and len(targetcollection) < 1:
         return
@@ -149,35 +196,114 @@ def ExportAllAssetByList(targetobjects, targetActionName, targetcollection):
         exported_assets = len(scene.UnrealExportedAssetsList)
         remain_assets = exported_assets/NumberAssetToExport
 
-        wm = bpy.context.window_manager
+        if not bpy.app.background:
+            wm = bpy.context.window_manager
 
-        if remain_assets == NumberAssetToExport:
-            wm.progress_begin(0, remain_assets)
+            if remain_assets == NumberAssetToExport:
+                wm.progress_begin(0, remain_assets)
 
-        wm.progress_update(exported_assets)
+            wm.progress_update(exported_assets)
 
-        if remain_assets == 0:
-            wm.progress_end()
+            if remain_assets == 0:
+                wm.progress_end()
 
         UpdateProgress("Export assets", remain_assets, time)
 
+    def IsAssetFiltered(asset_type, target, action):
+        if asset_filter is not None:
+            if bfu_export_incremental.GetAssetKey(asset_type, target, action) not in asset_filter:
+                return True
+        return False
+
+    def IsAssetSkipped(asset_type, target, action):
+        if IsAssetFiltered(asset_type, target, action):
+            return True
+
+        if manifest is not None and manifest.IsAssetUpToDate(asset_type, target, action):
+            print("Skip unchanged asset:", target.name, action.name if action else "")
+            manifest.RestoreSkippedAsset(asset_type, target, action)
+            UpdateExportProgress()
+            return True
+        return False
+
+    def ProcessAsset(asset_type, target, action, process_function, *args):
+        span_name = asset_type + ": " + target.name
+        if action:
+            span_name += " | " + action.name
+        with ExportSpan(span_name, "asset"):
+            MyAsset = process_function(*args)
+
+        if manifest is not None:
+            manifest.RecordExportedAsset(asset_type, target, action, MyAsset)
+        UpdateExportProgress()
+
+    def ExportAsset(asset_type, target, action, process_function, *args):
+        if IsAssetSkipped(asset_type, target, action):
+            return
+
+        # Save current start/end frame
+        UserStartFrame = scene.frame_start
+        UserEndFrame = scene.frame_end
+
+        ProcessAsset(asset_type, target, action, process_function, *args)
+
+        # Resets previous start/end frame
+        scene.frame_start = UserStartFrame
+        scene.frame_end = UserEndFrame
+
+    def ExportActionBatch(obj, action_assets):
+        # Export all the actions of the armature with a single armature setup
+        action_assets = [(animType, action) for animType, action in action_assets if not IsAssetSkipped(animType, obj, action)]
+        if len(action_assets) == 0:
+            return
+
+        # Save current start/end frame
+        UserStartFrame = scene.frame_start
+        UserEndFrame = scene.frame_end
+
+        batch = ActionExportBatch(obj)
+        with ExportSpan("Prepare action batch"):
+            batch.Prepare([action for animType, action in action_assets])
+        for animType, action in action_assets:
+            ProcessAsset(animType, obj, action, ProcessActionExport, obj, action, batch)
+        with ExportSpan("Finish action batch"):
+            batch.Finish()
+
+        # Resets previous start/end frame
+        scene.frame_start = UserStartFrame
+        scene.frame_end = UserEndFrame
+
     UpdateExportProgress()
 
+    # Lods exported with their StaticMesh, see ExportStaticMeshLodChain()
+    lod_chains = GetStaticMeshLodChains(targetobjects)
+    lod_chain_members = set()
+    for lods in lod_chains.values():
+        for lod_number, lod in lods:
+            lod_chain_members.add(lod)
+
+    # Bake the additional tracks of all cameras with a single pass on the frames
+    if scene.text_AdditionalData and addon_prefs.useGeneratedScripts:
+        cameras_to_bake = []
+        for obj in targetobjects:
+            if obj.ExportEnum == "export_recursive" and not obj.ExportAsLod:
+                if GetAssetType(obj) == "Camera" and IsValidObjectForExport(scene, obj):
+                    if IsAssetFiltered("Camera", obj, None):
+                        continue
+                    if manifest is not None and manifest.IsAssetUpToDate("Camera", obj, None):
+                        continue
+                    cameras_to_bake.append(obj)
+        if len(cameras_to_bake) > 1:
+            frame_range = bfu_write_text.GetCameraAnimationTracksFrameRange()
+            with ExportSpan("Bake camera tracks"):
+                bfu_write_text.MyBakedCameraTracks.Bake(cameras_to_bake, frame_range[0], frame_range[1])
+
     # Export collections
     print("Start Export collection(s)")
     if scene.static_collection_export:
         for col in GetCollectionToExport(scene):
             if col.name in targetcollection:
-                # Save current start/end frame
-                UserStartFrame = scene.frame_start
-                UserEndFrame = scene.frame_end
-
-                ProcessCollectionExport(col)
-
-                # Resets previous start/end frame
-                scene.frame_start = UserStartFrame
-                scene.frame_end = UserEndFrame
-                UpdateExportProgress()
+                ExportAsset("Collection StaticMesh", col, None, ProcessCollectionExport, col)
 
     # Export assets
     for obj in targetobjects:
@@ -186,59 +312,30 @@ def ExportAllAssetByList(targetobjects, targetActionName, targetcollection):
             # Camera
             print("Start Export camera(s)")
             if GetAssetType(obj) == "Camera" and IsValidObjectForExport(scene, obj):
-                # Save current start/end frame
-                UserStartFrame = scene.frame_start
-                UserEndFrame = scene.frame_end
-                ProcessCameraExport(obj)
-
-                # Resets previous start/end frame
-                scene.frame_start = UserStartFrame
-                scene.frame_end = UserEndFrame
-                UpdateExportProgress()
+                ExportAsset("Camera", obj, None, ProcessCameraExport, obj)
 
             # StaticMesh
             print("Start Export StaticMesh(s)")
             if GetAssetType(obj) == "StaticMesh" and IsValidObjectForExport(scene, obj):
-
-                # Save current start/end frame
-                UserStartFrame = scene.frame_start
-                UserEndFrame = scene.frame_end
-                ProcessStaticMeshExport(obj)
-
-                # Resets previous start/end frame
-                scene.frame_start = UserStartFrame
-                scene.frame_end = UserEndFrame
-                UpdateExportProgress()
+                if obj in lod_chains:
+                    ExportAsset("StaticMesh", obj, None, ProcessStaticMeshExport, obj, lod_chains[obj])
+                elif obj not in lod_chain_members:
+                    ExportAsset("StaticMesh", obj, None, ProcessStaticMeshExport, obj)
 
             # SkeletalMesh
             print("Start Export SkeletalMesh(s)")
             if GetAssetType(obj) == "SkeletalMesh" and IsValidObjectForExport(scene, obj):
-                # Save current start/end frame
-                UserStartFrame = scene.frame_start
-                UserEndFrame = scene.frame_end
-                ProcessSkeletalMeshExport(obj)
-
-                # Resets previous start/end frame
-                scene.frame_start = UserStartFrame
-                scene.frame_end = UserEndFrame
-                UpdateExportProgress()
+                ExportAsset("SkeletalMesh", obj, None, ProcessSkeletalMeshExport, obj)
 
             # Alembic
             print("Start Export Alembic(s)")
             if GetAssetType(obj) == "Alembic" and IsValidObjectForExport(scene, obj):
-                # Save current start/end frame
-                UserStartFrame = scene.frame_start
-                UserEndFrame = scene.frame_end
-                ProcessAlembicExport(obj)
-
-                # Resets previous start/end frame
-                scene.frame_start = UserStartFrame
-                scene.frame_end = UserEndFrame
-                UpdateExportProgress()
+                ExportAsset("Alembic", obj, None, ProcessAlembicExport, obj)
 
             # Action animation
             print("Start Export Action(s)")
             if GetAssetType(obj) == "SkeletalMesh" and obj.visible_get():
+                action_assets = []
                 for action in GetActionToExport(obj):
                     if action.name in targetActionName:
                         animType = GetActionType(action)
@@ -246,76 +343,85 @@ def ExportAllAssetByList(targetobjects, targetActionName, targetcollection):
                         # Action and Pose
                         if IsValidActionForExport(scene, obj, animType):
                             if animType == "Action" or animType == "Pose":
-                                # Save current start/end frame
-                                UserStartFrame = scene.frame_start
-                                UserEndFrame = scene.frame_end
-                                ProcessActionExport(obj, action)
+                                action_assets.append((animType, action))
 
-                                # Resets previous start/end frame
-                                scene.frame_start = UserStartFrame
-                                scene.frame_end = UserEndFrame
-                                UpdateExportProgress()
+                if len(action_assets) > 1 and GetCanUseActionExportBatch(obj):
+                    ExportActionBatch(obj, action_assets)
+                else:
+                    for animType, action in action_assets:
+                        ExportAsset(animType, obj, action, ProcessActionExport, obj, action)
 
                 # NLA animation
                 print("Start Export NLA(s)")
                 if IsValidActionForExport(scene, obj, "NLA"):
                     if obj.bfu_anim_nla_use:
-                        # Save current start/end frame
-                        UserStartFrame = scene.frame_start
-                        UserEndFrame = scene.frame_end
-
-                        ProcessNLAAnimExport(obj)
-                        # Resets previous start/end frame
-                        scene.frame_start = UserStartFrame
-                        scene.frame_end = UserEndFrame
+                        ExportAsset("NlAnim", obj, None, ProcessNLAAnimExport, obj)
 
+    bfu_write_text.MyBakedCameraTracks.Clear()
     UpdateExportProgress(counter.GetTime())
 
 
-def ExportForUnrealEngine():
+def ExportForUnrealEngine(asset_filter=None, manifest=None):
+    # asset_filter and manifest are used by the export workers (see bfu_export_parallel)
     scene = bpy.context.scene
     addon_prefs = GetAddonPrefs()
+    is_export_worker = asset_filter is not None
+    profiler = bfu_export_profiler.MyExportProfiler
+
+    if addon_prefs.exportProfiling:
+        profiler.Start(addon_prefs.exportProfilingMemory)
+    else:
+        profiler.Clear()
+
+    with ExportSpan("Prepare scene"):
+        local_view_areas = MoveToGlobalView()
+
+        MyCurrentDataSave = bbpl.utils.UserSceneSave()
+        MyCurrentDataSave.SaveCurrentScene()
 
-    local_view_areas = MoveToGlobalView()
-
-    MyCurrentDataSave = bbpl.utils.UserSceneSave()
-    MyCurrentDataSave.SaveCurrentScene()
-
-    for obj in bpy.data.objects:
-        if obj.hide_select:
-            obj.hide_select = False
-        if obj.hide_viewport:
-            obj.hide_viewport = False
-        if obj.hide_get():
-            obj.hide_set(False)
-
-    for col in bpy.data.collections:
-        if col.hide_select:
-            col.hide_select = False
-        if col.hide_viewport:
-            col.hide_viewport = False
-
-    for vlayer in bpy.context.scene.view_layers:
-        layer_collections = bbpl.utils.getLayerCollectionsRecursive(vlayer.layer_collection)
-        for layer_collection in layer_collections:
-            if layer_collection.exclude:
-                layer_collection.exclude = False
-            if layer_collection.hide_viewport:
-                layer_collection.hide_viewport = False
-
-    bbpl.utils.SafeModeSet('OBJECT', MyCurrentDataSave.user_select_class.user_active)
-
-    if addon_prefs.revertExportPath:
-        RemoveFolderTree(bpy.path.abspath(scene.export_static_file_path))
-        RemoveFolderTree(bpy.path.abspath(scene.export_skeletal_file_path))
-        RemoveFolderTree(bpy.path.abspath(scene.export_alembic_file_path))
-        RemoveFolderTree(bpy.path.abspath(scene.export_camera_file_path))
-        RemoveFolderTree(bpy.path.abspath(scene.export_other_file_path))
+        bbpl.utils.SafeModeSet('OBJECT', MyCurrentDataSave.user_select_class.user_active)
+
+        # The incremental export needs the previous exported files
+        if addon_prefs.revertExportPath and not is_export_worker and not scene.bfu_export_incremental:
+            RemoveFolderTree(bpy.path.abspath(scene.export_static_file_path))
+            RemoveFolderTree(bpy.path.abspath(scene.export_skeletal_file_path))
+            RemoveFolderTree(bpy.path.abspath(scene.export_alembic_file_path))
+            RemoveFolderTree(bpy.path.abspath(scene.export_camera_file_path))
+            RemoveFolderTree(bpy.path.abspath(scene.export_other_file_path))
 
     obj_list = []  # Do a simple list of Objects to export
     action_list = []  # Do a simple list of Action to export
     col_list = []  # Do a simple list of Collection to export
-    AssetToExport = GetFinalAssetToExport()
+
+    with ExportSpan("Get assets to export"):
+        AssetToExport = GetFinalAssetToExport()
+
+        use_manifest = scene.bfu_export_incremental and not is_export_worker
+        if use_manifest:
+            manifest = bfu_export_incremental.ExportManifest()
+            manifest.Load()
+            manifest.ComputeFingerprints(AssetToExport)
+
+    if addon_prefs.exportWorkerCount > 1 and not is_export_worker:
+        # Workers export the assets in parallel, only the failed shards are exported here
+        with ExportSpan("Export with workers"):
+            AssetToExport = bfu_export_parallel.ExportAssetsWithWorkers(
+                AssetToExport,
+                addon_prefs.exportWorkerCount,
+                manifest,
+                addon_prefs.exportWorkerTimeout * 60)
+        asset_filter = set()
+        for Asset in AssetToExport:
+            asset_filter.add(bfu_export_incremental.GetAssetKey(Asset.type, Asset.obj, Asset.action))
+
+    with ExportSpan("Unhide export objects"):
+        # Only the objects to export are unhidden, they are restored by ResetSceneAtSave()
+        needed_assets = []
+        for Asset in AssetToExport:
+            if asset_filter is None or bfu_export_incremental.GetAssetKey(Asset.type, Asset.obj, Asset.action) in asset_filter:
+                needed_assets.append(Asset)
+        for obj in GetExportNeededObjects(needed_assets):
+            MyCurrentDataSave.journal.SetObjectVisible(obj)
 
     for Asset in AssetToExport:
         if Asset.type == "Action" or Asset.type == "Pose":
@@ -332,18 +438,234 @@ def ExportForUnrealEngine():
             if Asset.obj not in obj_list:
                 obj_list.append(Asset.obj)
 
-    ExportAllAssetByList(
-        targetobjects=obj_list,
-        targetActionName=action_list,
-        targetcollection=col_list,
-    )
-
-    MyCurrentDataSave.ResetSelectByName()
-    MyCurrentDataSave.ResetSceneAtSave()
-
-    # Clean actions
-    for action in bpy.data.actions:
-        if action.name not in MyCurrentDataSave.action_names:
-            bpy.data.actions.remove(action)
+    with ExportSpan("Export assets"):
+        ExportAllAssetByList(
+            targetobjects=obj_list,
+            targetActionName=action_list,
+            targetcollection=col_list,
+            manifest=manifest,
+            asset_filter=asset_filter,
+        )
+        bfu_export_utils.MyExportStaging.Remove()
+
+    if use_manifest:
+        manifest.Save()
+
+    with ExportSpan("Restore scene"):
+        MyCurrentDataSave.ResetSelectByName()
+        MyCurrentDataSave.ResetSceneAtSave()
+
+        # Clean actions
+        for action in list(bpy.data.actions):
+            if action.name not in MyCurrentDataSave.action_names:
+                bpy.data.actions.remove(action)
+
+        MoveToLocalView(local_view_areas)
+
+    if profiler.enabled:
+        profiler.Stop()
+        if not is_export_worker:
+            # Can be opened with chrome://tracing or https://ui.perfetto.dev
+            bfu_write_text.ExportSingleJson(
+                profiler.GetTraceData(),
+                scene.export_other_file_path,
+                "ExportProfile.json",
+                compact=True)
+
+
+# Command line export
+# Usage example:
+# blender -b scene.blend --python-expr "import importlib;
+# importlib.import_module('blender-for-unrealengine.export.bfu_export_asset').CommandLineExportMain()"
+# -- --asset-types static_mesh,skeletal_mesh --export-path-other C:/Export --summary C:/Export/summary.json
+
+EXIT_SUCCESS = 0
+EXIT_EXPORT_FAILED = 1
+EXIT_NO_ASSET_TO_EXPORT = 2
+EXIT_INVALID_ARGUMENTS = 3
+EXIT_FBX_ADDON_NOT_ACTIVATED = 4
+EXIT_TWEAKMODE = 5
+
+command_line_asset_types = {
+    # Argument name : Scene property
+    "static_mesh": "static_export",
+    "collection": "static_collection_export",
+    "skeletal_mesh": "skeletal_export",
+    "animation": "anin_export",
+    "alembic": "alembic_export",
+    "camera": "camera_export",
+}
+
+command_line_export_paths = {
+    # Argument name : Scene property
+    "static": "export_static_file_path",
+    "skeletal": "export_skeletal_file_path",
+    "alembic": "export_alembic_file_path",
+    "camera": "export_camera_file_path",
+    "other": "export_other_file_path",
+}
+
+
+def GetCommandLineExportParser():
+    parser = argparse.ArgumentParser(
+        prog="blender -b file.blend --python-expr \"...CommandLineExportMain()\" --",
+        description="Export the assets of the scene for Unreal Engine.")
+    parser.add_argument(
+        "--filter",
+        choices=["default", "only_object", "only_object_action"],
+        help="Selection filter, use the value saved in the scene by default.")
+    parser.add_argument(
+        "--asset-types",
+        help="Comma separated list of asset types to export: " + ", ".join(command_line_asset_types) +
+        ". Use the values saved in the scene by default.")
+    for path_name in command_line_export_paths:
+        parser.add_argument(
+            "--export-path-" + path_name,
+            help="Override the " + path_name + " export path.")
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Skip the assets that haven't changed since the last export.")
+    parser.add_argument(
+        "--no-text-files",
+        action="store_true",
+        help="Don't write the export log and import scripts.")
+    parser.add_argument(
+        "--summary",
+        help="Write the json export summary at this path.")
+    return parser
+
+
+def GetCommandLineArguments(argv=None):
+    # Blender ignores the arguments after "--"
+    if argv is None:
+        argv = sys.argv
+    if "--" in argv:
+        return argv[argv.index("--") + 1:]
+    return []
+
+
+def GetExportSummary(exit_code, message, export_time):
+    scene = bpy.context.scene
+    summary = {}
+    summary["exit_code"] = exit_code
+    summary["message"] = message
+    summary["blend_file"] = bpy.data.filepath
+    summary["export_time"] = round(export_time, 4)
+    summary["assets"] = []
+    for asset in scene.UnrealExportedAssetsList:
+        asset_summary = {}
+        asset_summary["name"] = asset.asset_name
+        asset_summary["type"] = asset.asset_type
+        asset_summary["success"] = asset.export_success
+        asset_summary["skipped"] = asset.export_skipped
+        asset_summary["export_time"] = round(asset.GetExportTime(), 4)
+        asset_summary["files"] = [file.GetAbsolutePath() for file in asset.files]
+        summary["assets"].append(asset_summary)
+    summary["asset_number"] = len(summary["assets"])
+    summary["failed_asset_number"] = len([a for a in summary["assets"] if not a["success"]])
+    summary["skipped_asset_number"] = len([a for a in summary["assets"] if a["skipped"]])
+    return summary
+
+
+def ExportForUnrealEngineFromCommandLine(
+        export_filter=None,
+        asset_types=None,
+        export_paths=None,
+        incremental=False,
+        write_text_files=True,
+        ):
+    # Export without the UI checks of the export operator.
+    # asset_types is a list of keys of command_line_asset_types, None use the scene settings.
+    # export_paths is a dict with the keys of command_line_export_paths.
+    # Returns the exit code and a summary dict.
 
-    MoveToLocalView(local_view_areas)
+    scene = bpy.context.scene
+    counter = CounterTimer()
+    scene.UnrealExportedAssetsList.clear()
+
+    if export_filter is not None:
+        scene.bfu_export_selection_filter = export_filter
+
+    if asset_types is not None:
+        for type_name in asset_types:
+            if type_name not in command_line_asset_types:
+                message = "Unknown asset type: " + type_name
+                return EXIT_INVALID_ARGUMENTS, GetExportSummary(EXIT_INVALID_ARGUMENTS, message, counter.GetTime())
+        for type_name, prop_name in command_line_asset_types.items():
+            setattr(scene, prop_name, type_name in asset_types)
+
+    if export_paths is not None:
+        for path_name, path in export_paths.items():
+            setattr(scene, command_line_export_paths[path_name], path)
+
+    scene.bfu_export_incremental = incremental
+
+    if not CheckPluginIsActivated("io_scene_fbx"):
+        addon_utils.enable("io_scene_fbx", default_set=False)
+        if not CheckPluginIsActivated("io_scene_fbx"):
+            message = "Add-on FBX format is not activated!"
+            return EXIT_FBX_ADDON_NOT_ACTIVATED, GetExportSummary(EXIT_FBX_ADDON_NOT_ACTIVATED, message, counter.GetTime())
+
+    if bbpl.basics.IsTweakmode():
+        message = "Exit Tweakmode in NLA Editor before export."
+        return EXIT_TWEAKMODE, GetExportSummary(EXIT_TWEAKMODE, message, counter.GetTime())
+
+    if len(GetFinalAssetToExport()) == 0:
+        message = "Not found assets with \"Export recursive\" properties or collection to export."
+        return EXIT_NO_ASSET_TO_EXPORT, GetExportSummary(EXIT_NO_ASSET_TO_EXPORT, message, counter.GetTime())
+
+    bfu_check_potential_error.UpdateNameHierarchy()
+    ExportForUnrealEngine()
+    if write_text_files:
+        bfu_write_text.WriteAllTextFiles()
+
+    for asset in scene.UnrealExportedAssetsList:
+        if not asset.export_success:
+            message = "Export failed for some assets."
+            return EXIT_EXPORT_FAILED, GetExportSummary(EXIT_EXPORT_FAILED, message, counter.GetTime())
+
+    message = "Export of " + str(len(scene.UnrealExportedAssetsList)) + " asset(s) has been finalized."
+    return EXIT_SUCCESS, GetExportSummary(EXIT_SUCCESS, message, counter.GetTime())
+
+
+def CommandLineExportMain(argv=None):
+    # Entry point for blender --python-expr, exit Blender with the export exit code
+    parser = GetCommandLineExportParser()
+    try:
+        args = parser.parse_args(GetCommandLineArguments(argv))
+    except SystemExit:
+        sys.exit(EXIT_INVALID_ARGUMENTS)
+
+    asset_types = None
+    if args.asset_types:
+        asset_types = [name.strip() for name in args.asset_types.split(",") if name.strip()]
+
+    export_paths = {}
+    for path_name in command_line_export_paths:
+        path = getattr(args, "export_path_" + path_name)
+        if path:
+            export_paths[path_name] = path
+
+    try:
+        exit_code, summary = ExportForUnrealEngineFromCommandLine(
+            export_filter=args.filter,
+            asset_types=asset_types,
+            export_paths=export_paths,
+            incremental=args.incremental,
+            write_text_files=not args.no_text_files,
+            )
+    except Exception as error:
+        import traceback
+        traceback.print_exc()
+        exit_code = EXIT_EXPORT_FAILED
+        summary = GetExportSummary(exit_code, "Export error: " + str(error), 0)
+
+    summary_text = json.dumps(summary, ensure_ascii=False, indent=4)
+    if args.summary:
+        summary_dir = os.path.dirname(os.path.abspath(args.summary))
+        VerifiDirs(summary_dir)
+        with open(args.summary, 'w') as json_file:
+            json_file.write(summary_text)
+    print(summary_text)
+    sys.exit(exit_code)
@@ -0,0 +1,526 @@
+# ====================== BEGIN GPL LICENSE BLOCK ============================
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.	 See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.	 If not, see <http://www.gnu.org/licenses/>.
+#  All rights reserved.
+#
+# ======================= END GPL LICENSE BLOCK =============================
+
+import bpy
+import os
+import sys
+import json
+import hashlib
+import numpy
+
+if "bpy" in locals():
+    import importlib
+    if "bfu_basics" in locals():
+        importlib.reload(bfu_basics)
+    if "bfu_utils" in locals():
+        importlib.reload(bfu_utils)
+
+from .. import bfu_basics
+from ..bfu_basics import *
+from .. import bfu_utils
+from ..bfu_utils import *
+
+
+manifest_filename = "ExportManifest.json"
+manifest_version = 1
+
+# Properties that change when the addon prepare the scene for export
+# or only affect the viewport. They are not used to fingerprint assets.
+ignored_property_prefix = ("hide_", "select", "show_", "active_")
+ignored_property_suffix = ("_expanded",)
+ignored_scene_properties = ("frame_current", "frame_current_final", "frame_float")
+
+
+def IsIgnoredProperty(identifier):
+    if identifier.startswith(ignored_property_prefix):
+        return True
+    if identifier.endswith(ignored_property_suffix):
+        return True
+    return False
+
+
+def GetHashableValue(value):
+    # Convert a rna value to a stable python value for the hash
+
+    if isinstance(value, bpy.types.ID):
+        return value.name
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    if isinstance(value, (set, frozenset)):
+        return tuple(sorted(value))
+    if hasattr(value, "__len__"):
+        try:
+            return tuple(GetHashableValue(v) for v in value)
+        except TypeError:
+            pass
+    return str(value)
+
+
+def UpdateHashWithProperties(hasher, rna_struct, ignore=()):
+    # Hash all editable rna properties of a struct (Object, Modifier, AddonPreferences...)
+
+    if rna_struct is None:
+        hasher.update(b"None")
+        return
+
+    for prop in rna_struct.bl_rna.properties:
+        identifier = prop.identifier
+        if prop.is_readonly or identifier == "rna_type":
+            continue
+        if identifier in ignore or IsIgnoredProperty(identifier):
+            continue
+        if prop.type == "COLLECTION":
+            continue
+        if prop.type == "POINTER" and not isinstance(getattr(rna_struct, identifier, None), bpy.types.ID):
+            continue
+        try:
+            value = GetHashableValue(getattr(rna_struct, identifier))
+        except Exception:
+            continue
+        hasher.update(identifier.encode())
+        hasher.update(repr(value).encode())
+
+
+def UpdateHashWithCollection(hasher, collection, attribute, item_size, dtype=numpy.float32):
+    # Read a full bpy_prop_collection attribute in one call and hash the raw bytes
+    array = numpy.empty(len(collection) * item_size, dtype=dtype)
+    collection.foreach_get(attribute, array)
+    hasher.update(array.tobytes())
+
+
+def UpdateHashWithMesh(hasher, mesh):
+    UpdateHashWithCollection(hasher, mesh.vertices, "co", 3)
+    UpdateHashWithCollection(hasher, mesh.edges, "vertices", 2, numpy.int32)
+    UpdateHashWithCollection(hasher, mesh.loops, "vertex_index", 1, numpy.int32)
+    UpdateHashWithCollection(hasher, mesh.polygons, "loop_total", 1, numpy.int32)
+    UpdateHashWithCollection(hasher, mesh.polygons, "material_index", 1, numpy.int32)
+    UpdateHashWithCollection(hasher, mesh.polygons, "use_smooth", 1, numpy.bool_)
+
+    for uv_layer in mesh.uv_layers:
+        hasher.update(uv_layer.name.encode())
+        UpdateHashWithCollection(hasher, uv_layer.data, "uv", 2)
+
+    if hasattr(mesh, "vertex_colors"):
+        for vertex_color in mesh.vertex_colors:
+            hasher.update(vertex_color.name.encode())
+            UpdateHashWithCollection(hasher, vertex_color.data, "color", 4)
+
+    if mesh.shape_keys:
+        for key_block in mesh.shape_keys.key_blocks:
+            hasher.update(key_block.name.encode())
+            UpdateHashWithCollection(hasher, key_block.data, "co", 3)
+
+    for material in mesh.materials:
+        hasher.update(repr(GetHashableValue(material)).encode())
+
+    UpdateHashWithProperties(hasher, mesh)
+
+
+def UpdateHashWithVertexWeights(hasher, obj):
+    # Vertex weights are not exposed to foreach_get, they need a python loop
+    if obj.type != "MESH" or len(obj.vertex_groups) == 0:
+        return
+
+    for vertex_group in obj.vertex_groups:
+        hasher.update(vertex_group.name.encode())
+
+    weights = []
+    for vertex in obj.data.vertices:
+        for group in vertex.groups:
+            weights.append((vertex.index, group.group, group.weight))
+    hasher.update(numpy.array(weights, dtype=numpy.float64).tobytes())
+
+
+def UpdateHashWithArmature(hasher, obj):
+    armature = obj.data
+    for bone in armature.bones:
+        hasher.update(bone.name.encode())
+        hasher.update(repr(GetHashableValue(bone.matrix_local)).encode())
+        hasher.update(repr(GetHashableValue(bone.tail_local)).encode())
+        hasher.update(repr((bone.parent.name if bone.parent else None, bone.use_deform)).encode())
+    UpdateHashWithProperties(hasher, armature)
+
+    for pose_bone in obj.pose.bones:
+        UpdateHashWithProperties(hasher, pose_bone)
+        for constraint in pose_bone.constraints:
+            UpdateHashWithProperties(hasher, constraint)
+
+
+def UpdateHashWithAction(hasher, action):
+    if action is None:
+        hasher.update(b"None")
+        return
+
+    hasher.update(action.name.encode())
+    UpdateHashWithProperties(hasher, action)
+    for fcurve in action.fcurves:
+        hasher.update(fcurve.data_path.encode())
+        hasher.update(str(fcurve.array_index).encode())
+        hasher.update(repr((fcurve.extrapolation, fcurve.mute)).encode())
+        keyframes = fcurve.keyframe_points
+        UpdateHashWithCollection(hasher, keyframes, "co", 2)
+        UpdateHashWithCollection(hasher, keyframes, "handle_left", 2)
+        UpdateHashWithCollection(hasher, keyframes, "handle_right", 2)
+        hasher.update(repr([key.interpolation for key in keyframes]).encode())
+        for modifier in fcurve.modifiers:
+            UpdateHashWithProperties(hasher, modifier)
+
+
+def UpdateHashWithAnimationData(hasher, animation_data):
+    if animation_data is None:
+        hasher.update(b"None")
+        return
+
+    UpdateHashWithAction(hasher, animation_data.action)
+    for nla_track in animation_data.nla_tracks:
+        UpdateHashWithProperties(hasher, nla_track)
+        for strip in nla_track.strips:
+            UpdateHashWithProperties(hasher, strip)
+            UpdateHashWithAction(hasher, strip.action)
+
+
+def UpdateHashWithCurve(hasher, curve):
+    for spline in curve.splines:
+        hasher.update(spline.type.encode())
+        UpdateHashWithCollection(hasher, spline.points, "co", 4)
+        UpdateHashWithCollection(hasher, spline.bezier_points, "co", 3)
+        UpdateHashWithCollection(hasher, spline.bezier_points, "handle_left", 3)
+        UpdateHashWithCollection(hasher, spline.bezier_points, "handle_right", 3)
+    UpdateHashWithProperties(hasher, curve)
+
+
+def GetReferencedObjects(obj):
+    # Objects used by the modifiers and the constraints (Boolean cutter, Shrinkwrap target, Armature...)
+
+    def GetStructObjects(rna_struct):
+        struct_objects = []
+        for prop in rna_struct.bl_rna.properties:
+            if prop.type == "POINTER" and prop.fixed_type.identifier == "Object":
+                value = getattr(rna_struct, prop.identifier)
+                if value is not None:
+                    struct_objects.append(value)
+        return struct_objects
+
+    constraints = list(obj.constraints)
+    if obj.pose is not None:
+        for pose_bone in obj.pose.bones:
+            constraints.extend(pose_bone.constraints)
+
+    referenced_objects = []
+    for modifier in obj.modifiers:
+        referenced_objects.extend(GetStructObjects(modifier))
+    for constraint in constraints:
+        referenced_objects.extend(GetStructObjects(constraint))
+        for constraint_target in getattr(constraint, "targets", []):
+            referenced_objects.extend(GetStructObjects(constraint_target))
+    return referenced_objects
+
+
+def UpdateHashWithObject(hasher, obj, use_geometry=True, visited=None):
+    # visited contains the names of the objects already hashed in this fingerprint
+
+    if visited is None:
+        visited = set()
+    hasher.update(obj.name.encode())
+    if obj.name in visited:
+        return
+    visited.add(obj.name)
+
+    hasher.update(obj.type.encode())
+    hasher.update(repr(GetHashableValue(obj.matrix_world)).encode())
+    hasher.update(repr(obj.parent.name if obj.parent else None).encode())
+    hasher.update(repr(obj.parent_bone).encode())
+    UpdateHashWithProperties(hasher, obj)
+
+    for modifier in obj.modifiers:
+        UpdateHashWithProperties(hasher, modifier)
+    for constraint in obj.constraints:
+        UpdateHashWithProperties(hasher, constraint)
+    for material_slot in obj.material_slots:
+        hasher.update(repr(GetHashableValue(material_slot.material)).encode())
+    for key, value in obj.items():
+        hasher.update(key.encode())
+        hasher.update(repr(GetHashableValue(value)).encode())
+
+    if obj.type == "ARMATURE":
+        UpdateHashWithArmature(hasher, obj)
+    elif obj.data is not None and isinstance(obj.data, bpy.types.ID):
+        if obj.type == "MESH":
+            if use_geometry:
+                UpdateHashWithMesh(hasher, obj.data)
+                UpdateHashWithVertexWeights(hasher, obj)
+            elif obj.data.shape_keys:
+                for key_block in obj.data.shape_keys.key_blocks:
+                    hasher.update(key_block.name.encode())
+        elif obj.type == "CURVE":
+            UpdateHashWithCurve(hasher, obj.data)
+        else:
+            UpdateHashWithProperties(hasher, obj.data)
+        UpdateHashWithAnimationData(hasher, getattr(obj.data, "animation_data", None))
+        if obj.type == "MESH" and obj.data.shape_keys:
+            UpdateHashWithAnimationData(hasher, obj.data.shape_keys.animation_data)
+
+    if obj.instance_type == "COLLECTION" and obj.instance_collection:
+        for instance_obj in obj.instance_collection.all_objects:
+            UpdateHashWithObject(hasher, instance_obj, use_geometry, visited)
+
+    # The result of the modifiers and constraints also depends on the objects they use
+    for referenced_obj in GetReferencedObjects(obj):
+        UpdateHashWithObject(hasher, referenced_obj, True, visited)
+
+
+def GetExportSettingsFingerprint():
+    # Scene settings, addon preferences and versions used by all assets
+
+    scene = bpy.context.scene
+    hasher = hashlib.sha1()
+    hasher.update(bpy.app.version_string.encode())
+    addon_module = sys.modules.get(__package__.split(".")[0])
+    if addon_module is not None and hasattr(addon_module, "bl_info"):
+        hasher.update(repr(addon_module.bl_info.get("version")).encode())
+    UpdateHashWithProperties(hasher, scene, ignore=ignored_scene_properties)
+    UpdateHashWithProperties(hasher, scene.render)
+    UpdateHashWithProperties(hasher, scene.unit_settings)
+    UpdateHashWithProperties(hasher, GetAddonPrefs())
+    return hasher.hexdigest()
+
+
+def GetAssetKey(asset_type, obj, action=None):
+    # Unique name of an asset in the manifest
+    # asset_type use the same names as GetFinalAssetToExport()
+    if isinstance(obj, str):  # Collection assets of GetFinalAssetToExport() use the collection name
+        key = asset_type + ":" + obj
+    else:
+        key = asset_type + ":" + obj.name
+    if isinstance(action, bpy.types.Action):  # NlAnim assets use the AnimData
+        key += ":" + action.name
+    return key
+
+
+def GetAssetFingerprint(asset, settings_fingerprint):
+    hasher = hashlib.sha1()
+    hasher.update(settings_fingerprint.encode())
+    hasher.update(asset.type.encode())
+
+    if asset.type == "Collection StaticMesh":
+        collection = GetAssetCollection(asset)
+        UpdateHashWithProperties(hasher, collection)
+        visited = set()
+        for obj in collection.all_objects:
+            UpdateHashWithObject(hasher, obj, True, visited)
+        return hasher.hexdigest()
+
+    obj = asset.obj
+    if asset.type in ["Action", "Pose", "NlAnim"]:
+        # Animations do not use the mesh geometry
+        use_geometry = False
+    else:
+        use_geometry = True
+
+    visited = set()
+    UpdateHashWithObject(hasher, obj, use_geometry, visited)
+    for child in GetExportDesiredChilds(obj):
+        UpdateHashWithObject(hasher, child, use_geometry, visited)
+    proxy_child = GetExportProxyChild(obj)
+    if proxy_child is not None:
+        UpdateHashWithObject(hasher, proxy_child, use_geometry, visited)
+
+    if asset.type == "StaticMesh" and GetAddonPrefs().exportLodChain:
+        # The lods can be exported with the StaticMesh
+        for lod_number, lod in GetObjLods(obj):
+            UpdateHashWithObject(hasher, lod, True, visited)
+            for child in GetExportDesiredChilds(lod):
+                UpdateHashWithObject(hasher, child, True, visited)
+
+    if asset.type in ["Action", "Pose"]:
+        UpdateHashWithAction(hasher, asset.action)
+        UpdateHashWithAnimationData(hasher, obj.animation_data)
+    elif asset.type in ["NlAnim", "Camera", "Alembic"]:
+        UpdateHashWithAnimationData(hasher, obj.animation_data)
+
+    if asset.type == "Camera":
+        scene = bpy.context.scene
+        for marker in scene.timeline_markers:
+            hasher.update(repr((marker.name, marker.frame, GetHashableValue(marker.camera))).encode())
+
+    return hasher.hexdigest()
+
+
+def GetFileState(path):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_size, stat.st_mtime]
+
+
+class FileHashCache():
+    # Content hash of the exported files.
+    # A file is hashed again only when its size or modification time changed.
+
+    def __init__(self):
+        self.hashes = {}
+
+    def GetHash(self, path):
+        state = GetFileState(path)
+        if state is None:
+            return None
+        cached = self.hashes.get(path)
+        if cached is not None and cached[0] == state:
+            return cached[1]
+
+        hasher = hashlib.sha1()
+        with open(path, 'rb') as file:
+            for chunk in iter(lambda: file.read(1048576), b""):
+                hasher.update(chunk)
+        file_hash = hasher.hexdigest()
+        self.hashes[path] = (state, file_hash)
+        return file_hash
+
+
+MyFileHashCache = FileHashCache()
+
+
+def ExportedAssetToRecord(unreal_exported_asset):
+    # Convert an item of scene.UnrealExportedAssetsList to a json compatible dict
+    record = {}
+    if unreal_exported_asset.object:
+        record["object"] = unreal_exported_asset.object.name
+    else:
+        record["object"] = None
+    if unreal_exported_asset.collection:
+        record["collection"] = unreal_exported_asset.collection.name
+    else:
+        record["collection"] = None
+    record["asset_name"] = unreal_exported_asset.asset_name
+    record["skeleton_name"] = unreal_exported_asset.skeleton_name
+    record["asset_type"] = unreal_exported_asset.asset_type
+    record["folder_name"] = unreal_exported_asset.folder_name
+    record["export_time"] = unreal_exported_asset.GetExportTime()
+    record["export_success"] = unreal_exported_asset.export_success
+    record["files"] = []
+    for file in unreal_exported_asset.files:
+        file_record = {}
+        file_record["name"] = file.name
+        file_record["path"] = file.path
+        file_record["type"] = file.type
+        file_record["state"] = GetFileState(file.GetAbsolutePath())
+        record["files"].append(file_record)
+    return record
+
+
+def AddExportedAssetFromRecord(record, skipped=False):
+    # Add a dict from ExportedAssetToRecord() in scene.UnrealExportedAssetsList
+    scene = bpy.context.scene
+
+    MyAsset = scene.UnrealExportedAssetsList.add()
+    if record.get("collection"):
+        MyAsset.collection = bpy.data.collections.get(record["collection"])
+    if record.get("object"):
+        MyAsset.object = bpy.data.objects.get(record["object"])
+    MyAsset.asset_name = record["asset_name"]
+    MyAsset.skeleton_name = record["skeleton_name"]
+    MyAsset.asset_type = record["asset_type"]
+    MyAsset.folder_name = record["folder_name"]
+    for file_record in record["files"]:
+        file = MyAsset.files.add()
+        file.name = file_record["name"]
+        file.path = file_record["path"]
+        file.type = file_record["type"]
+
+    MyAsset.StartAssetExport()
+    if skipped:
+        MyAsset.export_skipped = True
+        MyAsset.EndAssetExport(True)
+    else:
+        MyAsset.EndAssetExport(record.get("export_success", True))
+        MyAsset.export_start_time = MyAsset.export_end_time - record.get("export_time", 0)
+    return MyAsset
+
+
+class ExportManifest():
+    # Fingerprint of each exported asset stored next to the export log.
+    # Used to skip the assets that haven't changed since the last export.
+
+    def __init__(self):
+        self.assets = {}
+        self.fingerprints = {}
+        self.settings_fingerprint = ""
+
+    def GetManifestPath(self):
+        scene = bpy.context.scene
+        return os.path.join(bpy.path.abspath(scene.export_other_file_path), manifest_filename)
+
+    def Load(self):
+        self.assets = {}
+        path = self.GetManifestPath()
+        if not os.path.isfile(path):
+            return
+        try:
+            with open(path, 'r') as json_file:
+                data = json.load(json_file)
+        except (OSError, ValueError):
+            print("Export manifest is unreadable, all assets will be exported: ", path)
+            return
+        if data.get("version") == manifest_version:
+            self.assets = data.get("assets", {})
+
+    def Save(self):
+        absdirpath = bpy.path.abspath(bpy.context.scene.export_other_file_path)
+        VerifiDirs(absdirpath)
+        data = {}
+        data["version"] = manifest_version
+        data["assets"] = self.assets
+        with open(self.GetManifestPath(), 'w') as json_file:
+            json.dump(data, json_file, ensure_ascii=False, sort_keys=True, indent=4)
+
+    def ComputeFingerprints(self, assets):
+        # Need be called before the export because the export change the scene
+        self.fingerprints = {}
+        self.settings_fingerprint = GetExportSettingsFingerprint()
+        for asset in assets:
+            key = GetAssetKey(asset.type, asset.obj, asset.action)
+            self.fingerprints[key] = GetAssetFingerprint(asset, self.settings_fingerprint)
+
+    def IsAssetUpToDate(self, asset_type, obj, action=None):
+        key = GetAssetKey(asset_type, obj, action)
+        record = self.assets.get(key)
+        if record is None:
+            return False
+        if record.get("fingerprint") != self.fingerprints.get(key):
+            return False
+        if not record.get("files"):
+            return False
+        for file in record["files"]:
+            path = os.path.join(bpy.path.abspath(file["path"]), file["name"])
+            if GetFileState(path) != file["state"]:
+                return False
+        return True
+
+    def RestoreSkippedAsset(self, asset_type, obj, action=None):
+        # Add the asset from the last export in scene.UnrealExportedAssetsList
+        record = self.assets[GetAssetKey(asset_type, obj, action)]
+        return AddExportedAssetFromRecord(record, skipped=True)
+
+    def RecordExportedAsset(self, asset_type, obj, action, unreal_exported_asset):
+        key = GetAssetKey(asset_type, obj, action)
+        self.StoreRecord(key, ExportedAssetToRecord(unreal_exported_asset))
+
+    def StoreRecord(self, key, record):
+        record["fingerprint"] = self.fingerprints.get(key)
+        self.assets[key] = record
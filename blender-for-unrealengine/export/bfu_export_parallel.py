@@ -0,0 +1,231 @@
+# ====================== BEGIN GPL LICENSE BLOCK ============================
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.	 See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.	 If not, see <http://www.gnu.org/licenses/>.
+#  All rights reserved.
+#
+# ======================= END GPL LICENSE BLOCK =============================
+
+import bpy
+import os
+import json
+import time
+import shutil
+import tempfile
+import subprocess
+
+if "bpy" in locals():
+    import importlib
+    if "bfu_basics" in locals():
+        importlib.reload(bfu_basics)
+    if "bfu_utils" in locals():
+        importlib.reload(bfu_utils)
+    if "bfu_export_incremental" in locals():
+        importlib.reload(bfu_export_incremental)
+
+from .. import bfu_basics
+from ..bfu_basics import *
+from .. import bfu_utils
+from ..bfu_utils import *
+from . import bfu_export_incremental
+
+
+addon_package = __package__.split(".")[0]
+
+
+class ExportShard():
+    # Group of assets exported by a single worker process
+
+    def __init__(self, index):
+        self.index = index
+        self.assets = []
+        self.process = None
+        self.timed_out = False
+        self.log_file = None
+        self.shard_path = ""
+        self.result_path = ""
+        self.log_path = ""
+
+    def GetAssetKeys(self):
+        return [bfu_export_incremental.GetAssetKey(a.type, a.obj, a.action) for a in self.assets]
+
+
+def GetAssetShards(assets, worker_count):
+    # All assets of the same object are kept in the same shard
+    # because they use the same armature and children.
+    groups = {}
+    for asset in assets:
+        if asset.type == "Collection StaticMesh":
+            group_key = "Collection:" + GetAssetCollection(asset).name
+        else:
+            group_key = asset.obj.name
+        groups.setdefault(group_key, []).append(asset)
+
+    shard_number = max(1, min(worker_count, len(groups)))
+    shards = [ExportShard(x) for x in range(shard_number)]
+
+    # Biggest groups first to the shard with the less assets
+    for group in sorted(groups.values(), key=len, reverse=True):
+        target = min(shards, key=lambda shard: len(shard.assets))
+        target.assets.extend(group)
+
+    return [shard for shard in shards if len(shard.assets) > 0]
+
+
+def GetWorkerBlendPath():
+    # The copy is saved next to the original file so relative paths stay valid.
+    dirname, basename = os.path.split(bpy.data.filepath)
+    return os.path.join(dirname, "." + os.path.splitext(basename)[0] + "_bfu_export_worker.blend")
+
+
+def GetWorkerCommand(blend_path, shard_path):
+    expr = (
+        "import addon_utils, importlib\n" +
+        "if not addon_utils.check({0!r})[1]:\n".format(addon_package) +
+        "    addon_utils.enable({0!r})\n".format(addon_package) +
+        "worker = importlib.import_module({0!r})\n".format(__name__) +
+        "worker.RunExportWorker({0!r})\n".format(shard_path)
+        )
+    return [bpy.app.binary_path, "-b", blend_path, "--python-expr", expr]
+
+
+def StartExportWorkers(shards, temp_dir, blend_path):
+    for shard in shards:
+        shard.shard_path = os.path.join(temp_dir, "shard_" + str(shard.index) + ".json")
+        shard.result_path = os.path.join(temp_dir, "result_" + str(shard.index) + ".json")
+        shard.log_path = os.path.join(temp_dir, "worker_" + str(shard.index) + ".log")
+
+        data = {}
+        data["scene"] = bpy.context.scene.name
+        data["assets"] = shard.GetAssetKeys()
+        data["result_path"] = shard.result_path
+        with open(shard.shard_path, 'w') as json_file:
+            json.dump(data, json_file, ensure_ascii=False, indent=4)
+
+        shard.log_file = open(shard.log_path, 'w')
+        shard.process = subprocess.Popen(
+            GetWorkerCommand(blend_path, shard.shard_path),
+            stdout=shard.log_file,
+            stderr=subprocess.STDOUT
+            )
+
+
+def WaitExportWorkers(shards, timeout=0):
+    # timeout in seconds, the workers still running after it are killed (0 for no timeout)
+    counter = CounterTimer()
+    running = list(shards)
+    while len(running) > 0:
+        for shard in list(running):
+            if shard.process.poll() is None and timeout > 0 and counter.GetTime() > timeout:
+                shard.process.kill()
+                shard.process.wait()
+                shard.timed_out = True
+            if shard.process.poll() is not None:
+                shard.log_file.close()
+                running.remove(shard)
+        UpdateProgress("Export assets with workers", (len(shards)-len(running))/len(shards), counter.GetTime())
+        if len(running) > 0:
+            time.sleep(0.2)
+
+
+def ReadShardResult(shard):
+    if shard.timed_out:
+        print("Export worker", shard.index, "stopped after the timeout, see log:", shard.log_path)
+        return None
+
+    if shard.process.returncode != 0 or not os.path.isfile(shard.result_path):
+        print("Export worker", shard.index, "failed, see log:", shard.log_path)
+        with open(shard.log_path, 'r') as log_file:
+            print(log_file.read())
+        return None
+
+    with open(shard.result_path, 'r') as json_file:
+        return json.load(json_file)
+
+
+def ExportAssetsWithWorkers(assets, worker_count, manifest=None, timeout=0):
+    # Export the assets in background Blender processes.
+    # Results are merged in scene.UnrealExportedAssetsList.
+    # Returns the assets that can't be exported by workers, they need be exported in the current process.
+
+    if manifest is not None:
+        assets_to_export = []
+        for asset in assets:
+            if manifest.IsAssetUpToDate(asset.type, asset.obj, asset.action):
+                manifest.RestoreSkippedAsset(asset.type, asset.obj, asset.action)
+            else:
+                assets_to_export.append(asset)
+    else:
+        assets_to_export = list(assets)
+
+    if not bpy.data.is_saved:
+        # The worker copy is saved next to the blend file and need it for resolve the relative paths
+        print("Export workers need a saved blend file, the assets are exported in the current process.")
+        return assets_to_export
+
+    shards = GetAssetShards(assets_to_export, worker_count)
+    if len(shards) < 2:
+        # No need workers for a single shard
+        return assets_to_export
+
+    temp_dir = tempfile.mkdtemp(prefix="bfu_export_")
+    blend_path = GetWorkerBlendPath()
+    bpy.ops.wm.save_as_mainfile(filepath=blend_path, copy=True)
+
+    remaining_assets = []
+    try:
+        StartExportWorkers(shards, temp_dir, blend_path)
+        WaitExportWorkers(shards, timeout)
+
+        for shard in shards:
+            result = ReadShardResult(shard)
+            if result is None:
+                remaining_assets.extend(shard.assets)
+                continue
+
+            for key in shard.GetAssetKeys():
+                record = result["assets"].get(key)
+                if record is None:
+                    continue
+                bfu_export_incremental.AddExportedAssetFromRecord(record)
+                if manifest is not None:
+                    manifest.StoreRecord(key, record)
+    finally:
+        if os.path.isfile(blend_path):
+            os.remove(blend_path)
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    return remaining_assets
+
+
+def RunExportWorker(shard_path):
+    # Entry point of the background Blender process launched by StartExportWorkers()
+    from . import bfu_export_asset
+
+    with open(shard_path, 'r') as json_file:
+        data = json.load(json_file)
+
+    scene = bpy.context.scene
+    if scene.name != data["scene"]:
+        # Without result the shard is exported again by the main process
+        print("Export worker scene is not the exported scene:", scene.name, data["scene"])
+        return
+
+    scene.UnrealExportedAssetsList.clear()
+    recorder = bfu_export_incremental.ExportManifest()
+    bfu_export_asset.ExportForUnrealEngine(asset_filter=set(data["assets"]), manifest=recorder)
+
+    result = {}
+    result["assets"] = recorder.assets
+    with open(data["result_path"], 'w') as json_file:
+        json.dump(result, json_file, ensure_ascii=False, indent=4)
@@ -0,0 +1,234 @@
+# ====================== BEGIN GPL LICENSE BLOCK ============================
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.	 See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.	 If not, see <http://www.gnu.org/licenses/>.
+#  All rights reserved.
+#
+# ======================= END GPL LICENSE BLOCK =============================
+
+import os
+import time
+import functools
+import tracemalloc
+
+# Export profiler
+# Spans are recorded only between ExportProfiler.Start() and ExportProfiler.Stop().
+# When the profiler is not started ExportSpan() and ProfileExport() cost a single test.
+
+
+class ExportProfilerSpan():
+    # Timing of a named part of the export
+
+    def __init__(self, profiler, name, category, args):
+        self.profiler = profiler
+        self.name = name
+        self.category = category
+        self.args = args
+        self.start = 0.0
+        self.end = 0.0
+        self.children_time = 0.0
+        self.depth = 0
+        self.peak_memory = 0
+
+    def GetTime(self):
+        return self.end - self.start
+
+    def GetSelfTime(self):
+        return self.GetTime() - self.children_time
+
+    def __enter__(self):
+        self.profiler.OpenSpan(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.profiler.CloseSpan(self)
+        return False
+
+
+class NullExportProfilerSpan():
+    # Used when the profiler is not started
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+null_span = NullExportProfilerSpan()
+
+
+def ResetPeakMemory():
+    # tracemalloc.reset_peak() is new in Python 3.9 (Blender 2.93).
+    # With older versions the peak of each span is the peak since the start of the tracing.
+    if hasattr(tracemalloc, "reset_peak"):
+        tracemalloc.reset_peak()
+
+
+class ExportProfiler():
+
+    def __init__(self):
+        self.enabled = False
+        self.use_memory = False
+        self.started_tracemalloc = False
+        self.start_time = 0.0
+        self.spans = []
+        self.stack = []
+
+    def Start(self, use_memory=False):
+        self.enabled = True
+        self.use_memory = use_memory
+        self.start_time = time.perf_counter()
+        self.Clear()
+        self.started_tracemalloc = False
+        if use_memory:
+            # Tracing started by someone else is left running in Stop()
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self.started_tracemalloc = True
+            ResetPeakMemory()
+
+    def Stop(self):
+        while len(self.stack) > 0:
+            self.CloseSpan(self.stack[-1])
+        if self.started_tracemalloc and tracemalloc.is_tracing():
+            tracemalloc.stop()
+        self.started_tracemalloc = False
+        self.enabled = False
+
+    def Clear(self):
+        self.spans = []
+        self.stack = []
+
+    def HasData(self):
+        return len(self.spans) > 0
+
+    def Span(self, name, category="export", args=None):
+        return ExportProfilerSpan(self, name, category, args)
+
+    def OpenSpan(self, span):
+        if self.use_memory:
+            # The peak is reset for each span and given back to the parent at the end
+            if len(self.stack) > 0:
+                parent = self.stack[-1]
+                parent.peak_memory = max(parent.peak_memory, tracemalloc.get_traced_memory()[1])
+            ResetPeakMemory()
+        span.depth = len(self.stack)
+        self.stack.append(span)
+        span.start = time.perf_counter()
+
+    def CloseSpan(self, span):
+        span.end = time.perf_counter()
+        if span in self.stack:
+            self.stack.remove(span)
+        if self.use_memory:
+            span.peak_memory = max(span.peak_memory, tracemalloc.get_traced_memory()[1])
+        if len(self.stack) > 0:
+            parent = self.stack[-1]
+            parent.children_time += span.GetTime()
+            parent.peak_memory = max(parent.peak_memory, span.peak_memory)
+        self.spans.append(span)
+
+    def GetTraceEvents(self):
+        # Chrome trace_event format, can be opened with chrome://tracing or https://ui.perfetto.dev
+        pid = os.getpid()
+        events = []
+        for span in sorted(self.spans, key=lambda span: span.start):
+            event = {}
+            event["name"] = span.name
+            event["cat"] = span.category
+            event["ph"] = "X"
+            event["ts"] = (span.start - self.start_time) * 1000000
+            event["dur"] = span.GetTime() * 1000000
+            event["pid"] = pid
+            event["tid"] = 0
+            args = dict(span.args) if span.args else {}
+            if self.use_memory:
+                args["peak_python_memory"] = span.peak_memory
+            if len(args) > 0:
+                event["args"] = args
+            events.append(event)
+        return events
+
+    def GetTraceData(self):
+        data = {}
+        data["traceEvents"] = self.GetTraceEvents()
+        data["displayTimeUnit"] = "ms"
+        return data
+
+    def GetSummary(self, category):
+        # Returns [name, count, total time, self time, max time, peak memory] sorted by total time
+        summary = {}
+        for span in self.spans:
+            if span.category != category:
+                continue
+            if span.name not in summary:
+                summary[span.name] = [span.name, 0, 0.0, 0.0, 0.0, 0]
+            line = summary[span.name]
+            line[1] += 1
+            line[2] += span.GetTime()
+            line[3] += span.GetSelfTime()
+            line[4] = max(line[4], span.GetTime())
+            line[5] = max(line[5], span.peak_memory)
+        return sorted(summary.values(), key=lambda line: line[2], reverse=True)
+
+    def GetSummaryText(self):
+        text = ""
+        for category, title in [("export", "Export phases"), ("asset", "Assets")]:
+            lines = self.GetSummary(category)
+            if len(lines) == 0:
+                continue
+
+            name_width = max(len(line[0]) for line in lines)
+            name_width = max(name_width, len("Name"))
+            header = "Name".ljust(name_width) + "  Count     Total(s)      Self(s)       Max(s)"
+            if self.use_memory:
+                header += "  PeakMem(MB)"
+            text += title + ":\n"
+            text += header + "\n"
+            for line in lines:
+                row = line[0].ljust(name_width)
+                row += "  " + str(line[1]).rjust(5)
+                row += "  " + ("%.3f" % line[2]).rjust(11)
+                row += "  " + ("%.3f" % line[3]).rjust(11)
+                row += "  " + ("%.3f" % line[4]).rjust(11)
+                if self.use_memory:
+                    row += "  " + ("%.2f" % (line[5] / 1048576)).rjust(11)
+                text += row + "\n"
+            text += "\n"
+        return text
+
+
+MyExportProfiler = ExportProfiler()
+
+
+def ExportSpan(name, category="export", **args):
+    # Use with "with ExportSpan(name):"
+    if not MyExportProfiler.enabled:
+        return null_span
+    return MyExportProfiler.Span(name, category, args)
+
+
+def ProfileExport(name=None, category="export"):
+    # Decorator, record a span for each call of the function
+    def Decorator(func):
+        span_name = name if name is not None else func.__name__
+
+        @functools.wraps(func)
+        def Wrapper(*args, **kwargs):
+            if not MyExportProfiler.enabled:
+                return func(*args, **kwargs)
+            with MyExportProfiler.Span(span_name, category):
+                return func(*args, **kwargs)
+        return Wrapper
+    return Decorator
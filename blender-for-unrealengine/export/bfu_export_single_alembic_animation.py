@@ -90,12 +90,13 @@ def ExportSingleAlembicAnimation(
     scene.frame_end += obj.bfu_anim_action_end_frame_offset
 
     # Export
-    bpy.ops.wm.alembic_export(
-        filepath=GetExportFullpath(dirpath, filename),
-        check_existing=False,
-        selected=True,
-        triangulate=True,
-        )
+    with ExportSpan("wm.alembic_export"):
+        bpy.ops.wm.alembic_export(
+            filepath=GetExportFullpath(dirpath, filename),
+            check_existing=False,
+            selected=True,
+            triangulate=True,
+            )
 
     scene.frame_start -= obj.bfu_anim_action_start_frame_offset
     scene.frame_end -= obj.bfu_anim_action_end_frame_offset
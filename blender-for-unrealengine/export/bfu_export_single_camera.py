@@ -121,28 +121,29 @@ def ExportSingleFbxCamera(
 
     ExportCameraAsFBX = addon_prefs.exportCameraAsFBX
     if ExportCameraAsFBX:
-        bpy.ops.export_scene.fbx(
-            filepath=GetExportFullpath(dirpath, filename),
-            check_existing=False,
-            use_selection=True,
-            global_scale=GetObjExportScale(obj),
-            object_types={'CAMERA'},
-            use_custom_props=addon_prefs.exportWithCustomProps,
-            add_leaf_bones=False,
-            use_armature_deform_only=obj.exportDeformOnly,
-            bake_anim=True,
-            bake_anim_use_nla_strips=False,
-            bake_anim_use_all_actions=False,
-            bake_anim_force_startend_keying=True,
-            bake_anim_step=GetAnimSample(obj),
-            bake_anim_simplify_factor=obj.SimplifyAnimForExport,
-            use_metadata=addon_prefs.exportWithMetaData,
-            primary_bone_axis=obj.exportPrimaryBaneAxis,
-            secondary_bone_axis=obj.exporSecondaryBoneAxis,
-            axis_forward=obj.exportAxisForward,
-            axis_up=obj.exportAxisUp,
-            bake_space_transform=False
-            )
+        with ExportSpan("export_scene.fbx"):
+            bpy.ops.export_scene.fbx(
+                filepath=GetExportFullpath(dirpath, filename),
+                check_existing=False,
+                use_selection=True,
+                global_scale=GetObjExportScale(obj),
+                object_types={'CAMERA'},
+                use_custom_props=addon_prefs.exportWithCustomProps,
+                add_leaf_bones=False,
+                use_armature_deform_only=obj.exportDeformOnly,
+                bake_anim=True,
+                bake_anim_use_nla_strips=False,
+                bake_anim_use_all_actions=False,
+                bake_anim_force_startend_keying=True,
+                bake_anim_step=GetAnimSample(obj),
+                bake_anim_simplify_factor=obj.SimplifyAnimForExport,
+                use_metadata=addon_prefs.exportWithMetaData,
+                primary_bone_axis=obj.exportPrimaryBaneAxis,
+                secondary_bone_axis=obj.exporSecondaryBoneAxis,
+                axis_forward=obj.exportAxisForward,
+                axis_up=obj.exportAxisUp,
+                bake_space_transform=False
+                )
 
     # Reset camera scale
     obj.delta_scale *= 100
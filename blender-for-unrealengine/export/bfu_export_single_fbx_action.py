@@ -46,7 +46,8 @@ from . import bfu_export_utils
 from .bfu_export_utils import *
 
 
-def ProcessActionExport(obj, action):
+def ProcessActionExport(obj, action, batch=None):
+    # With a batch (ActionExportBatch) the prepared armature of the batch is used
     scene = bpy.context.scene
     addon_prefs = GetAddonPrefs()
     dirpath = os.path.join(GetObjExportDir(obj), scene.anim_subfolder_name)
@@ -60,7 +61,10 @@ def ProcessActionExport(obj, action):
 
     MyAsset.StartAssetExport()
 
-    ExportSingleFbxAction(scene, dirpath, GetActionExportFileName(obj, action), obj, action)
+    if batch is None:
+        ExportSingleFbxAction(scene, dirpath, GetActionExportFileName(obj, action), obj, action)
+    else:
+        batch.ExportAction(dirpath, GetActionExportFileName(obj, action), action)
     file = MyAsset.files.add()
     file.name = GetActionExportFileName(obj, action)
     file.path = dirpath
@@ -70,6 +74,16 @@ def ProcessActionExport(obj, action):
     return MyAsset
 
 
+def GetCanUseActionExportBatch(obj):
+    # Baked actions need a new armature setup for each action
+    addon_prefs = GetAddonPrefs()
+    if not addon_prefs.exportActionsInBatch:
+        return False
+    if addon_prefs.bakeArmatureAction:
+        return False
+    return True
+
+
 def ExportSingleFbxAction(
         originalScene,
         dirpath,
@@ -85,150 +99,234 @@ def ExportSingleFbxAction(
     '''
     # Export a single action like a animation or pose
 
-    scene = bpy.context.scene
-    addon_prefs = GetAddonPrefs()
-    export_as_proxy = GetExportAsProxy(obj)
-    export_proxy_child = GetExportProxyChild(obj)
-
-    if obj.animation_data is None:
-        obj.animation_data_create()
-    userAction = obj.animation_data.action  # Save current action
-    userAction_extrapolation = obj.animation_data.action_extrapolation
-    userAction_blend_type = obj.animation_data.action_blend_type
-    userAction_influence = obj.animation_data.action_influence
-
-    bbpl.utils.SafeModeSet('OBJECT')
-
-    SelectParentAndDesiredChilds(obj)
-    asset_name = PrepareExportName(obj, True)
-    if export_as_proxy is False:
-        duplicate_data = DuplicateSelectForExport()
-        SetDuplicateNameForExport(duplicate_data)
-
-    if export_as_proxy is False:
-        MakeSelectVisualReal()
-
-    BaseTransform = obj.matrix_world.copy()
-    active = bpy.context.view_layer.objects.active
-    asset_name.target_object = active
-    if export_as_proxy:
-        ApplyProxyData(active)
-
-    scene.frame_start = GetDesiredActionStartEndTime(active, targetAction)[0]
-    scene.frame_end = GetDesiredActionStartEndTime(active, targetAction)[1]
-
-    if export_as_proxy:
-        if export_proxy_child is not None:
-            obj.animation_data.action = targetAction  # Apply desired action
-        RemoveSocketFromSelectForProxyArmature()
-
-    active.animation_data.action = targetAction  # Apply desired action
-    export_procedure = active.bfu_export_procedure
-
-    if addon_prefs.bakeArmatureAction:
-        BakeArmatureAnimation(active, scene.frame_start, scene.frame_end)
-
-    ApplyExportTransform(active, "Action")  # Apply export transform before rescale
-
-    # This will rescale the rig and unit scale to get a root bone egal to 1
-    ShouldRescaleRig = GetShouldRescaleRig(active)
-    if ShouldRescaleRig:
-
-        rrf = GetRescaleRigFactor()  # rigRescaleFactor
-        savedUnitLength = bpy.context.scene.unit_settings.scale_length
-        bpy.context.scene.unit_settings.scale_length = 0.01  # *= 1/rrf
-
-        oldScale = active.scale.z
-        ApplySkeletalExportScale(active, rrf, is_a_proxy=export_as_proxy)
-        RescaleAllActionCurve(rrf*oldScale, savedUnitLength/0.01)
-        for selected in bpy.context.selected_objects:
-            if selected.type == "MESH":
-                if export_as_proxy is False:
-                    RescaleShapeKeysCurve(selected, 1/rrf)
-        RescaleSelectCurveHook(1/rrf)
-        ResetArmaturePose(active)
-        RescaleRigConsraints(active, rrf)
-
-    # animation_data.action is ReadOnly with tweakmode in 2.8
-    if (scene.is_nla_tweakmode):
-        active.animation_data.use_tweak_mode = False
-
-    if addon_prefs.ignoreNLAForAction:  # Reset NLA
-        active.animation_data.action_extrapolation = 'HOLD'
-        active.animation_data.action_blend_type = 'REPLACE'
-        active.animation_data.action_influence = 1
-
-    asset_name.SetExportName()
-
-    if (export_procedure == "normal"):
-        bpy.ops.export_scene.fbx(
-            filepath=GetExportFullpath(dirpath, filename),
-            check_existing=False,
-            use_selection=True,
-            global_scale=GetObjExportScale(active),
-            object_types={'ARMATURE', 'EMPTY', 'MESH'},
-            use_custom_props=addon_prefs.exportWithCustomProps,
-            mesh_smooth_type="FACE",
-            add_leaf_bones=False,
-            use_armature_deform_only=active.exportDeformOnly,
-            bake_anim=True,
-            bake_anim_use_nla_strips=False,
-            bake_anim_use_all_actions=False,
-            bake_anim_force_startend_keying=True,
-            bake_anim_step=GetAnimSample(active),
-            bake_anim_simplify_factor=active.SimplifyAnimForExport,
-            use_metadata=addon_prefs.exportWithMetaData,
-            primary_bone_axis=active.exportPrimaryBaneAxis,
-            secondary_bone_axis=active.exporSecondaryBoneAxis,
-            axis_forward=active.exportAxisForward,
-            axis_up=active.exportAxisUp,
-            bake_space_transform=False
-            )
-
-    elif (export_procedure == "auto-rig-pro"):
-
-        # Rename Action name for export
-        TempName = "ActionAutoRigProTempExportNameForUnreal"
-        OriginalActionName = active.animation_data.action.name
-        active.animation_data.action.name = TempName
-
-        ExportAutoProRig(
-            filepath=GetExportFullpath(dirpath, filename),
-            # export_rig_name=GetDesiredExportArmatureName(active),
-            bake_anim=True,
-            anim_export_name_string=active.animation_data.action.name,
-            mesh_smooth_type="FACE",
-            arp_simplify_fac=active.SimplifyAnimForExport
-            )
-
-        # Reset Action name
-        active.animation_data.action.name = OriginalActionName
-
-    asset_name.ResetNames()
-
-    ResetArmaturePose(obj)
-
-    obj.animation_data.action = userAction  # Resets previous action and NLA
-    if addon_prefs.ignoreNLAForAction:
-        obj.animation_data.action_extrapolation = userAction_extrapolation
-        obj.animation_data.action_blend_type = userAction_blend_type
-        obj.animation_data.action_influence = userAction_influence
-
-    # Reset Transform
-    obj.matrix_world = BaseTransform
-
-    # This will rescale the rig and unit scale to get a root bone egal to 1
-    if ShouldRescaleRig:
-        # Reset Curve an unit
-        bpy.context.scene.unit_settings.scale_length = savedUnitLength
-        RescaleAllActionCurve(1/(rrf*oldScale), 0.01/savedUnitLength)
-
-    if export_as_proxy is False:
-        CleanDeleteObjects(bpy.context.selected_objects)
-        for data in duplicate_data.data_to_remove:
-            data.RemoveData()
-
-        ResetDuplicateNameAfterExport(duplicate_data)
-
-    for obj in scene.objects:
-        ClearAllBFUTempVars(obj)
+    batch = ActionExportBatch(obj)
+    batch.Prepare([targetAction])
+    batch.ExportAction(dirpath, filename, targetAction)
+    batch.Finish()
+
+
+batch_pose_properties = [
+    # Pose bone property, size
+    ("location", 3),
+    ("rotation_quaternion", 4),
+    ("rotation_euler", 3),
+    ("rotation_axis_angle", 4),
+    ("scale", 3),
+]
+
+
+class ActionExportBatch():
+    # Export many actions of an armature with a single duplicated, transformed and rescaled armature.
+    # Prepare() -> ExportAction() for each action -> Finish()
+
+    def __init__(self, obj):
+        self.obj = obj
+        self.active = None
+        self.current_action = None
+
+    def Prepare(self, actions):
+        # actions are all the actions that will be exported with this batch
+
+        scene = bpy.context.scene
+        addon_prefs = GetAddonPrefs()
+        obj = self.obj
+        targetAction = actions[0]
+        self.export_as_proxy = GetExportAsProxy(obj)
+        self.export_proxy_child = GetExportProxyChild(obj)
+        export_as_proxy = self.export_as_proxy
+
+        if obj.animation_data is None:
+            obj.animation_data_create()
+        self.userAction = obj.animation_data.action  # Save current action
+        self.userAction_extrapolation = obj.animation_data.action_extrapolation
+        self.userAction_blend_type = obj.animation_data.action_blend_type
+        self.userAction_influence = obj.animation_data.action_influence
+
+        bbpl.utils.SafeModeSet('OBJECT')
+
+        SelectParentAndDesiredChilds(obj)
+        self.asset_name = PrepareExportName(obj, True)
+        if export_as_proxy is False:
+            self.duplicate_data = DuplicateSelectForExport()
+            SetDuplicateNameForExport(self.duplicate_data)
+
+        if export_as_proxy is False:
+            MakeSelectVisualReal()
+
+        self.BaseTransform = obj.matrix_world.copy()
+        active = bpy.context.view_layer.objects.active
+        self.active = active
+        self.asset_name.target_object = active
+        if export_as_proxy:
+            ApplyProxyData(active)
+
+        scene.frame_start = GetDesiredActionStartEndTime(active, targetAction)[0]
+        scene.frame_end = GetDesiredActionStartEndTime(active, targetAction)[1]
+
+        if export_as_proxy:
+            if self.export_proxy_child is not None:
+                obj.animation_data.action = targetAction  # Apply desired action
+            RemoveSocketFromSelectForProxyArmature()
+
+        active.animation_data.action = targetAction  # Apply desired action
+        self.current_action = targetAction
+
+        if addon_prefs.bakeArmatureAction:
+            BakeArmatureAnimation(active, scene.frame_start, scene.frame_end)
+
+        ApplyExportTransform(active, "Action")  # Apply export transform before rescale
+
+        # This will rescale the rig and unit scale to get a root bone egal to 1
+        self.ShouldRescaleRig = GetShouldRescaleRig(active)
+        if self.ShouldRescaleRig:
+
+            rrf = GetRescaleRigFactor()  # rigRescaleFactor
+            self.savedUnitLength = bpy.context.scene.unit_settings.scale_length
+            bpy.context.scene.unit_settings.scale_length = 0.01  # *= 1/rrf
+
+            oldScale = active.scale.z
+            ApplySkeletalExportScale(active, rrf, is_a_proxy=export_as_proxy)
+
+            # All the actions of the batch are rescaled now
+            rescaled_actions = GetActionsUsedByObjects(bpy.context.selected_objects + [obj])
+            for action in actions:
+                if action not in rescaled_actions:
+                    rescaled_actions.append(action)
+            self.action_curve_rescale = ActionCurveRescale()
+            self.action_curve_rescale.Rescale(
+                rescaled_actions,
+                rrf*oldScale,
+                self.savedUnitLength/0.01)
+            for selected in bpy.context.selected_objects:
+                if selected.type == "MESH":
+                    if export_as_proxy is False:
+                        RescaleShapeKeysCurve(selected, 1/rrf)
+            RescaleSelectCurveHook(1/rrf)
+            ResetArmaturePose(active)
+            RescaleRigConsraints(active, rrf)
+
+        # animation_data.action is ReadOnly with tweakmode in 2.8
+        if (scene.is_nla_tweakmode):
+            active.animation_data.use_tweak_mode = False
+
+        if addon_prefs.ignoreNLAForAction:  # Reset NLA
+            active.animation_data.action_extrapolation = 'HOLD'
+            active.animation_data.action_blend_type = 'REPLACE'
+            active.animation_data.action_influence = 1
+
+        self.asset_name.SetExportName()
+        self.SavePose()
+
+    def SavePose(self):
+        # The bones without keys in an action keep this pose
+        bones = self.active.pose.bones
+        self.saved_pose = {}
+        for prop, size in batch_pose_properties:
+            values = [0.0] * (len(bones) * size)
+            bones.foreach_get(prop, values)
+            self.saved_pose[prop] = values
+
+    def RestorePose(self):
+        bones = self.active.pose.bones
+        for prop, size in batch_pose_properties:
+            bones.foreach_set(prop, self.saved_pose[prop])
+
+    def SetAction(self, targetAction):
+        # Swap the action of the prepared armature
+        scene = bpy.context.scene
+        active = self.active
+
+        scene.frame_start = GetDesiredActionStartEndTime(active, targetAction)[0]
+        scene.frame_end = GetDesiredActionStartEndTime(active, targetAction)[1]
+
+        if self.export_as_proxy:
+            if self.export_proxy_child is not None:
+                self.obj.animation_data.action = targetAction  # Apply desired action
+
+        active.animation_data.action = targetAction  # Apply desired action
+        self.current_action = targetAction
+        self.RestorePose()
+
+    def ExportAction(self, dirpath, filename, targetAction):
+        addon_prefs = GetAddonPrefs()
+        active = self.active
+        if targetAction != self.current_action:
+            self.SetAction(targetAction)
+        export_procedure = active.bfu_export_procedure
+
+        if (export_procedure == "normal"):
+            with ExportSpan("export_scene.fbx"):
+                bpy.ops.export_scene.fbx(
+                    filepath=GetExportFullpath(dirpath, filename),
+                    check_existing=False,
+                    use_selection=True,
+                    global_scale=GetObjExportScale(active),
+                    object_types={'ARMATURE', 'EMPTY', 'MESH'},
+                    use_custom_props=addon_prefs.exportWithCustomProps,
+                    mesh_smooth_type="FACE",
+                    add_leaf_bones=False,
+                    use_armature_deform_only=active.exportDeformOnly,
+                    bake_anim=True,
+                    bake_anim_use_nla_strips=False,
+                    bake_anim_use_all_actions=False,
+                    bake_anim_force_startend_keying=True,
+                    bake_anim_step=GetAnimSample(active),
+                    bake_anim_simplify_factor=active.SimplifyAnimForExport,
+                    use_metadata=addon_prefs.exportWithMetaData,
+                    primary_bone_axis=active.exportPrimaryBaneAxis,
+                    secondary_bone_axis=active.exporSecondaryBoneAxis,
+                    axis_forward=active.exportAxisForward,
+                    axis_up=active.exportAxisUp,
+                    bake_space_transform=False
+                    )
+
+        elif (export_procedure == "auto-rig-pro"):
+
+            # Rename Action name for export
+            TempName = "ActionAutoRigProTempExportNameForUnreal"
+            OriginalActionName = active.animation_data.action.name
+            active.animation_data.action.name = TempName
+
+            ExportAutoProRig(
+                filepath=GetExportFullpath(dirpath, filename),
+                # export_rig_name=GetDesiredExportArmatureName(active),
+                bake_anim=True,
+                anim_export_name_string=active.animation_data.action.name,
+                mesh_smooth_type="FACE",
+                arp_simplify_fac=active.SimplifyAnimForExport
+                )
+
+            # Reset Action name
+            active.animation_data.action.name = OriginalActionName
+
+    def Finish(self):
+        scene = bpy.context.scene
+        addon_prefs = GetAddonPrefs()
+        obj = self.obj
+
+        self.asset_name.ResetNames()
+
+        ResetArmaturePose(obj)
+
+        obj.animation_data.action = self.userAction  # Resets previous action and NLA
+        if addon_prefs.ignoreNLAForAction:
+            obj.animation_data.action_extrapolation = self.userAction_extrapolation
+            obj.animation_data.action_blend_type = self.userAction_blend_type
+            obj.animation_data.action_influence = self.userAction_influence
+
+        # Reset Transform
+        obj.matrix_world = self.BaseTransform
+
+        # This will rescale the rig and unit scale to get a root bone egal to 1
+        if self.ShouldRescaleRig:
+            # Reset Curve an unit
+            bpy.context.scene.unit_settings.scale_length = self.savedUnitLength
+            self.action_curve_rescale.Restore()
+
+        if self.export_as_proxy is False:
+            CleanDeleteDuplicate(self.duplicate_data)
+
+            ResetDuplicateNameAfterExport(self.duplicate_data)
+
+        for obj in scene.objects:
+            ClearAllBFUTempVars(obj)
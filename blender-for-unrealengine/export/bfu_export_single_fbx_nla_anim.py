@@ -130,7 +130,11 @@ def ExportSingleFbxNLAAnim(
         oldScale = active.scale.z
 
         ApplySkeletalExportScale(active, rrf, target_animation_data=animation_data, is_a_proxy=export_as_proxy)
-        RescaleAllActionCurve(rrf*oldScale, savedUnitLength/0.01)
+        action_curve_rescale = ActionCurveRescale()
+        action_curve_rescale.Rescale(
+            GetActionsUsedByObjects(bpy.context.selected_objects + [obj]),
+            rrf*oldScale,
+            savedUnitLength/0.01)
 
         for selected in bpy.context.selected_objects:
             if selected.type == "MESH":
@@ -147,28 +151,29 @@ def ExportSingleFbxNLAAnim(
     asset_name.SetExportName()
 
     if (export_procedure == "normal"):
-        bpy.ops.export_scene.fbx(
-            filepath=GetExportFullpath(dirpath, filename),
-            check_existing=False,
-            use_selection=True,
-            global_scale=GetObjExportScale(active),
-            object_types={'ARMATURE', 'EMPTY', 'MESH'},
-            use_custom_props=addon_prefs.exportWithCustomProps,
-            add_leaf_bones=False,
-            use_armature_deform_only=active.exportDeformOnly,
-            bake_anim=True,
-            bake_anim_use_nla_strips=False,
-            bake_anim_use_all_actions=False,
-            bake_anim_force_startend_keying=True,
-            bake_anim_step=GetAnimSample(active),
-            bake_anim_simplify_factor=active.SimplifyAnimForExport,
-            use_metadata=addon_prefs.exportWithMetaData,
-            primary_bone_axis=active.exportPrimaryBaneAxis,
-            secondary_bone_axis=active.exporSecondaryBoneAxis,
-            axis_forward=active.exportAxisForward,
-            axis_up=active.exportAxisUp,
-            bake_space_transform=False
-            )
+        with ExportSpan("export_scene.fbx"):
+            bpy.ops.export_scene.fbx(
+                filepath=GetExportFullpath(dirpath, filename),
+                check_existing=False,
+                use_selection=True,
+                global_scale=GetObjExportScale(active),
+                object_types={'ARMATURE', 'EMPTY', 'MESH'},
+                use_custom_props=addon_prefs.exportWithCustomProps,
+                add_leaf_bones=False,
+                use_armature_deform_only=active.exportDeformOnly,
+                bake_anim=True,
+                bake_anim_use_nla_strips=False,
+                bake_anim_use_all_actions=False,
+                bake_anim_force_startend_keying=True,
+                bake_anim_step=GetAnimSample(active),
+                bake_anim_simplify_factor=active.SimplifyAnimForExport,
+                use_metadata=addon_prefs.exportWithMetaData,
+                primary_bone_axis=active.exportPrimaryBaneAxis,
+                secondary_bone_axis=active.exporSecondaryBoneAxis,
+                axis_forward=active.exportAxisForward,
+                axis_up=active.exportAxisUp,
+                bake_space_transform=False
+                )
 
     if (export_procedure == "auto-rig-pro"):
         ExportAutoProRig(
@@ -195,12 +200,10 @@ def ExportSingleFbxNLAAnim(
     if ShouldRescaleRig:
         # Reset Curve an unit
         bpy.context.scene.unit_settings.scale_length = savedUnitLength
-        RescaleAllActionCurve(1/(rrf*oldScale), 0.01/savedUnitLength)
+        action_curve_rescale.Restore()
 
     if export_as_proxy is False:
-        CleanDeleteObjects(bpy.context.selected_objects)
-        for data in duplicate_data.data_to_remove:
-            data.RemoveData()
+        CleanDeleteDuplicate(duplicate_data)
 
         ResetDuplicateNameAfterExport(duplicate_data)
 
@@ -46,7 +46,8 @@ from . import bfu_export_utils
 from .bfu_export_utils import *
 
 
-def ProcessStaticMeshExport(obj):
+def ProcessStaticMeshExport(obj, lods=()):
+    # lods is a list of (lod number, lod object) exported with the StaticMesh (see ExportStaticMeshLodChain)
     addon_prefs = GetAddonPrefs()
     dirpath = GetObjExportDir(obj)
     absdirpath = bpy.path.abspath(dirpath)
@@ -59,12 +60,21 @@ def ProcessStaticMeshExport(obj):
     MyAsset.asset_type = bfu_utils.GetAssetType(obj)
     MyAsset.StartAssetExport()
 
-    ExportSingleStaticMesh(dirpath, GetObjExportFileName(obj), obj)
+    if len(lods) > 0:
+        ExportStaticMeshLodChain(obj, lods)
+    else:
+        ExportSingleStaticMesh(dirpath, GetObjExportFileName(obj), obj)
     file = MyAsset.files.add()
     file.name = GetObjExportFileName(obj)
     file.path = dirpath
     file.type = "FBX"
 
+    for lod_number, lod in lods:
+        file = MyAsset.files.add()
+        file.name = GetObjExportFileName(lod)
+        file.path = GetObjExportDir(lod)
+        file.type = "Lod"+str(lod_number)
+
     if not obj.ExportAsLod:
         if (scene.text_AdditionalData and addon_prefs.useGeneratedScripts):
             ExportAdditionalParameter(absdirpath, MyAsset)
@@ -91,7 +101,6 @@ def ExportSingleStaticMesh(
     # Export a single Mesh
 
     scene = bpy.context.scene
-    addon_prefs = GetAddonPrefs()
 
     bbpl.utils.SafeModeSet('OBJECT')
 
@@ -113,45 +122,134 @@ def ExportSingleStaticMesh(
     active = bpy.context.view_layer.objects.active
     asset_name.target_object = active
 
-    ApplyExportTransform(active, "Object")
+    ExportStaticMeshFbx(dirpath, filename, active, asset_name)
 
-    meshType = GetAssetType(active)
+    ClearVertexColorForUnrealExport(active)
+    ResetSocketsExportName(active)
+    ResetSocketsTransform(active)
+    CleanDeleteDuplicate(duplicate_data)
 
-    bfu_check_potential_error.UpdateNameHierarchy(
-        GetAllCollisionAndSocketsObj(bpy.context.selected_objects)
-        )
+    ResetDuplicateNameAfterExport(duplicate_data)
 
-    asset_name.SetExportName()
+    for obj in scene.objects:
+        ClearAllBFUTempVars(obj)
 
-    bpy.ops.export_scene.fbx(
-        filepath=GetExportFullpath(dirpath, filename),
-        check_existing=False,
-        use_selection=True,
-        global_scale=GetObjExportScale(active),
-        object_types={'EMPTY', 'CAMERA', 'LIGHT', 'MESH', 'OTHER'},
-        use_custom_props=addon_prefs.exportWithCustomProps,
-        mesh_smooth_type="FACE",
-        add_leaf_bones=False,
-        use_armature_deform_only=active.exportDeformOnly,
-        bake_anim=False,
-        use_metadata=addon_prefs.exportWithMetaData,
-        primary_bone_axis=active.exportPrimaryBaneAxis,
-        secondary_bone_axis=active.exporSecondaryBoneAxis,
-        axis_forward=active.exportAxisForward,
-        axis_up=active.exportAxisUp,
-        bake_space_transform=False
-        )
 
-    asset_name.ResetNames()
+def ExportStaticMeshLodChain(obj, lods):
+    '''
+    #####################################################
+            #STATIC MESH LOD CHAIN
+    #####################################################
+    '''
+    # Export a StaticMesh and its lods with a single duplication and modifier application.
+    # Each lod is written in its own file like with ExportSingleStaticMesh.
 
-    ClearVertexColorForUnrealExport(active)
-    ResetSocketsExportName(active)
-    ResetSocketsTransform(active)
-    CleanDeleteObjects(bpy.context.selected_objects)
-    for data in duplicate_data.data_to_remove:
-        data.RemoveData()
+    scene = bpy.context.scene
+    view_layer = bpy.context.view_layer
+
+    bbpl.utils.SafeModeSet('OBJECT')
+
+    members = [obj] + [lod for lod_number, lod in lods]
+    member_names = [member.name for member in members]  # The originals are renamed during export
+
+    # Select the objects of all the chain
+    chain_objects = []
+    for member in members:
+        SelectParentAndDesiredChilds(member)
+        for selected in bpy.context.selected_objects:
+            if selected not in chain_objects:
+                chain_objects.append(selected)
+    bpy.ops.object.select_all(action='DESELECT')
+    for chain_object in chain_objects:
+        chain_object.select_set(True)
+    view_layer.objects.active = obj
+
+    asset_names = [PrepareExportName(member, False) for member in members]
+    duplicate_data = DuplicateSelectForExport()
+    SetDuplicateNameForExport(duplicate_data)
+
+    MakeSelectVisualReal()
+
+    ApplyNeededModifierToSelect()
+    for selected in bpy.context.selected_objects:
+        SetVertexColorForUnrealExport(selected)
+        ConvertGeometryNodeAttributeToUV(selected)
+        CorrectExtremUVAtExport(selected)
+        SetSocketsExportTransform(selected)
+        SetSocketsExportName(selected)
+
+    # Split the duplicated objects by lod, each object go to its nearest lod parent
+    duplicate_members = [scene.objects[member_name] for member_name in member_names]
+    staging_objects = MyExportStaging.GetCollection().objects
+    for duplicate_member in duplicate_members:
+        # A member hidden or not selectable is not duplicated, never export the original
+        if duplicate_member.name not in staging_objects:
+            raise RuntimeError("LOD chain member '" + duplicate_member.name + "' was not duplicated for export")
+    staged_objects = list(bpy.context.selected_objects)
+    member_objects = {}
+    for staged_object in staged_objects:
+        parent = staged_object
+        while parent is not None and parent not in duplicate_members:
+            parent = parent.parent
+        if parent is not None:
+            member_objects.setdefault(parent.name, []).append(staged_object)
+
+    for active, asset_name in zip(duplicate_members, asset_names):
+        bpy.ops.object.select_all(action='DESELECT')
+        for member_object in member_objects.get(active.name, [active]):
+            member_object.select_set(True)
+        view_layer.objects.active = active
+        asset_name.target_object = active
+
+        dirpath = GetObjExportDir(active)
+        ExportStaticMeshFbx(dirpath, GetObjExportFileName(active), active, asset_name)
+
+        ClearVertexColorForUnrealExport(active)
+        ResetSocketsExportName(active)
+        ResetSocketsTransform(active)
+
+    # Select all the chain for remove the duplicated objects
+    for staged_object in staged_objects:
+        staged_object.select_set(True)
+    CleanDeleteDuplicate(duplicate_data)
 
     ResetDuplicateNameAfterExport(duplicate_data)
 
     for obj in scene.objects:
         ClearAllBFUTempVars(obj)
+
+
+def ExportStaticMeshFbx(dirpath, filename, active, asset_name):
+    # Write the selected objects of a prepared StaticMesh
+
+    addon_prefs = GetAddonPrefs()
+
+    ApplyExportTransform(active, "Object")
+
+    bfu_check_potential_error.UpdateNameHierarchy(
+        GetAllCollisionAndSocketsObj(bpy.context.selected_objects)
+        )
+
+    asset_name.SetExportName()
+
+    with ExportSpan("export_scene.fbx"):
+        bpy.ops.export_scene.fbx(
+            filepath=GetExportFullpath(dirpath, filename),
+            check_existing=False,
+            use_selection=True,
+            global_scale=GetObjExportScale(active),
+            object_types={'EMPTY', 'CAMERA', 'LIGHT', 'MESH', 'OTHER'},
+            use_custom_props=addon_prefs.exportWithCustomProps,
+            mesh_smooth_type="FACE",
+            add_leaf_bones=False,
+            use_armature_deform_only=active.exportDeformOnly,
+            bake_anim=False,
+            use_metadata=addon_prefs.exportWithMetaData,
+            primary_bone_axis=active.exportPrimaryBaneAxis,
+            secondary_bone_axis=active.exporSecondaryBoneAxis,
+            axis_forward=active.exportAxisForward,
+            axis_up=active.exportAxisUp,
+            bake_space_transform=False
+            )
+
+    asset_name.ResetNames()
@@ -120,32 +120,31 @@ def ExportSingleStaticMeshCollection(
         GetAllCollisionAndSocketsObj(bpy.context.selected_objects)
         )
 
-    bpy.ops.export_scene.fbx(
-        filepath=GetExportFullpath(dirpath, filename),
-        check_existing=False,
-        use_selection=True,
-        global_scale=1,
-        object_types={'EMPTY', 'CAMERA', 'LIGHT', 'MESH', 'OTHER'},
-        use_custom_props=addon_prefs.exportWithCustomProps,
-        mesh_smooth_type="FACE",
-        add_leaf_bones=False,
-        # use_armature_deform_only=active.exportDeformOnly,
-        bake_anim=False,
-        use_metadata=addon_prefs.exportWithMetaData,
-        # primary_bone_axis=active.exportPrimaryBaneAxis,
-        # secondary_bone_axis=active.exporSecondaryBoneAxis,
-        # axis_forward=active.exportAxisForward,
-        # axis_up=active.exportAxisUp,
-        bake_space_transform=False
-        )
+    with ExportSpan("export_scene.fbx"):
+        bpy.ops.export_scene.fbx(
+            filepath=GetExportFullpath(dirpath, filename),
+            check_existing=False,
+            use_selection=True,
+            global_scale=1,
+            object_types={'EMPTY', 'CAMERA', 'LIGHT', 'MESH', 'OTHER'},
+            use_custom_props=addon_prefs.exportWithCustomProps,
+            mesh_smooth_type="FACE",
+            add_leaf_bones=False,
+            # use_armature_deform_only=active.exportDeformOnly,
+            bake_anim=False,
+            use_metadata=addon_prefs.exportWithMetaData,
+            # primary_bone_axis=active.exportPrimaryBaneAxis,
+            # secondary_bone_axis=active.exporSecondaryBoneAxis,
+            # axis_forward=active.exportAxisForward,
+            # axis_up=active.exportAxisUp,
+            bake_space_transform=False
+            )
     for obj in bpy.context.selected_objects:
         ClearVertexColorForUnrealExport(obj)
         ResetSocketsExportName(obj)
         ResetSocketsTransform(obj)
 
-    CleanDeleteObjects(bpy.context.selected_objects)
-    for data in duplicate_data.data_to_remove:
-        data.RemoveData()
+    CleanDeleteDuplicate(duplicate_data)
 
     ResetDuplicateNameAfterExport(duplicate_data)
 
@@ -31,6 +31,8 @@ if "bpy" in locals():
         importlib.reload(bfu_utils)
     if "bfu_export_get_info" in locals():
         importlib.reload(bfu_export_get_info)
+    if "bfu_export_profiler" in locals():
+        importlib.reload(bfu_export_profiler)
 
 from .. import bfu_write_text
 from .. import bfu_basics
@@ -41,6 +43,8 @@ from ..bbpl import utils
 
 from . import bfu_export_get_info
 from .bfu_export_get_info import *
+from . import bfu_export_profiler
+from .bfu_export_profiler import ExportSpan, ProfileExport
 
 dup_temp_name = "BFU_Temp"  # DuplicateTemporarilyNameForUe4Export
 Export_temp_preFix = "_ESO_Temp"  # _ExportSubObject_TempName
@@ -114,6 +118,7 @@ def ApplyProxyData(obj):
             SetCurrentSelection(SavedSelect)
 
 
+@ProfileExport()
 def BakeArmatureAnimation(armature, frame_start, frame_end):
     # Change to pose mode
     SavedSelect = GetCurrentSelection()
@@ -132,14 +137,57 @@ def BakeArmatureAnimation(armature, frame_start, frame_end):
     SetCurrentSelection(SavedSelect)
 
 
+class ExportStaging():
+    # Temporary collection that contains the duplicated objects used for export.
+    # The collection is reused by all assets and the objects are removed in one call.
+
+    def __init__(self):
+        self.collection_name = "BFU_ExportStaging"
+
+    def GetCollection(self):
+        scene = bpy.context.scene
+        collection = bpy.data.collections.get(self.collection_name)
+        if collection is None:
+            collection = bpy.data.collections.new(self.collection_name)
+        if collection.name not in scene.collection.children:
+            scene.collection.children.link(collection)
+        return collection
+
+    def Clear(self, other_objects=()):
+        # Remove the staging objects and their data when the data is no longer used
+        collection = bpy.data.collections.get(self.collection_name)
+        objs = set(other_objects)
+        if collection is not None:
+            objs.update(collection.all_objects)
+        if len(objs) == 0:
+            return []
+
+        removed_objects = [obj.name for obj in objs]
+        datas = set(obj.data for obj in objs if obj.data is not None)
+        bpy.data.batch_remove(objs)
+        bpy.data.batch_remove([data for data in datas if data.users == 0])
+        return removed_objects
+
+    def Remove(self):
+        self.Clear()
+        collection = bpy.data.collections.get(self.collection_name)
+        if collection is not None:
+            bpy.data.collections.remove(collection)
+
+
+MyExportStaging = ExportStaging()
+
+
+@ProfileExport()
 def DuplicateSelectForExport(new_name="duplicated Obj"):
-    # Note: Need look for a optimized duplicate, This is too long
+    # Copy the selected objects in the export staging collection.
+    # Use ID.copy() without operator so the actions are not duplicated.
 
     scene = bpy.context.scene
+    view_layer = bpy.context.view_layer
 
     class DuplicateData():
         def __init__(self):
-            self.data_to_remove = []
             self.origin_select = None
             self.duplicate_select = None
 
@@ -153,16 +201,6 @@ def DuplicateSelectForExport(new_name="duplicated Obj"):
             select.SaveCurrentSelect()
             self.duplicate_select = select
 
-    class DelegateOldData():
-        # contain a data to remove and function for remove
-
-        def __init__(self, data_name, data_type):
-            self.data_name = data_name
-            self.data_type = data_type
-
-        def RemoveData(self):
-            RemoveUselessSpecificData(self.data_name, self.data_type)
-
     duplicate_data = DuplicateData()
     duplicate_data.SetOriginSelect()
     for user_selected in duplicate_data.origin_select.user_selecteds:
@@ -171,41 +209,79 @@ def DuplicateSelectForExport(new_name="duplicated Obj"):
             if user_selected.type == "ARMATURE":
                 SetObjProxyData(user_selected)
 
-    data_to_remove = []
-
-    # Save action befor export
-    actionNames = []
-    for action in bpy.data.actions:
-        actionNames.append(action.name)
-
-    bpy.ops.object.duplicate()
-
-    # Save the name for found after "Make Instances Real"
-    currentSelectNames = []
-    for currentSelectName in bpy.context.selected_objects:
-        currentSelectNames.append(currentSelectName.name)
-
-    for objSelect in currentSelectNames:
-        if objSelect not in bpy.context.selected_objects:
-            bpy.data.objects[objSelect].select_set(True)
-
-    # Make sigle user and clean useless data.
-    for objScene in bpy.context.selected_objects:
-        if objScene.data is not None:
-            oldData = objScene.data.name
-            objScene.data = objScene.data.copy()
-            data_to_remove.append(DelegateOldData(oldData, objScene.type))
-
-    # Clean create actions by duplication
-    for action in bpy.data.actions:
-        if action.name not in actionNames:
-            bpy.data.actions.remove(action)
+    staging_collection = MyExportStaging.GetCollection()
+
+    # Make single user copy
+    duplicates = {}
+    for obj in bpy.context.selected_objects:
+        new_obj = obj.copy()
+        if obj.data is not None:
+            new_obj.data = obj.data.copy()
+        staging_collection.objects.link(new_obj)
+        duplicates[obj] = new_obj
+
+    # Use the duplicated objects in relations like bpy.ops.object.duplicate()
+    def RemapToDuplicate(struct):
+        # All the Object pointers (modifier object, mirror_object, pole_target, start_cap...)
+        for prop in struct.bl_rna.properties:
+            if prop.type == 'POINTER' and not prop.is_readonly and prop.fixed_type.identifier == "Object":
+                target = getattr(struct, prop.identifier)
+                if target in duplicates:
+                    setattr(struct, prop.identifier, duplicates[target])
+
+    def RemapConstraintsToDuplicate(constraints):
+        for cons in constraints:
+            RemapToDuplicate(cons)
+            # Armature constraint targets
+            for cons_target in getattr(cons, "targets", []):
+                RemapToDuplicate(cons_target)
+
+    def RemapDriversToDuplicate(id_data):
+        if id_data is None or id_data.animation_data is None:
+            return
+        for driver in id_data.animation_data.drivers:
+            for variable in driver.driver.variables:
+                for variable_target in variable.targets:
+                    if variable_target.id in duplicates:
+                        variable_target.id = duplicates[variable_target.id]
+
+    for new_obj in duplicates.values():
+        if new_obj.parent in duplicates:
+            parent_inverse = new_obj.matrix_parent_inverse.copy()
+            new_obj.parent = duplicates[new_obj.parent]
+            new_obj.matrix_parent_inverse = parent_inverse
+        for mod in new_obj.modifiers:
+            RemapToDuplicate(mod)
+        RemapConstraintsToDuplicate(new_obj.constraints)
+        if new_obj.pose is not None:
+            for bone in new_obj.pose.bones:
+                RemapConstraintsToDuplicate(bone.constraints)
+        RemapDriversToDuplicate(new_obj)
+        RemapDriversToDuplicate(new_obj.data)
+        RemapDriversToDuplicate(getattr(new_obj.data, "shape_keys", None))
+
+    # Select the duplicated objects
+    origin_active = view_layer.objects.active
+    for obj in duplicates:
+        obj.select_set(False)
+    for new_obj in duplicates.values():
+        new_obj.select_set(True)
+    if origin_active in duplicates:
+        view_layer.objects.active = duplicates[origin_active]
 
     duplicate_data.SetDuplicateSelect()
 
     return duplicate_data
 
 
+@ProfileExport()
+def CleanDeleteDuplicate(duplicate_data):
+    # Remove the duplicated objects and the objects created during export
+    origin_objects = set(duplicate_data.origin_select.user_selecteds)
+    other_objects = [obj for obj in bpy.context.selected_objects if obj not in origin_objects]
+    return MyExportStaging.Clear(other_objects)
+
+
 def SetDuplicateNameForExport(duplicate_data, origin_prefix="or_"):
     for user_selected in duplicate_data.origin_select.user_selecteds:
         user_selected.name = origin_prefix+user_selected.name
@@ -220,14 +296,13 @@ def ResetDuplicateNameAfterExport(duplicate_data):
         ClearObjOriginNameVar(user_selected)
 
 
+@ProfileExport()
 def MakeSelectVisualReal():
     select = bbpl.utils.UserSelectSave()
     select.SaveCurrentSelect()
 
     # Save object list
-    previous_objects = []
-    for obj in bpy.data.objects:
-        previous_objects.append(obj)
+    previous_objects = set(bpy.data.objects)
 
     # Visual Transform Apply
     bpy.ops.object.visual_transform_apply()
@@ -372,6 +447,7 @@ class PrepareExportName():
 # UVs
 
 
+@ProfileExport()
 def ConvertGeometryNodeAttributeToUV(obj):
     # obj = bpy.context.active_object  # Debug
     if obj.convert_geometry_node_attribute_to_uv:
@@ -431,14 +507,12 @@ def ConvertGeometryNodeAttributeToUV(obj):
                 obj.data.attributes.remove(attrib_name)
 
 
+@ProfileExport()
 def CorrectExtremUVAtExport(obj):
+    # obj is the export duplicate, its mesh is edited without edit mode
     if obj.correct_extrem_uv_scale:
-        SavedSelect = GetCurrentSelection()
-        if GoToMeshEditMode():
-            CorrectExtremeUV(2)
-            bbpl.utils.SafeModeSet('OBJECT')
-            SetCurrentSelection(SavedSelect)
-            return True
+        if obj.type == "MESH":
+            return CorrectExtremeUVOnMesh(obj.data, 2)
     return False
 
 # Armature
@@ -589,6 +663,7 @@ def GetRescaleSocketFactor():
         return addon_prefs.staticSocketsImportedSize
 
 
+@ProfileExport()
 def ExportAutoProRig(
         filepath,
         use_selection=True,
@@ -630,22 +705,28 @@ def ExportAutoProRig(
     bpy.ops.id.arp_export_fbx_panel(filepath=filepath)
 
 
+@ProfileExport()
 def ExportSingleAdditionalTrackCamera(dirpath, filename, obj):
     # Export additional camera track for ue4
     # FocalLength
     # FocusDistance
     # Aperture
 
+    addon_prefs = GetAddonPrefs()
+    columnar = addon_prefs.cameraTrackFormat == "columnar"
+
     absdirpath = bpy.path.abspath(dirpath)
     VerifiDirs(absdirpath)
-    AdditionalTrack = bfu_write_text.WriteCameraAnimationTracks(obj)
+    AdditionalTrack = bfu_write_text.WriteCameraAnimationTracks(obj, columnar=columnar)
     return bfu_write_text.ExportSingleJson(
         AdditionalTrack,
         absdirpath,
-        filename
+        filename,
+        compact=columnar
         )
 
 
+@ProfileExport()
 def ExportAdditionalParameter(dirpath, unreal_exported_asset):
     # Export additional parameter from static and skeletal mesh track for ue4
     # SocketsList
@@ -2,12 +2,15 @@
 # It will import into Unreal Engine all the assets of type StaticMesh, SkeletalMesh, Animation and Pose
 # The script must be used in Unreal Engine Editor with Python plugins : https://docs.unrealengine.com/en-US/Engine/Editor/ScriptingAndAutomation/Python
 # Use this command in Unreal cmd consol: py "[ScriptLocation]\ImportSequencerScript.py"
+# Add --force after the script location to import again the assets with unchanged files
 
 
 from unittest import result
 import sys
 import os.path
 import json
+import time
+import hashlib
 
 try:  # TO DO: Found a better way to check that.
     import unreal
@@ -43,25 +46,116 @@ def JsonLoadFile(json_file_path):
             return JsonLoad(json_file)
 
 
+def JsonSaveFile(json_file_path, data):
+    if sys.version_info[0] < 3:
+        with open(json_file_path, "w") as json_file:
+            json.dump(data, json_file, sort_keys=True, indent=4)
+    else:
+        with open(json_file_path, "w", encoding="utf8") as json_file:
+            json.dump(data, json_file, ensure_ascii=False, sort_keys=True, indent=4)
+
+
 def GetUnrealVersion():
     version = unreal.SystemLibrary.get_engine_version().split(".")
     float_version = int(version[0]) + float(float(version[1])/100)
     return float_version
 
 
-def ImportAllAssets():
+import_hash_manifest_filename = 'ImportedAssetHashes.json'
+import_hash_manifest_version = 1
+
+
+class AssetImport():
+    # Import task of an asset and the data needed after the import
+
+    def __init__(self, asset_data, task):
+        self.asset_data = asset_data
+        self.task = task
+        self.import_hash = None
+        self.additional_data = None
+        self.vertex_color_import_option = None
+        self.vertex_override_color = None
+
+
+class ImportHashManifest():
+    # Import hash of the last imported assets, saved next to ImportAssetData.json.
+    # Used to skip the assets with unchanged files and import settings.
+
+    def __init__(self, path):
+        self.path = path
+        self.assets = {}
+
+    def Load(self):
+        self.assets = {}
+        if not os.path.isfile(self.path):
+            return
+        try:
+            data = JsonLoadFile(self.path)
+        except ValueError:
+            print("Import hash manifest is unreadable, all assets will be imported: " + self.path)
+            return
+        if data.get("version") == import_hash_manifest_version:
+            self.assets = data.get("assets", {})
+
+    def Save(self):
+        data = {}
+        data["version"] = import_hash_manifest_version
+        data["assets"] = self.assets
+        JsonSaveFile(self.path, data)
+
+    def IsAssetUpToDate(self, key, import_hash):
+        record = self.assets.get(key)
+        if import_hash is None or record is None:
+            return False
+        if record["hash"] != import_hash:
+            return False
+        # The asset can be removed in Unreal since the last import
+        return unreal.EditorAssetLibrary.does_asset_exist(record["path"])
+
+    def RecordImportedAsset(self, key, import_hash, asset_path):
+        if import_hash is None:
+            self.assets.pop(key, None)
+        else:
+            self.assets[key] = {"hash": import_hash, "path": asset_path}
+
+
+class ImportPhaseTime():
+    # Time used by an import phase
+
+    def __init__(self, name):
+        self.name = name
+        self.asset_count = 0
+        self.prepare_time = 0.0
+        self.import_time = 0.0
+        self.post_time = 0.0
+
+    def GetTime(self):
+        return self.prepare_time + self.import_time + self.post_time
+
+
+def ImportAllAssets(json_data_path=None, force_import=False):
 
     import string
 
     # Prepare process import
-    json_data_file = 'ImportAssetData.json'
-    dir_path = os.path.dirname(os.path.realpath(__file__))
+    if json_data_path is None:
+        json_data_file = 'ImportAssetData.json'
+        dir_path = os.path.dirname(os.path.realpath(__file__))
+        json_data_path = os.path.join(dir_path, json_data_file)
 
-    import_assets_data = JsonLoadFile(os.path.join(dir_path, json_data_file))
+    import_assets_data = JsonLoadFile(json_data_path)
+
+    hash_manifest = ImportHashManifest(os.path.join(os.path.dirname(json_data_path), import_hash_manifest_filename))
+    hash_manifest.Load()
 
     unreal_import_location = import_assets_data['unreal_import_location']
     ImportedList = []
     ImportFailList = []
+    SkippedList = []
+    PhaseTimeList = []
+
+    # Skeleton assets found by path, cleared after each import because new skeletons can be created
+    SkeletonCache = {}
 
     def ValidUnrealAssetsName(filename):
         # Normalizes string, removes non-alpha characters
@@ -82,15 +176,59 @@ def ImportAllAssets():
                 target_assets.append(asset)
         return target_assets
 
-    def ImportAsset(asset_data):
+    def GetFileHashByPath():
+        # Hash of the exported fbx files, used for the lods
+        file_hashes = {}
+        for asset_data in import_assets_data["assets"]:
+            if "file_hashes" in asset_data and asset_data["fbx_path"]:
+                file_hashes[asset_data["fbx_path"]] = asset_data["file_hashes"].get("FBX")
+        return file_hashes
+
+    FileHashByPath = GetFileHashByPath()
+
+    def GetAssetKey(asset_data):
+        return asset_data["type"] + ":" + asset_data["full_import_path"] + "/" + asset_data["name"]
+
+    def GetAssetImportHash(asset_data):
+        # Hash of the import settings and of all the files used by the import.
+        # None when the files have no hash (ImportAssetData.json from an old version).
+        if "file_hashes" not in asset_data:
+            return None
+
+        hashed_data = dict(asset_data)
+        hashed_data.pop("export_skipped", None)
+        hasher = hashlib.sha1()
+        hasher.update(json.dumps(hashed_data, sort_keys=True).encode("utf8"))
+
+        if asset_data["type"] == "StaticMesh" and asset_data["additional_tracks_path"]:
+            if os.path.isfile(asset_data["additional_tracks_path"]):
+                additional_data = JsonLoadFile(asset_data["additional_tracks_path"])
+                if "LevelOfDetail" in additional_data:
+                    for lod_name in sorted(additional_data["LevelOfDetail"]):
+                        lod_hash = FileHashByPath.get(additional_data["LevelOfDetail"][lod_name])
+                        hasher.update((lod_name + ":" + str(lod_hash)).encode("utf8"))
+        return hasher.hexdigest()
+
+    def GetSkeleton(skeleton_path):
+        if skeleton_path not in SkeletonCache:
+            find_asset = unreal.find_asset(skeleton_path)
+            if isinstance(find_asset, unreal.Skeleton):
+                SkeletonCache[skeleton_path] = find_asset
+            elif isinstance(find_asset, unreal.SkeletalMesh):
+                SkeletonCache[skeleton_path] = find_asset.skeleton
+            else:
+                SkeletonCache[skeleton_path] = None
+        return SkeletonCache[skeleton_path]
+
+    def PrepareAssetImport(asset_data, counter):
+        # Create the import task of the asset, return None if the asset should not be imported
 
-        counter = str(len(ImportedList)+1) + "/" + str(len(import_assets_data["assets"]))
         print("Import asset " + counter + ": ", asset_data["name"])
 
         if asset_data["type"] == "StaticMesh" or asset_data["type"] == "SkeletalMesh":
             if "lod" in asset_data:
                 if asset_data["lod"] > 0:  # Lod should not be imported here so return if lod is not 0.
-                    return
+                    return None
 
         if asset_data["type"] == "Alembic":
             FileType = "ABC"
@@ -109,387 +247,455 @@ def ImportAllAssets():
 
         additional_data = GetAdditionalData()
 
-        def ImportTask():
-            # New import task
-            # Property
-
-            if asset_data["type"] == "Animation" or asset_data["type"] == "SkeletalMesh":
-                find_asset = unreal.find_asset(asset_data["animation_skeleton_path"])
-                if isinstance(find_asset, unreal.Skeleton):
-                    OriginSkeleton = find_asset
-                elif isinstance(find_asset, unreal.SkeletalMesh):
-                    OriginSkeleton = find_asset.skeleton
-                else:
-                    OriginSkeleton = None
-                if OriginSkeleton:
-                    print("Setting skeleton asset: " + OriginSkeleton.get_full_name())
-                else:
-                    print("Could not find skeleton at the path: " + asset_data["animation_skeleton_path"])
-
-            # docs.unrealengine.com/4.26/en-US/PythonAPI/class/AssetImportTask.html
-            task = unreal.AssetImportTask()
-
-            def GetStaticMeshImportData():
-                if asset_data["type"] == "StaticMesh":
-                    return task.get_editor_property('options').static_mesh_import_data
-                return None
-
-            def GetSkeletalMeshImportData():
-                if asset_data["type"] == "SkeletalMesh":
-                    return task.get_editor_property('options').skeletal_mesh_import_data
-                return None
+        # New import task
+        # Property
 
-            def GetAnimationImportData():
-                if asset_data["type"] == "Animation":
-                    return task.get_editor_property('options').anim_sequence_import_data
-                return None
+        if asset_data["type"] == "Animation" or asset_data["type"] == "SkeletalMesh":
+            OriginSkeleton = GetSkeleton(asset_data["animation_skeleton_path"])
+            if OriginSkeleton:
+                print("Setting skeleton asset: " + OriginSkeleton.get_full_name())
+            else:
+                print("Could not find skeleton at the path: " + asset_data["animation_skeleton_path"])
 
-            def GetAlembicImportData():
-                if asset_data["type"] == "Alembic":
-                    return task.get_editor_property('options')
-                return None
+        # docs.unrealengine.com/4.26/en-US/PythonAPI/class/AssetImportTask.html
+        task = unreal.AssetImportTask()
 
-            def GetMeshImportData():
-                if asset_data["type"] == "StaticMesh":
-                    return GetStaticMeshImportData()
-                if asset_data["type"] == "SkeletalMesh":
-                    return GetSkeletalMeshImportData()
-
-                return None
+        def GetStaticMeshImportData():
+            if asset_data["type"] == "StaticMesh":
+                return task.get_editor_property('options').static_mesh_import_data
+            return None
 
-            if asset_data["type"] == "Alembic":
-                task.filename = asset_data["abc_path"]
-            else:
-                task.filename = asset_data["fbx_path"]
-            task.destination_path = os.path.normpath(asset_data["full_import_path"]).replace('\\', '/')
-            task.automated = True
-            # task.automated = False #Debug for show dialog
-            task.save = True
-            task.replace_existing = True
+        def GetSkeletalMeshImportData():
+            if asset_data["type"] == "SkeletalMesh":
+                return task.get_editor_property('options').skeletal_mesh_import_data
+            return None
 
-            if asset_data["type"] == "Alembic":
-                task.set_editor_property('options', unreal.AbcImportSettings())
-            else:
-                task.set_editor_property('options', unreal.FbxImportUI())
-
-            # Alembic
-            if GetAlembicImportData():
-                GetAlembicImportData().static_mesh_settings.set_editor_property("merge_meshes", True)
-                GetAlembicImportData().set_editor_property("import_type", unreal.AlembicImportType.SKELETAL)
-                GetAlembicImportData().conversion_settings.set_editor_property("flip_u", False)
-                GetAlembicImportData().conversion_settings.set_editor_property("flip_v", True)
-                GetAlembicImportData().conversion_settings.set_editor_property("scale", unreal.Vector(100, -100, 100))
-                GetAlembicImportData().conversion_settings.set_editor_property("rotation", unreal.Vector(90, 0, 0))
-
-            # Vertex color
-            vertex_override_color = None
-            vertex_color_import_option = None
-            if additional_data:
-
-                vertex_color_import_option = unreal.VertexColorImportOption.REPLACE  # Default
-                if "vertex_color_import_option" in additional_data:
-                    if additional_data["vertex_color_import_option"] == "IGNORE":
-                        vertex_color_import_option = unreal.VertexColorImportOption.IGNORE
-                    elif additional_data["vertex_color_import_option"] == "OVERRIDE":
-                        vertex_color_import_option = unreal.VertexColorImportOption.OVERRIDE
-                    elif additional_data["vertex_color_import_option"] == "REPLACE":
-                        vertex_color_import_option = unreal.VertexColorImportOption.REPLACE
-
-                if "vertex_override_color" in additional_data:
-                    vertex_override_color = unreal.LinearColor(
-                        additional_data["vertex_override_color"][0],
-                        additional_data["vertex_override_color"][1],
-                        additional_data["vertex_override_color"][2]
-                        )
-
-            # #################################[Change]
-
-            # unreal.FbxImportUI
-            # https://docs.unrealengine.com/4.26/en-US/PythonAPI/class/FbxImportUI.html
-
-            # Import transform
-            anim_sequence_import_data = GetAnimationImportData()
-            if anim_sequence_import_data:
-                anim_sequence_import_data.import_translation = unreal.Vector(0, 0, 0)
-
-            # Vertex color
-            if vertex_color_import_option and GetMeshImportData():
-                GetMeshImportData().set_editor_property('vertex_color_import_option', vertex_color_import_option)
-
-            if vertex_override_color and GetMeshImportData():
-                GetMeshImportData().set_editor_property('vertex_override_color', vertex_override_color.to_rgbe())
+        def GetAnimationImportData():
+            if asset_data["type"] == "Animation":
+                return task.get_editor_property('options').anim_sequence_import_data
+            return None
 
+        def GetAlembicImportData():
             if asset_data["type"] == "Alembic":
-                task.get_editor_property('options').set_editor_property('import_type', unreal.AlembicImportType.SKELETAL)
-
-            else:
-                if asset_data["type"] == "Animation" or asset_data["type"] == "SkeletalMesh":
-                    if OriginSkeleton:
-                        task.get_editor_property('options').set_editor_property('Skeleton', OriginSkeleton)
-                    else:
-                        if asset_data["type"] == "Animation":
-                            ImportFailList.append('Skeleton ' + asset_data["animation_skeleton_path"] + ' Not found for ' + asset_data["name"] + ' asset.')
-                            return
-                        else:
-                            print("Skeleton is not set, a new skeleton asset will be created...")
+                return task.get_editor_property('options')
+            return None
 
+        def GetMeshImportData():
+            if asset_data["type"] == "StaticMesh":
+                return GetStaticMeshImportData()
+            if asset_data["type"] == "SkeletalMesh":
+                return GetSkeletalMeshImportData()
 
-                if asset_data["type"] == "StaticMesh":
-                    task.get_editor_property('options').set_editor_property('original_import_type', unreal.FBXImportType.FBXIT_STATIC_MESH)
-                elif asset_data["type"] == "Animation":
-                    task.get_editor_property('options').set_editor_property('original_import_type', unreal.FBXImportType.FBXIT_ANIMATION)
-                else:
-                    task.get_editor_property('options').set_editor_property('original_import_type', unreal.FBXImportType.FBXIT_SKELETAL_MESH)
+            return None
 
-                if asset_data["type"] == "Animation":
-                    task.get_editor_property('options').set_editor_property('import_materials', False)
-                else:
-                    task.get_editor_property('options').set_editor_property('import_materials', True)
+        if asset_data["type"] == "Alembic":
+            task.filename = asset_data["abc_path"]
+        else:
+            task.filename = asset_data["fbx_path"]
+        task.destination_path = os.path.normpath(asset_data["full_import_path"]).replace('\\', '/')
+        task.automated = True
+        # task.automated = False #Debug for show dialog
+        task.save = True
+        task.replace_existing = True
 
-                task.get_editor_property('options').set_editor_property('import_textures', False)
+        if asset_data["type"] == "Alembic":
+            task.set_editor_property('options', unreal.AbcImportSettings())
+        else:
+            task.set_editor_property('options', unreal.FbxImportUI())
+
+        # Alembic
+        if GetAlembicImportData():
+            GetAlembicImportData().static_mesh_settings.set_editor_property("merge_meshes", True)
+            GetAlembicImportData().set_editor_property("import_type", unreal.AlembicImportType.SKELETAL)
+            GetAlembicImportData().conversion_settings.set_editor_property("flip_u", False)
+            GetAlembicImportData().conversion_settings.set_editor_property("flip_v", True)
+            GetAlembicImportData().conversion_settings.set_editor_property("scale", unreal.Vector(100, -100, 100))
+            GetAlembicImportData().conversion_settings.set_editor_property("rotation", unreal.Vector(90, 0, 0))
+
+        # Vertex color
+        vertex_override_color = None
+        vertex_color_import_option = None
+        if additional_data:
+
+            vertex_color_import_option = unreal.VertexColorImportOption.REPLACE  # Default
+            if "vertex_color_import_option" in additional_data:
+                if additional_data["vertex_color_import_option"] == "IGNORE":
+                    vertex_color_import_option = unreal.VertexColorImportOption.IGNORE
+                elif additional_data["vertex_color_import_option"] == "OVERRIDE":
+                    vertex_color_import_option = unreal.VertexColorImportOption.OVERRIDE
+                elif additional_data["vertex_color_import_option"] == "REPLACE":
+                    vertex_color_import_option = unreal.VertexColorImportOption.REPLACE
+
+            if "vertex_override_color" in additional_data:
+                vertex_override_color = unreal.LinearColor(
+                    additional_data["vertex_override_color"][0],
+                    additional_data["vertex_override_color"][1],
+                    additional_data["vertex_override_color"][2]
+                    )
+
+        # #################################[Change]
+
+        # unreal.FbxImportUI
+        # https://docs.unrealengine.com/4.26/en-US/PythonAPI/class/FbxImportUI.html
+
+        # Import transform
+        anim_sequence_import_data = GetAnimationImportData()
+        if anim_sequence_import_data:
+            anim_sequence_import_data.import_translation = unreal.Vector(0, 0, 0)
+
+        # Vertex color
+        if vertex_color_import_option and GetMeshImportData():
+            GetMeshImportData().set_editor_property('vertex_color_import_option', vertex_color_import_option)
+
+        if vertex_override_color and GetMeshImportData():
+            GetMeshImportData().set_editor_property('vertex_override_color', vertex_override_color.to_rgbe())
 
-                if asset_data["type"] == "Animation":
+        if asset_data["type"] == "Alembic":
+            task.get_editor_property('options').set_editor_property('import_type', unreal.AlembicImportType.SKELETAL)
 
-                    task.get_editor_property('options').set_editor_property('import_animations', True)
-                    task.get_editor_property('options').set_editor_property('import_mesh', False)
-                    task.get_editor_property('options').set_editor_property('create_physics_asset',False)
+        else:
+            if asset_data["type"] == "Animation" or asset_data["type"] == "SkeletalMesh":
+                if OriginSkeleton:
+                    task.get_editor_property('options').set_editor_property('Skeleton', OriginSkeleton)
                 else:
-                    task.get_editor_property('options').set_editor_property('import_animations', False)
-                    task.get_editor_property('options').set_editor_property('import_mesh', True)
-                    if "create_physics_asset" in asset_data:
-                        task.get_editor_property('options').set_editor_property('create_physics_asset', asset_data["create_physics_asset"])
-
-                # unreal.FbxMeshImportData
-
-                if asset_data["type"] == "StaticMesh" or asset_data["type"] == "SkeletalMesh":
-                    if "material_search_location" in asset_data:
-                        # unreal.FbxTextureImportData
-                        if asset_data["material_search_location"] == "Local":
-                            task.get_editor_property('options').texture_import_data.set_editor_property('material_search_location', unreal.MaterialSearchLocation.LOCAL)
-                        if asset_data["material_search_location"] == "UnderParent":
-                            task.get_editor_property('options').texture_import_data.set_editor_property('material_search_location', unreal.MaterialSearchLocation.UNDER_PARENT)
-                        if asset_data["material_search_location"] == "UnderRoot":
-                            task.get_editor_property('options').texture_import_data.set_editor_property('material_search_location', unreal.MaterialSearchLocation.UNDER_ROOT)
-                        if asset_data["material_search_location"] == "AllAssets":
-                            task.get_editor_property('options').texture_import_data.set_editor_property('material_search_location', unreal.MaterialSearchLocation.ALL_ASSETS)
+                    if asset_data["type"] == "Animation":
+                        ImportFailList.append('Skeleton ' + asset_data["animation_skeleton_path"] + ' Not found for ' + asset_data["name"] + ' asset.')
+                        return None
+                    else:
+                        print("Skeleton is not set, a new skeleton asset will be created...")
 
-                if asset_data["type"] == "StaticMesh":
-                    # unreal.FbxStaticMeshImportData
-                    task.get_editor_property('options').static_mesh_import_data.set_editor_property('combine_meshes', True)
-                    if "auto_generate_collision" in asset_data:
-                        task.get_editor_property('options').static_mesh_import_data.set_editor_property('auto_generate_collision', asset_data["auto_generate_collision"])
-                    if "static_mesh_lod_group" in asset_data:
-                        if asset_data["static_mesh_lod_group"]:
-                            task.get_editor_property('options').static_mesh_import_data.set_editor_property('static_mesh_lod_group', asset_data["static_mesh_lod_group"])
-                    if "generate_lightmap_u_vs" in asset_data:
-                        task.get_editor_property('options').static_mesh_import_data.set_editor_property('generate_lightmap_u_vs', asset_data["generate_lightmap_u_vs"])
-
-                if asset_data["type"] == "SkeletalMesh" or asset_data["type"] == "Animation":
-                    # unreal.FbxSkeletalMeshImportData
-                    task.get_editor_property('options').skeletal_mesh_import_data.set_editor_property('import_morph_targets', True)
-                    task.get_editor_property('options').skeletal_mesh_import_data.set_editor_property('convert_scene', True)
-                    task.get_editor_property('options').skeletal_mesh_import_data.set_editor_property('normal_import_method', unreal.FBXNormalImportMethod.FBXNIM_IMPORT_NORMALS_AND_TANGENTS)
-
-            # ###############[ pre import ]################
-
-            # Check is the file alredy exit
-            if additional_data:
-                if "preview_import_path" in additional_data:
-                    task_asset_full_path = task.destination_path+"/"+additional_data["preview_import_path"]+"."+additional_data["preview_import_path"]
-                    find_asset = unreal.find_asset(task_asset_full_path)
-                    if find_asset:
-
-                        # Vertex color
-
-                        asset_import_data = find_asset.get_editor_property('asset_import_data')
-                        if vertex_color_import_option:
-                            asset_import_data.set_editor_property('vertex_color_import_option', vertex_color_import_option) 
-
-                        if vertex_override_color:
-                            asset_import_data.set_editor_property('vertex_override_color', vertex_override_color.to_rgbe())
 
-            # ###############[ import asset ]################
+            if asset_data["type"] == "StaticMesh":
+                task.get_editor_property('options').set_editor_property('original_import_type', unreal.FBXImportType.FBXIT_STATIC_MESH)
+            elif asset_data["type"] == "Animation":
+                task.get_editor_property('options').set_editor_property('original_import_type', unreal.FBXImportType.FBXIT_ANIMATION)
+            else:
+                task.get_editor_property('options').set_editor_property('original_import_type', unreal.FBXImportType.FBXIT_SKELETAL_MESH)
 
-            print("Import task")
             if asset_data["type"] == "Animation":
-                '''
-                For animation the script will import a skeletal mesh and remove after.
-                If the skeletal mesh alredy exist try to remove.
-                '''
-
-                AssetName = asset_data["name"]
-                AssetName = ValidUnrealAssetsName(AssetName)
-                AssetPath = "SkeletalMesh'"+asset_data["full_import_path"]+"/"+AssetName+"."+AssetName+"'"
+                task.get_editor_property('options').set_editor_property('import_materials', False)
+            else:
+                task.get_editor_property('options').set_editor_property('import_materials', True)
 
-                if unreal.EditorAssetLibrary.does_asset_exist(AssetPath):
-                    oldAsset = unreal.EditorAssetLibrary.find_asset_data(AssetPath)
-                    if oldAsset.asset_class == "SkeletalMesh":
-                        unreal.EditorAssetLibrary.delete_asset(AssetPath)
+            task.get_editor_property('options').set_editor_property('import_textures', False)
 
-            unreal.AssetToolsHelpers.get_asset_tools().import_asset_tasks([task])
+            if asset_data["type"] == "Animation":
 
-            if len(task.imported_object_paths) > 0:
-                asset = unreal.find_asset(task.imported_object_paths[0])
+                task.get_editor_property('options').set_editor_property('import_animations', True)
+                task.get_editor_property('options').set_editor_property('import_mesh', False)
+                task.get_editor_property('options').set_editor_property('create_physics_asset',False)
             else:
-                asset = None
-
-            if asset is None:
-                ImportFailList.append('Error zero imported object for: ' + asset_data["name"])
-                return
+                task.get_editor_property('options').set_editor_property('import_animations', False)
+                task.get_editor_property('options').set_editor_property('import_mesh', True)
+                if "create_physics_asset" in asset_data:
+                    task.get_editor_property('options').set_editor_property('create_physics_asset', asset_data["create_physics_asset"])
 
-            if asset_data["type"] == "Animation":
-                # For animation remove the extra mesh
-                p = task.imported_object_paths[0]
-                if type(unreal.find_asset(p)) is not unreal.AnimSequence:
-                    animAssetName = p.split('.')[0]+'_anim.'+p.split('.')[1]+'_anim'
-                    animAssetNameDesiredPath = p.split('.')[0]+'.'+p.split('.')[1]
-                    animAsset = unreal.find_asset(animAssetName)
-                    if animAsset is not None:
-                        unreal.EditorAssetLibrary.delete_asset(p)
-                        unreal.EditorAssetLibrary.rename_asset(animAssetName, animAssetNameDesiredPath)
-                        asset = animAsset
-                    else:
-                        ImportFailList.append('animAsset ' + asset_data["name"] + ' not found for after inport: ' + animAssetName)
-                        return
+            # unreal.FbxMeshImportData
 
-            # ###############[ Post treatment ]################
+            if asset_data["type"] == "StaticMesh" or asset_data["type"] == "SkeletalMesh":
+                if "material_search_location" in asset_data:
+                    # unreal.FbxTextureImportData
+                    if asset_data["material_search_location"] == "Local":
+                        task.get_editor_property('options').texture_import_data.set_editor_property('material_search_location', unreal.MaterialSearchLocation.LOCAL)
+                    if asset_data["material_search_location"] == "UnderParent":
+                        task.get_editor_property('options').texture_import_data.set_editor_property('material_search_location', unreal.MaterialSearchLocation.UNDER_PARENT)
+                    if asset_data["material_search_location"] == "UnderRoot":
+                        task.get_editor_property('options').texture_import_data.set_editor_property('material_search_location', unreal.MaterialSearchLocation.UNDER_ROOT)
+                    if asset_data["material_search_location"] == "AllAssets":
+                        task.get_editor_property('options').texture_import_data.set_editor_property('material_search_location', unreal.MaterialSearchLocation.ALL_ASSETS)
 
-            asset_import_data = asset.get_editor_property('asset_import_data')
             if asset_data["type"] == "StaticMesh":
+                # unreal.FbxStaticMeshImportData
+                task.get_editor_property('options').static_mesh_import_data.set_editor_property('combine_meshes', True)
+                if "auto_generate_collision" in asset_data:
+                    task.get_editor_property('options').static_mesh_import_data.set_editor_property('auto_generate_collision', asset_data["auto_generate_collision"])
                 if "static_mesh_lod_group" in asset_data:
                     if asset_data["static_mesh_lod_group"]:
-                        asset.set_editor_property('lod_group', asset_data["static_mesh_lod_group"])
-                if "use_custom_light_map_resolution" in asset_data:
-                    if asset_data["use_custom_light_map_resolution"]:
-                        if "light_map_resolution" in asset_data:
-                            asset.set_editor_property('light_map_resolution', asset_data["light_map_resolution"])
-
-                if "collision_trace_flag" in asset_data:
-                    if asset_data["collision_trace_flag"] == "CTF_UseDefault":
-                        asset.get_editor_property('body_setup').set_editor_property('collision_trace_flag', unreal.CollisionTraceFlag.CTF_USE_DEFAULT)
-                    elif asset_data["collision_trace_flag"] == "CTF_UseSimpleAndComplex":
-                        asset.get_editor_property('body_setup').set_editor_property('collision_trace_flag', unreal.CollisionTraceFlag.CTF_USE_SIMPLE_AND_COMPLEX)
-                    elif asset_data["collision_trace_flag"] == "CTF_UseSimpleAsComplex":
-                        asset.get_editor_property('body_setup').set_editor_property('collision_trace_flag', unreal.CollisionTraceFlag.CTF_USE_SIMPLE_AS_COMPLEX)
-                    elif asset_data["collision_trace_flag"] == "CTF_UseComplexAsSimple":
-                        asset.get_editor_property('body_setup').set_editor_property('collision_trace_flag', unreal.CollisionTraceFlag.CTF_USE_COMPLEX_AS_SIMPLE)
-
-            if asset_data["type"] == "StaticMesh":
+                        task.get_editor_property('options').static_mesh_import_data.set_editor_property('static_mesh_lod_group', asset_data["static_mesh_lod_group"])
                 if "generate_lightmap_u_vs" in asset_data:
-                    asset_import_data.set_editor_property('generate_lightmap_u_vs', asset_data["generate_lightmap_u_vs"])  # Import data
-                    unreal.EditorStaticMeshLibrary.set_generate_lightmap_uv(asset, asset_data["generate_lightmap_u_vs"])  # Build settings at lod
+                    task.get_editor_property('options').static_mesh_import_data.set_editor_property('generate_lightmap_u_vs', asset_data["generate_lightmap_u_vs"])
+
+            if asset_data["type"] == "SkeletalMesh" or asset_data["type"] == "Animation":
+                # unreal.FbxSkeletalMeshImportData
+                task.get_editor_property('options').skeletal_mesh_import_data.set_editor_property('import_morph_targets', True)
+                task.get_editor_property('options').skeletal_mesh_import_data.set_editor_property('convert_scene', True)
+                task.get_editor_property('options').skeletal_mesh_import_data.set_editor_property('normal_import_method', unreal.FBXNormalImportMethod.FBXNIM_IMPORT_NORMALS_AND_TANGENTS)
+
+        # ###############[ pre import ]################
+
+        # Check is the file alredy exit
+        if additional_data:
+            if "preview_import_path" in additional_data:
+                task_asset_full_path = task.destination_path+"/"+additional_data["preview_import_path"]+"."+additional_data["preview_import_path"]
+                find_asset = unreal.find_asset(task_asset_full_path)
+                if find_asset:
+
+                    # Vertex color
+
+                    asset_import_data = find_asset.get_editor_property('asset_import_data')
+                    if vertex_color_import_option:
+                        asset_import_data.set_editor_property('vertex_color_import_option', vertex_color_import_option)
+
+                    if vertex_override_color:
+                        asset_import_data.set_editor_property('vertex_override_color', vertex_override_color.to_rgbe())
+
+        if asset_data["type"] == "Animation":
+            '''
+            For animation the script will import a skeletal mesh and remove after.
+            If the skeletal mesh alredy exist try to remove.
+            '''
+
+            AssetName = asset_data["name"]
+            AssetName = ValidUnrealAssetsName(AssetName)
+            AssetPath = "SkeletalMesh'"+asset_data["full_import_path"]+"/"+AssetName+"."+AssetName+"'"
+
+            if unreal.EditorAssetLibrary.does_asset_exist(AssetPath):
+                oldAsset = unreal.EditorAssetLibrary.find_asset_data(AssetPath)
+                if oldAsset.asset_class == "SkeletalMesh":
+                    unreal.EditorAssetLibrary.delete_asset(AssetPath)
+
+        asset_import = AssetImport(asset_data, task)
+        asset_import.additional_data = additional_data
+        asset_import.vertex_color_import_option = vertex_color_import_option
+        asset_import.vertex_override_color = vertex_override_color
+        return asset_import
+
+    def PostImportAsset(asset_import):
+        # Post treatment of an asset after the import of its task
+
+        asset_data = asset_import.asset_data
+        task = asset_import.task
+        additional_data = asset_import.additional_data
+        vertex_color_import_option = asset_import.vertex_color_import_option
+        vertex_override_color = asset_import.vertex_override_color
+        fail_count = len(ImportFailList)
+
+        if len(task.imported_object_paths) > 0:
+            asset = unreal.find_asset(task.imported_object_paths[0])
+        else:
+            asset = None
+
+        if asset is None:
+            ImportFailList.append('Error zero imported object for: ' + asset_data["name"])
+            return
+
+        if asset_data["type"] == "Animation":
+            # For animation remove the extra mesh
+            p = task.imported_object_paths[0]
+            if type(unreal.find_asset(p)) is not unreal.AnimSequence:
+                animAssetName = p.split('.')[0]+'_anim.'+p.split('.')[1]+'_anim'
+                animAssetNameDesiredPath = p.split('.')[0]+'.'+p.split('.')[1]
+                animAsset = unreal.find_asset(animAssetName)
+                if animAsset is not None:
+                    unreal.EditorAssetLibrary.delete_asset(p)
+                    unreal.EditorAssetLibrary.rename_asset(animAssetName, animAssetNameDesiredPath)
+                    asset = animAsset
+                else:
+                    ImportFailList.append('animAsset ' + asset_data["name"] + ' not found for after inport: ' + animAssetName)
+                    return
 
-            if asset_data["type"] == "SkeletalMesh":
-                asset_import_data.set_editor_property('normal_import_method', unreal.FBXNormalImportMethod.FBXNIM_IMPORT_NORMALS_AND_TANGENTS)
+        # ###############[ Post treatment ]################
+
+        asset_import_data = asset.get_editor_property('asset_import_data')
+        if asset_data["type"] == "StaticMesh":
+            if "static_mesh_lod_group" in asset_data:
+                if asset_data["static_mesh_lod_group"]:
+                    asset.set_editor_property('lod_group', asset_data["static_mesh_lod_group"])
+            if "use_custom_light_map_resolution" in asset_data:
+                if asset_data["use_custom_light_map_resolution"]:
+                    if "light_map_resolution" in asset_data:
+                        asset.set_editor_property('light_map_resolution', asset_data["light_map_resolution"])
+
+            if "collision_trace_flag" in asset_data:
+                if asset_data["collision_trace_flag"] == "CTF_UseDefault":
+                    asset.get_editor_property('body_setup').set_editor_property('collision_trace_flag', unreal.CollisionTraceFlag.CTF_USE_DEFAULT)
+                elif asset_data["collision_trace_flag"] == "CTF_UseSimpleAndComplex":
+                    asset.get_editor_property('body_setup').set_editor_property('collision_trace_flag', unreal.CollisionTraceFlag.CTF_USE_SIMPLE_AND_COMPLEX)
+                elif asset_data["collision_trace_flag"] == "CTF_UseSimpleAsComplex":
+                    asset.get_editor_property('body_setup').set_editor_property('collision_trace_flag', unreal.CollisionTraceFlag.CTF_USE_SIMPLE_AS_COMPLEX)
+                elif asset_data["collision_trace_flag"] == "CTF_UseComplexAsSimple":
+                    asset.get_editor_property('body_setup').set_editor_property('collision_trace_flag', unreal.CollisionTraceFlag.CTF_USE_COMPLEX_AS_SIMPLE)
+
+        if asset_data["type"] == "StaticMesh":
+            if "generate_lightmap_u_vs" in asset_data:
+                asset_import_data.set_editor_property('generate_lightmap_u_vs', asset_data["generate_lightmap_u_vs"])  # Import data
+                unreal.EditorStaticMeshLibrary.set_generate_lightmap_uv(asset, asset_data["generate_lightmap_u_vs"])  # Build settings at lod
+
+        if asset_data["type"] == "SkeletalMesh":
+            asset_import_data.set_editor_property('normal_import_method', unreal.FBXNormalImportMethod.FBXNIM_IMPORT_NORMALS_AND_TANGENTS)
+
+        # Socket
+        if asset_data["type"] == "SkeletalMesh":
+            # Import the SkeletalMesh socket(s)
+            sockets_to_add = additional_data["Sockets"]
+            skeleton = asset.get_editor_property('skeleton')
+            for socket in sockets_to_add:
+                old_socket = asset.find_socket(socket["SocketName"])
+                if old_socket:
+                    # Edit socket
+                    pass
+                    # old_socket.relative_location = socket["Location"]
+                    # old_socket.relative_rotation = socket["Rotation"]
+                    # old_socket.relative_scale = socket["Scale"]
 
-            # Socket
-            if asset_data["type"] == "SkeletalMesh":
-                # Import the SkeletalMesh socket(s)
-                sockets_to_add = additional_data["Sockets"]
-                skeleton = asset.get_editor_property('skeleton')
-                for socket in sockets_to_add:
-                    old_socket = asset.find_socket(socket["SocketName"])
-                    if old_socket:
-                        # Edit socket
-                        pass
-                        # old_socket.relative_location = socket["Location"]
-                        # old_socket.relative_rotation = socket["Rotation"]
-                        # old_socket.relative_scale = socket["Scale"]
+                else:
+                    # Create socket
+                    pass
+                    # new_socket = unreal.SkeletalMeshSocket(asset)
+                    # new_socket.socket_name = socket["SocketName"]
+                    # new_socket.bone_name = socket["BoneName"]
+                    # new_socket.relative_location = socket["Location"]
+                    # new_socket.relative_rotation = socket["Rotation"]
+                    # new_socket.relative_scale = socket["Scale"]
+                    # NEED UNREAL ENGINE IMPLEMENTATION IN PYTHON API.
+                    # skeleton.add_socket(new_socket)
+
+        # Lod
+        if asset_data["type"] == "StaticMesh" or asset_data["type"] == "SkeletalMesh":
+            if asset_data["type"] == "StaticMesh":
+                unreal.EditorStaticMeshLibrary.remove_lods(asset)  # Import the StaticMesh lod(s)
+
+            if asset_data["type"] == "SkeletalMesh" or asset_data["type"] == "StaticMesh":
+
+                def ImportStaticLod(lod_name, lod_number):
+                    if "LevelOfDetail" in additional_data:
+                        if lod_name in additional_data["LevelOfDetail"]:
+                            if additional_data.get("LodChain", False) and hasattr(unreal.EditorStaticMeshLibrary, 'import_lod'):
+                                # Import the file directly in the lod slot, without import task and temporary asset
+                                lod_index = unreal.EditorStaticMeshLibrary.import_lod(asset, lod_number, additional_data["LevelOfDetail"][lod_name])
+                                if lod_index < 0:
+                                    ImportFailList.append('Lod ' + lod_name + ' could not be imported for ' + asset_data["name"])
+                                return
+
+                            lodTask = unreal.AssetImportTask()
+                            lodTask.filename = additional_data["LevelOfDetail"][lod_name]
+                            destination_path = os.path.normpath(asset_data["full_import_path"]).replace('\\', '/')
+                            lodTask.destination_path = destination_path
+                            lodTask.automated = True
+                            lodTask.replace_existing = True
+
+                            # Set vertex color import settings to replicate base StaticMesh's behaviour
+                            if asset_data["type"] == "Alembic":
+                                lodTask.set_editor_property('options', unreal.AbcImportSettings())
+                            else:
+                                lodTask.set_editor_property('options', unreal.FbxImportUI())
+
+                            lodTask.get_editor_property('options').static_mesh_import_data.set_editor_property('vertex_color_import_option', vertex_color_import_option)
+                            lodTask.get_editor_property('options').static_mesh_import_data.set_editor_property('vertex_override_color', vertex_override_color.to_rgbe())
+
+                            print(destination_path, additional_data["LevelOfDetail"][lod_name])
+                            unreal.AssetToolsHelpers.get_asset_tools().import_asset_tasks([lodTask])
+                            if len(lodTask.imported_object_paths) > 0:
+                                lodAsset = unreal.find_asset(lodTask.imported_object_paths[0])
+                                slot_replaced = unreal.EditorStaticMeshLibrary.set_lod_from_static_mesh(asset, lod_number, lodAsset, 0, True)
+                                unreal.EditorAssetLibrary.delete_asset(lodTask.imported_object_paths[0])
+                            else:
+                                ImportFailList.append('Lod ' + lod_name + ' could not be imported for ' + asset_data["name"])
+
+                def ImportSkeletalLod(lod_name, lod_number):
+                    if "LevelOfDetail" in additional_data:
+                        if lod_name in additional_data["LevelOfDetail"]:
+                            # Unreal python no longer support Skeletal mesh LODS import.
+                            pass
 
-                    else:
-                        # Create socket
-                        pass
-                        # new_socket = unreal.SkeletalMeshSocket(asset)
-                        # new_socket.socket_name = socket["SocketName"]
-                        # new_socket.bone_name = socket["BoneName"]
-                        # new_socket.relative_location = socket["Location"]
-                        # new_socket.relative_rotation = socket["Rotation"]
-                        # new_socket.relative_scale = socket["Scale"]
-                        # NEED UNREAL ENGINE IMPLEMENTATION IN PYTHON API.
-                        # skeleton.add_socket(new_socket)
-
-            # Lod
-            if asset_data["type"] == "StaticMesh" or asset_data["type"] == "SkeletalMesh":
                 if asset_data["type"] == "StaticMesh":
-                    unreal.EditorStaticMeshLibrary.remove_lods(asset)  # Import the StaticMesh lod(s)
-
-                if asset_data["type"] == "SkeletalMesh" or asset_data["type"] == "StaticMesh":
-
-                    def ImportStaticLod(lod_name, lod_number):
-                        if "LevelOfDetail" in additional_data:
-                            if lod_name in additional_data["LevelOfDetail"]:
-                                lodTask = unreal.AssetImportTask()
-                                lodTask.filename = additional_data["LevelOfDetail"][lod_name]
-                                destination_path = os.path.normpath(asset_data["full_import_path"]).replace('\\', '/')
-                                lodTask.destination_path = destination_path
-                                lodTask.automated = True
-                                lodTask.replace_existing = True
-
-                                # Set vertex color import settings to replicate base StaticMesh's behaviour
-                                if asset_data["type"] == "Alembic":
-                                    lodTask.set_editor_property('options', unreal.AbcImportSettings())
-                                else:
-                                    lodTask.set_editor_property('options', unreal.FbxImportUI())
-
-                                lodTask.get_editor_property('options').static_mesh_import_data.set_editor_property('vertex_color_import_option', vertex_color_import_option)
-                                lodTask.get_editor_property('options').static_mesh_import_data.set_editor_property('vertex_override_color', vertex_override_color.to_rgbe())
-
-                                print(destination_path, additional_data["LevelOfDetail"][lod_name])
-                                unreal.AssetToolsHelpers.get_asset_tools().import_asset_tasks([lodTask])
-                                if len(lodTask.imported_object_paths) > 0:
-                                    lodAsset = unreal.find_asset(lodTask.imported_object_paths[0])
-                                    slot_replaced = unreal.EditorStaticMeshLibrary.set_lod_from_static_mesh(asset, lod_number, lodAsset, 0, True)
-                                    unreal.EditorAssetLibrary.delete_asset(lodTask.imported_object_paths[0])
-
-                    def ImportSkeletalLod(lod_name, lod_number):
-                        if "LevelOfDetail" in additional_data:
-                            if lod_name in additional_data["LevelOfDetail"]:
-                                # Unreal python no longer support Skeletal mesh LODS import.
-                                pass
-
-                    if asset_data["type"] == "StaticMesh":
-                        ImportStaticLod("lod_1", 1)
-                        ImportStaticLod("lod_2", 2)
-                        ImportStaticLod("lod_3", 3)
-                        ImportStaticLod("lod_4", 4)
-                        ImportStaticLod("lod_5", 5)
-
-                    elif asset_data["type"] == "SkeletalMesh":
-                        ImportSkeletalLod("lod_1", 1)
-                        ImportSkeletalLod("lod_2", 2)
-                        ImportSkeletalLod("lod_3", 3)
-                        ImportSkeletalLod("lod_4", 4)
-                        ImportSkeletalLod("lod_5", 5)
-
-            # Vertex color
-            if vertex_override_color:
-                asset_import_data.set_editor_property('vertex_override_color', vertex_override_color.to_rgbe())
-
-            if vertex_color_import_option:
-                asset_import_data.set_editor_property('vertex_color_import_option', vertex_color_import_option)
-
-            # #################################[EndChange]
-            if asset_data["type"] == "StaticMesh" or asset_data["type"] == "SkeletalMesh":
-                unreal.EditorAssetLibrary.save_loaded_asset(asset)
-            ImportedList.append([asset, asset_data["type"]])
+                    ImportStaticLod("lod_1", 1)
+                    ImportStaticLod("lod_2", 2)
+                    ImportStaticLod("lod_3", 3)
+                    ImportStaticLod("lod_4", 4)
+                    ImportStaticLod("lod_5", 5)
+
+                elif asset_data["type"] == "SkeletalMesh":
+                    ImportSkeletalLod("lod_1", 1)
+                    ImportSkeletalLod("lod_2", 2)
+                    ImportSkeletalLod("lod_3", 3)
+                    ImportSkeletalLod("lod_4", 4)
+                    ImportSkeletalLod("lod_5", 5)
+
+        # Vertex color
+        if vertex_override_color:
+            asset_import_data.set_editor_property('vertex_override_color', vertex_override_color.to_rgbe())
+
+        if vertex_color_import_option:
+            asset_import_data.set_editor_property('vertex_color_import_option', vertex_color_import_option)
+
+        # #################################[EndChange]
+        if asset_data["type"] == "StaticMesh" or asset_data["type"] == "SkeletalMesh":
+            unreal.EditorAssetLibrary.save_loaded_asset(asset)
+        ImportedList.append([asset, asset_data["type"]])
+        if len(ImportFailList) == fail_count:
+            # An asset with a failed lod is imported again the next time
+            hash_manifest.RecordImportedAsset(GetAssetKey(asset_data), asset_import.import_hash, asset.get_path_name())
+
+    def ImportAssetsByType(type):
+        # Import all the assets of a type with a single import_asset_tasks call.
+        # A SkeletalMesh that need the skeleton created by an other SkeletalMesh
+        # of the same type is imported in the next pass.
+
+        phase_time = ImportPhaseTime(type)
+        PhaseTimeList.append(phase_time)
+
+        pending_assets = GetAssetByType(type)
+        while len(pending_assets) > 0:
+            start_time = time.time()
+            asset_imports = []
+            deferred_assets = []
+            new_skeleton_paths = []
+            for asset_data in pending_assets:
+                import_hash = GetAssetImportHash(asset_data)
+                if not force_import and hash_manifest.IsAssetUpToDate(GetAssetKey(asset_data), import_hash):
+                    print("Skip unchanged asset: ", asset_data["name"])
+                    SkippedList.append(asset_data)
+                    continue
+
+                if asset_data["type"] == "SkeletalMesh":
+                    if asset_data["animation_skeleton_path"] in new_skeleton_paths:
+                        deferred_assets.append(asset_data)
+                        continue
+
+                counter = str(len(ImportedList)+len(SkippedList)+len(asset_imports)+1) + "/" + str(len(import_assets_data["assets"]))
+                asset_import = PrepareAssetImport(asset_data, counter)
+                if asset_import:
+                    asset_import.import_hash = import_hash
+                    asset_imports.append(asset_import)
+                    if asset_data["type"] == "SkeletalMesh":
+                        if GetSkeleton(asset_data["animation_skeleton_path"]) is None:
+                            # This import will create the skeleton
+                            new_skeleton_paths.append(asset_data["animation_skeleton_path"])
+
+            import_start_time = time.time()
+            phase_time.prepare_time += import_start_time - start_time
+
+            # ###############[ import asset ]################
 
-        ImportTask()
+            if len(asset_imports) > 0:
+                print("Import " + str(len(asset_imports)) + " " + type + " task(s)")
+                unreal.AssetToolsHelpers.get_asset_tools().import_asset_tasks([asset_import.task for asset_import in asset_imports])
+            SkeletonCache.clear()
+
+            post_start_time = time.time()
+            phase_time.import_time += post_start_time - import_start_time
+
+            for asset_import in asset_imports:
+                PostImportAsset(asset_import)
+
+            phase_time.post_time += time.time() - post_start_time
+            phase_time.asset_count += len(asset_imports)
+            pending_assets = deferred_assets
 
     # Process import
 
     print('========================= Import started ! =========================')
     print(import_assets_data["assets"])
 
-    # Import assets with a specific order
+    # Import assets with a specific order, animations need the skeletons
+
+    ImportAssetsByType("Alembic")
+    ImportAssetsByType("StaticMesh")
+    ImportAssetsByType("SkeletalMesh")
+    ImportAssetsByType("Animation")
 
-    for asset in GetAssetByType("Alembic"):
-        ImportAsset(asset)
-    for asset in GetAssetByType("StaticMesh"):
-        ImportAsset(asset)
-    for asset in GetAssetByType("SkeletalMesh"):
-        ImportAsset(asset)
-    for asset in GetAssetByType("Animation"):
-        ImportAsset(asset)
+    hash_manifest.Save()
 
     print('========================= Full import completed !  =========================')
 
@@ -512,10 +718,24 @@ def ImportAllAssets():
     print('Imported SkeletalMesh: '+str(len(SkeletalMesh_ImportedList)))
     print('Imported Alembic: '+str(len(Alembic_ImportedList)))
     print('Imported Animation: '+str(len(Animation_ImportedList)))
+    print('Skipped unchanged: '+str(len(SkippedList)))
     print('Import failled: '+str(len(ImportFailList)))
     for error in ImportFailList:
         print(error)
 
+    # Import time
+    print('Import time:')
+    for phase_time in PhaseTimeList:
+        print(
+            ' ' + phase_time.name + ' (' + str(phase_time.asset_count) + '): ' +
+            'prepare %.2fs, import %.2fs, post %.2fs, total %.2fs' % (
+                phase_time.prepare_time,
+                phase_time.import_time,
+                phase_time.post_time,
+                phase_time.GetTime()
+                )
+            )
+
     # Select asset(s) in content browser
     PathList = []
     for asset in (StaticMesh_ImportedList + SkeletalMesh_ImportedList + Alembic_ImportedList + Animation_ImportedList):
@@ -529,9 +749,14 @@ def ImportAllAssets():
         return 'Assets imported with success !'
 
 
-print("Start importing assets.")
+def main():
+    print("Start importing assets.")
+
+    if CheckTasks():
+        print(ImportAllAssets(force_import="--force" in sys.argv))
+
+    print("Importing assets finished.")
 
-if CheckTasks():
-    print(ImportAllAssets())
 
-print("Importing assets finished.")
+if __name__ == "__main__":
+    main()
@@ -46,6 +46,64 @@ def JsonLoadFile(json_file_path):
             return JsonLoad(json_file)
 
 
+def GetCameraTrackKeys(camera_tracks, track_name):
+    # Returns (frames, values) of an additional track.
+    # Columnar tracks store one list by channel, the others one dict key by frame.
+    track = camera_tracks[track_name]
+    if camera_tracks.get("track_format") == "columnar":
+        return camera_tracks["frames"], track
+    frames = [int(key) for key in track.keys()]
+    return frames, list(track.values())
+
+
+def GetCameraTransformTrackKeys(camera_tracks):
+    # Returns (frames, {channel: values}) of the camera transform track.
+    track = camera_tracks['Camera transform']
+    if camera_tracks.get("track_format") == "columnar":
+        return camera_tracks["frames"], track
+    frames = [int(key) for key in track.keys()]
+    transforms = list(track.values())
+    channels = {}
+    if len(transforms) > 0:
+        for channel_name in transforms[0].keys():
+            channels[channel_name] = [transform[channel_name] for transform in transforms]
+    return frames, channels
+
+
+def GetReducedKeyIndices(values):
+    # Returns the indices of the keys to keep.
+    # In a run of equal values only the keys at less than two frames from a value change are kept
+    # (and the first/last keys), so the auto tangents of the kept keys stay the same and the run stays flat.
+    # A constant channel is reduced to a single key.
+    key_num = len(values)
+    if key_num == 0:
+        return []
+    if all(value == values[0] for value in values):
+        return [0]
+
+    indices = []
+    for x in range(key_num):
+        value = values[x]
+        for y in range(max(0, x-2), min(key_num, x+3)):
+            if values[y] != value:
+                indices.append(x)
+                break
+        else:
+            if x == 0 or x == key_num-1:
+                indices.append(x)
+    return indices
+
+
+def AddSequencerChannelKeys(channel, frame_numbers, values):
+    # The scripting channels only expose add_key(), so the keys are reduced before
+    for x in GetReducedKeyIndices(values):
+        channel.add_key(frame_numbers[x], values[x])
+
+
+def GetFrameNumbers(frames):
+    return [unreal.FrameNumber(int(frame)) for frame in frames]
+
+
 def GetUnrealVersion():
     version = unreal.SystemLibrary.get_engine_version().split(".")
     float_version = int(version[0]) + float(float(version[1])/100)
@@ -71,32 +129,27 @@ def CreateSequencer():
     unreal_import_location = sequence_data['unreal_import_location']
     ImportedCamera = []  # (CameraName, CameraGuid)
 
-    def AddSequencerSectionTransformKeysByIniFile(sequencer_section, track_dict):
-        for key in track_dict.keys():
-            value = track_dict[key]  # (x,y,z x,y,z x,y,z)
-            frame = unreal.FrameNumber(int(key))
-
-            sequencer_section.get_channels()[0].add_key(frame, value["location_x"])
-            sequencer_section.get_channels()[1].add_key(frame, value["location_y"])
-            sequencer_section.get_channels()[2].add_key(frame, value["location_z"])
-            sequencer_section.get_channels()[3].add_key(frame, value["rotation_x"])
-            sequencer_section.get_channels()[4].add_key(frame, value["rotation_y"])
-            sequencer_section.get_channels()[5].add_key(frame, value["rotation_z"])
-            sequencer_section.get_channels()[6].add_key(frame, value["scale_x"])
-            sequencer_section.get_channels()[7].add_key(frame, value["scale_y"])
-            sequencer_section.get_channels()[8].add_key(frame, value["scale_z"])
-
-    def AddSequencerSectionFloatKeysByIniFile(sequencer_section, track_dict):
-        for key in track_dict.keys():
-            frame = unreal.FrameNumber(int(key))
-            value = track_dict[key]
-            sequencer_section.get_channels()[0].add_key(frame, value)
-
-    def AddSequencerSectionBoolKeysByIniFile(sequencer_section, track_dict):
-        for key in track_dict.keys():
-            frame = unreal.FrameNumber(int(key))
-            value = track_dict[key]
-            sequencer_section.get_channels()[0].add_key(frame, value)
+    def AddSequencerSectionTransformKeysByIniFile(sequencer_section, track_keys):
+        frames, channels = track_keys
+        transform_channels = [
+            "location_x", "location_y", "location_z",
+            "rotation_x", "rotation_y", "rotation_z",
+            "scale_x", "scale_y", "scale_z",
+            ]
+        frame_numbers = GetFrameNumbers(frames)
+        section_channels = sequencer_section.get_channels()
+        for x, channel_name in enumerate(transform_channels):
+            AddSequencerChannelKeys(section_channels[x], frame_numbers, channels[channel_name])
+
+    def AddSequencerSectionFloatKeysByIniFile(sequencer_section, track_keys):
+        frames, values = track_keys
+        section_channel = sequencer_section.get_channels()[0]
+        AddSequencerChannelKeys(section_channel, GetFrameNumbers(frames), values)
+
+    def AddSequencerSectionBoolKeysByIniFile(sequencer_section, track_keys):
+        frames, values = track_keys
+        section_channel = sequencer_section.get_channels()[0]
+        AddSequencerChannelKeys(section_channel, GetFrameNumbers(frames), values)
 
     print("Warning this file already exists")  # ???
     factory = unreal.LevelSequenceFactoryNew()
@@ -145,7 +198,7 @@ def CreateSequencer():
         sectionFocalLength = TrackFocalLength.add_section()
         sectionFocalLength.set_end_frame_bounded(False)
         sectionFocalLength.set_start_frame_bounded(False)
-        AddSequencerSectionFloatKeysByIniFile(sectionFocalLength, camera_tracks['Camera FocalLength'])
+        AddSequencerSectionFloatKeysByIniFile(sectionFocalLength, GetCameraTrackKeys(camera_tracks, 'Camera FocalLength'))
 
         TrackSensorWidth = camera_component_binding.add_track(unreal.MovieSceneFloatTrack)
         TrackSensorWidth.set_property_name_and_path('Filmback.SensorWidth', 'Filmback.SensorWidth')
@@ -153,7 +206,7 @@ def CreateSequencer():
         sectionSensorWidth = TrackSensorWidth.add_section()
         sectionSensorWidth.set_end_frame_bounded(False)
         sectionSensorWidth.set_start_frame_bounded(False)
-        AddSequencerSectionFloatKeysByIniFile(sectionSensorWidth, camera_tracks['Camera SensorWidth'])
+        AddSequencerSectionFloatKeysByIniFile(sectionSensorWidth, GetCameraTrackKeys(camera_tracks, 'Camera SensorWidth'))
 
         TrackSensorHeight = camera_component_binding.add_track(unreal.MovieSceneFloatTrack)
         TrackSensorHeight.set_property_name_and_path('Filmback.SensorHeight', 'Filmback.SensorHeight')
@@ -162,18 +215,18 @@ def CreateSequencer():
         sectionSensorHeight.set_end_frame_bounded(False)
         sectionSensorHeight.set_start_frame_bounded(False)
 
-        crop_camera_sensor_height = {}
-        for key in camera_tracks['Camera SensorHeight'].keys():
-            original_width = float(camera_tracks['Camera SensorWidth'][key])
-            original_height = float(camera_tracks['Camera SensorHeight'][key])
-            res_x = float(sequence_data['render_resolution_x'])
-            res_y = float(sequence_data['render_resolution_y'])
-            pixel_x = float(sequence_data['pixel_aspect_x'])
-            pixel_y = float(sequence_data['pixel_aspect_y'])
-            res_ratio = res_x / res_y
-            pixel_ratio = pixel_x / pixel_y
+        res_x = float(sequence_data['render_resolution_x'])
+        res_y = float(sequence_data['render_resolution_y'])
+        pixel_x = float(sequence_data['pixel_aspect_x'])
+        pixel_y = float(sequence_data['pixel_aspect_y'])
+        res_ratio = res_x / res_y
+        pixel_ratio = pixel_x / pixel_y
 
-            crop_camera_sensor_height[key] = (original_width / (res_ratio * pixel_ratio))
+        sensor_width_frames, sensor_width_values = GetCameraTrackKeys(camera_tracks, 'Camera SensorWidth')
+        crop_camera_sensor_height_values = []
+        for original_width in sensor_width_values:
+            crop_camera_sensor_height_values.append(float(original_width) / (res_ratio * pixel_ratio))
+        crop_camera_sensor_height = (sensor_width_frames, crop_camera_sensor_height_values)
 
         AddSequencerSectionFloatKeysByIniFile(sectionSensorHeight, crop_camera_sensor_height)
 
@@ -190,7 +243,7 @@ def CreateSequencer():
         sectionFocusDistance = TrackFocusDistance.add_section()
         sectionFocusDistance.set_end_frame_bounded(False)
         sectionFocusDistance.set_start_frame_bounded(False)
-        AddSequencerSectionFloatKeysByIniFile(sectionFocusDistance, camera_tracks['Camera FocusDistance'])
+        AddSequencerSectionFloatKeysByIniFile(sectionFocusDistance, GetCameraTrackKeys(camera_tracks, 'Camera FocusDistance'))
 
         TracknAperture = camera_component_binding.add_track(unreal.MovieSceneFloatTrack)
         TracknAperture.set_property_name_and_path('CurrentAperture', 'CurrentAperture')
@@ -198,7 +251,7 @@ def CreateSequencer():
         sectionAperture = TracknAperture.add_section()
         sectionAperture.set_end_frame_bounded(False)
         sectionAperture.set_start_frame_bounded(False)
-        AddSequencerSectionFloatKeysByIniFile(sectionAperture, camera_tracks['Camera Aperture'])
+        AddSequencerSectionFloatKeysByIniFile(sectionAperture, GetCameraTrackKeys(camera_tracks, 'Camera Aperture'))
 
         # add a binding for the camera
         camera_binding = seq.add_possessable(cine_camera_actor)
@@ -216,7 +269,7 @@ def CreateSequencer():
         transform_section = transform_track.add_section()
         transform_section.set_end_frame_bounded(False)
         transform_section.set_start_frame_bounded(False)
-        AddSequencerSectionTransformKeysByIniFile(transform_section, camera_tracks['Camera transform'])
+        AddSequencerSectionTransformKeysByIniFile(transform_section, GetCameraTransformTrackKeys(camera_tracks))
 
         # Set property binding
         if spawnable_camera:
@@ -231,7 +284,7 @@ def CreateSequencer():
         tracksSpawned = current_camera_binding.find_tracks_by_exact_type(unreal.MovieSceneSpawnTrack)
         if len(tracksSpawned) > 0:
             sectionSpawned = tracksSpawned[0].get_sections()[0]
-            AddSequencerSectionBoolKeysByIniFile(sectionSpawned, camera_tracks['Camera Spawned'])
+            AddSequencerSectionBoolKeysByIniFile(sectionSpawned, GetCameraTrackKeys(camera_tracks, 'Camera Spawned'))
 
         # Set property actor
         if spawnable_camera:
@@ -288,9 +341,14 @@ def CreateSequencer():
     return 'Sequencer created with success !'
 
 
-print("Start importing sequencer.")
+def main():
+    print("Start importing sequencer.")
+
+    if CheckTasks():
+        print(CreateSequencer())
+
+    print("Importing sequencer finished.")
 
-if CheckTasks():
-    print(CreateSequencer())
 
-print("Importing sequencer finished.")
+if __name__ == "__main__":
+    main()
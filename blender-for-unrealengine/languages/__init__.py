@@ -1,56 +1,84 @@
 import bpy
 import json
 import os
-from os import listdir
-from os.path import isfile, join
+from os.path import isfile
 
 tooltips_dictionary = {}
 interface_dictionary = {}
 new_data_dictionary = {}
 current_language = ""
+current_language_key = None
+
+locale_data_cache = {}  # locale: data of the json file (None if not found)
+language_table_cache = {}  # (locale, tooltips, interface, new_data): dictionaries
+
+
+def GetLocaleData(local):
+    # The json file of each locale is read only one time
+    if local not in locale_data_cache:
+        dir_path = os.path.dirname(os.path.realpath(__file__))
+        lang_file = os.path.join(dir_path, "local_list", local+".json")
+        if isfile(lang_file):
+            with open(lang_file) as json_file:
+                locale_data_cache[local] = json.load(json_file)
+        else:
+            locale_data_cache[local] = None
+    return locale_data_cache[local]
 
 
 def UpdateDict(local, tooltips=True, interface=True, new_data=True):
     # Try to found lang file
-    dir_path = os.path.dirname(os.path.realpath(__file__))
-    lang_path = os.path.join(dir_path, "local_list")
-    onlyfiles = [f for f in listdir(lang_path) if isfile(join(lang_path, f))]
+    data = GetLocaleData(local)
+    if data is None:
+        return
 
-    for file in onlyfiles:
-        if file == local+".json":
-            with open(os.path.join(lang_path, file)) as json_file:
-                data = json.load(json_file)
+    if tooltips:
+        tooltips_dictionary.update(data['tooltips'])
 
-                if tooltips:
-                    for key, value in data['tooltips'].items():
-                        tooltips_dictionary[key] = value
+    if interface:
+        interface_dictionary.update(data['interface'])
 
-                if interface:
-                    for key, value in data['interface'].items():
-                        interface_dictionary[key] = value
+    if new_data:
+        new_data_dictionary.update(data['new_data'])
 
-                if new_data:
-                    for key, value in data['new_data'].items():
-                        new_data_dictionary[key] = value
 
+def GetLanguageKey(locale):
+    view = bpy.context.preferences.view
+    return (
+        locale,
+        view.use_translate_tooltips,
+        view.use_translate_interface,
+        view.use_translate_new_dataname
+        )
 
-def InitLanguages(locale):
-    prefs = bpy.context.preferences
-    view = prefs.view
-
-    tooltips_dictionary.clear()
-    interface_dictionary.clear()
-    new_data_dictionary.clear()
 
-    UpdateDict("en_US")  # Get base lang
-    # Update base lang with local lang if file exist
-    UpdateDict(locale, view.use_translate_tooltips, view.use_translate_interface, view.use_translate_new_dataname)
+def InitLanguages(locale):
+    global tooltips_dictionary
+    global interface_dictionary
+    global new_data_dictionary
+    global current_language
+    global current_language_key
+
+    language_key = GetLanguageKey(locale)
+    if language_key not in language_table_cache:
+        tooltips_dictionary = {}
+        interface_dictionary = {}
+        new_data_dictionary = {}
+
+        UpdateDict("en_US")  # Get base lang
+        # Update base lang with local lang if file exist
+        UpdateDict(locale, language_key[1], language_key[2], language_key[3])
+        language_table_cache[language_key] = (tooltips_dictionary, interface_dictionary, new_data_dictionary)
+
+    tooltips_dictionary, interface_dictionary, new_data_dictionary = language_table_cache[language_key]
     current_language = locale
+    current_language_key = language_key
 
 
 def CheckCurrentLanguage():
-    from bpy.app.translations import locale  # Change with language
-    if current_language != locale:
+    # Change with language or translation preferences
+    locale = bpy.app.translations.locale
+    if current_language_key != GetLanguageKey(locale):
         InitLanguages(locale)
 
 # Translate function
@@ -0,0 +1,281 @@
+# Tests of the Unreal asset import script with a mock unreal module.
+# Run with: python -m pytest tests
+
+import os
+import sys
+import json
+import types
+import shutil
+import tempfile
+import unittest
+import importlib.util
+
+
+script_path = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "blender-for-unrealengine", "import", "asset_import_script.py")
+
+
+class MockObject():
+    # Accept any editor property and any attribute chain
+
+    def __init__(self, *args, **kwargs):
+        self._properties = {}
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        value = MockObject()
+        setattr(self, name, value)
+        return value
+
+    def set_editor_property(self, name, value):
+        self._properties[name] = value
+
+    def get_editor_property(self, name):
+        if name not in self._properties:
+            self._properties[name] = MockObject()
+        return self._properties[name]
+
+    def to_rgbe(self):
+        return 0
+
+    def get_full_name(self):
+        return "MockObject"
+
+    def find_socket(self, name):
+        return None
+
+
+class MockAsset(MockObject):
+
+    def __init__(self, path):
+        MockObject.__init__(self)
+        self._path = path
+
+    def get_path_name(self):
+        return self._path
+
+
+def CreateMockUnreal():
+    # Returns a new unreal module, the imports are recorded in unreal.import_calls
+    unreal = types.ModuleType("unreal")
+    unreal.import_calls = []
+    unreal.assets = {}
+    unreal.import_lod_result = 1
+
+    class Skeleton(MockAsset):
+        pass
+
+    class SkeletalMesh(MockAsset):
+        pass
+
+    class StaticMesh(MockAsset):
+        pass
+
+    class AnimSequence(MockAsset):
+        pass
+
+    class AssetImportTask(MockObject):
+        def __init__(self):
+            MockObject.__init__(self)
+            self.imported_object_paths = []
+
+    class AssetTools():
+        def import_asset_tasks(self, tasks):
+            unreal.import_calls.append([os.path.basename(task.filename) for task in tasks])
+            for task in tasks:
+                name = os.path.splitext(os.path.basename(task.filename))[0]
+                path = task.destination_path + "/" + name + "." + name
+                if name.startswith("Anim_"):
+                    unreal.assets[path] = AnimSequence(path)
+                elif name.startswith("SK_"):
+                    unreal.assets[path] = SkeletalMesh(path)
+                    # A skeletal mesh imported without skeleton create it
+                    skeleton_path = task.destination_path + "/SK_Skeleton.SK_Skeleton"
+                    if skeleton_path not in unreal.assets:
+                        unreal.assets[skeleton_path] = Skeleton(skeleton_path)
+                else:
+                    unreal.assets[path] = StaticMesh(path)
+                task.imported_object_paths = [path]
+
+    class AssetToolsHelpers():
+        @staticmethod
+        def get_asset_tools():
+            return AssetTools()
+
+    class EditorAssetLibrary():
+        @staticmethod
+        def does_asset_exist(path):
+            return path in unreal.assets
+
+        @staticmethod
+        def delete_asset(path):
+            unreal.assets.pop(path, None)
+
+        @staticmethod
+        def find_asset_data(path):
+            return None
+
+        @staticmethod
+        def sync_browser_to_objects(paths):
+            pass
+
+        @staticmethod
+        def save_loaded_asset(asset):
+            pass
+
+    class EditorStaticMeshLibrary():
+        @staticmethod
+        def remove_lods(asset):
+            pass
+
+        @staticmethod
+        def set_generate_lightmap_uv(asset, value):
+            pass
+
+        @staticmethod
+        def import_lod(asset, lod_index, filename):
+            # Returns the lod index, or -1 when the import failed
+            return unreal.import_lod_result
+
+    class SystemLibrary():
+        @staticmethod
+        def get_engine_version():
+            return "5.1.0"
+
+    unreal.Skeleton = Skeleton
+    unreal.SkeletalMesh = SkeletalMesh
+    unreal.StaticMesh = StaticMesh
+    unreal.AnimSequence = AnimSequence
+    unreal.AssetImportTask = AssetImportTask
+    unreal.AssetToolsHelpers = AssetToolsHelpers
+    unreal.EditorAssetLibrary = EditorAssetLibrary
+    unreal.EditorStaticMeshLibrary = EditorStaticMeshLibrary
+    unreal.SystemLibrary = SystemLibrary
+    unreal.find_asset = lambda path: unreal.assets.get(path)
+    for name in ["FbxImportUI", "AbcImportSettings", "LinearColor", "Vector"]:
+        setattr(unreal, name, MockObject)
+    for name in [
+            "VertexColorImportOption",
+            "FBXImportType",
+            "FBXNormalImportMethod",
+            "MaterialSearchLocation",
+            "AlembicImportType",
+            "CollisionTraceFlag"]:
+        setattr(unreal, name, MockObject())
+    return unreal
+
+
+class AssetImportScriptTest(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.unreal = CreateMockUnreal()
+        sys.modules["unreal"] = self.unreal
+        spec = importlib.util.spec_from_file_location("asset_import_script", script_path)
+        self.script = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(self.script)
+
+        additional_data_path = os.path.join(self.temp_dir, "SK_AdditionalTrack.json")
+        with open(additional_data_path, "w") as json_file:
+            json.dump({"Sockets": []}, json_file)
+
+        self.assets = []
+        for name in ["SK_Hero", "SK_HeroArmor"]:
+            self.assets.append(self.GetAssetData(name, "SkeletalMesh", "/Game/Hero", additional_data_path))
+        for name in ["Anim_Run", "Anim_Walk", "Anim_Jump"]:
+            self.assets.append(self.GetAssetData(name, "Animation", "/Game/Hero/Anim", None))
+
+    def tearDown(self):
+        sys.modules.pop("unreal", None)
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def GetAssetData(self, name, asset_type, import_path, additional_tracks_path):
+        asset_data = {}
+        asset_data["name"] = name
+        asset_data["type"] = asset_type
+        asset_data["full_import_path"] = import_path
+        asset_data["fbx_path"] = os.path.join(self.temp_dir, name + ".fbx")
+        asset_data["additional_tracks_path"] = additional_tracks_path
+        asset_data["animation_skeleton_path"] = "/Game/Hero/SK_Skeleton.SK_Skeleton"
+        asset_data["file_hashes"] = {"FBX": name + "_hash"}
+        if asset_type == "SkeletalMesh":
+            asset_data["lod"] = 0
+        return asset_data
+
+    def ImportAssets(self, force_import=False):
+        json_data_path = os.path.join(self.temp_dir, "ImportAssetData.json")
+        with open(json_data_path, "w") as json_file:
+            json.dump({"unreal_import_location": "/Game", "assets": self.assets}, json_file)
+        self.unreal.import_calls = []
+        result = self.script.ImportAllAssets(json_data_path, force_import=force_import)
+        return result, self.unreal.import_calls
+
+    def test_import_is_not_started_by_module_import(self):
+        self.assertEqual(self.unreal.import_calls, [])
+
+    def test_animations_are_imported_in_one_call(self):
+        result, import_calls = self.ImportAssets()
+        self.assertEqual(result, 'Assets imported with success !')
+        self.assertEqual(import_calls[-1], ["Anim_Run.fbx", "Anim_Walk.fbx", "Anim_Jump.fbx"])
+
+    def test_mesh_that_need_a_new_skeleton_is_deferred(self):
+        # The two meshes use the same skeleton, created by the first import
+        result, import_calls = self.ImportAssets()
+        self.assertEqual(import_calls[0], ["SK_Hero.fbx"])
+        self.assertEqual(import_calls[1], ["SK_HeroArmor.fbx"])
+        self.assertEqual(len(import_calls), 3)
+
+    def test_meshes_with_existing_skeleton_are_imported_in_one_call(self):
+        skeleton_path = "/Game/Hero/SK_Skeleton.SK_Skeleton"
+        self.unreal.assets[skeleton_path] = self.unreal.Skeleton(skeleton_path)
+        result, import_calls = self.ImportAssets()
+        self.assertEqual(import_calls[0], ["SK_Hero.fbx", "SK_HeroArmor.fbx"])
+
+    def test_unchanged_assets_are_skipped(self):
+        self.ImportAssets()
+        result, import_calls = self.ImportAssets()
+        self.assertEqual(import_calls, [])
+
+        self.assets[3]["file_hashes"]["FBX"] = "Anim_Walk_changed"
+        result, import_calls = self.ImportAssets()
+        self.assertEqual(import_calls, [["Anim_Walk.fbx"]])
+
+    def test_force_import_all_assets(self):
+        self.ImportAssets()
+        result, import_calls = self.ImportAssets(force_import=True)
+        # The skeleton exist now, so the meshes are imported in one call
+        self.assertEqual(import_calls, [
+            ["SK_Hero.fbx", "SK_HeroArmor.fbx"],
+            ["Anim_Run.fbx", "Anim_Walk.fbx", "Anim_Jump.fbx"]])
+
+    def test_asset_with_failed_lod_is_imported_again(self):
+        lod_data_path = os.path.join(self.temp_dir, "SM_Rock_AdditionalTrack.json")
+        with open(lod_data_path, "w") as json_file:
+            json.dump({
+                "LevelOfDetail": {"lod_1": os.path.join(self.temp_dir, "SM_Rock_LOD1.fbx")},
+                "LodChain": True}, json_file)
+        self.assets = [self.GetAssetData("SM_Rock", "StaticMesh", "/Game/Rock", lod_data_path)]
+
+        self.unreal.import_lod_result = -1
+        result, import_calls = self.ImportAssets()
+        self.assertNotEqual(result, 'Assets imported with success !')
+        result, import_calls = self.ImportAssets()
+        self.assertEqual(import_calls, [["SM_Rock.fbx"]])
+
+        self.unreal.import_lod_result = 1
+        result, import_calls = self.ImportAssets()
+        self.assertEqual(result, 'Assets imported with success !')
+        result, import_calls = self.ImportAssets()
+        self.assertEqual(import_calls, [])
+
+    def test_removed_asset_is_imported_again(self):
+        self.ImportAssets()
+        del self.unreal.assets["/Game/Hero/Anim/Anim_Run.Anim_Run"]
+        result, import_calls = self.ImportAssets()
+        self.assertEqual(import_calls, [["Anim_Run.fbx"]])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+# Tests of the export staging duplication, they need Blender and are skipped without bpy.
+# Run with: blender -b --factory-startup --python tests/test_export_staging.py
+
+import os
+import sys
+import unittest
+import importlib
+
+try:
+    import bpy
+except ImportError:
+    bpy = None
+
+
+ADDON_MODULE = "blender-for-unrealengine"
+REPOSITORY_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def LoadExportUtils():
+    # Use the add-on of this repository even if an other version is installed
+    import addon_utils
+    if REPOSITORY_PATH not in sys.path:
+        sys.path.insert(0, REPOSITORY_PATH)
+    if not addon_utils.check(ADDON_MODULE)[1]:
+        addon_utils.enable(ADDON_MODULE, default_set=False)
+    return importlib.import_module(ADDON_MODULE + ".export.bfu_export_utils")
+
+
+@unittest.skipIf(bpy is None, "Need Blender (bpy)")
+class DuplicateSelectForExportTest(unittest.TestCase):
+
+    def setUp(self):
+        bpy.ops.wm.read_factory_settings(use_empty=True)
+        self.export_utils = LoadExportUtils()
+        scene = bpy.context.scene
+
+        # Rig with an IK chain, a pole target and an Armature constraint
+        armature = bpy.data.armatures.new("Rig")
+        self.rig = bpy.data.objects.new("Rig", armature)
+        scene.collection.objects.link(self.rig)
+        bpy.context.view_layer.objects.active = self.rig
+        bpy.ops.object.mode_set(mode='EDIT')
+        upper = armature.edit_bones.new("Upper")
+        upper.head = (0, 0, 0)
+        upper.tail = (0, 0.1, 1)
+        lower = armature.edit_bones.new("Lower")
+        lower.head = (0, 0.1, 1)
+        lower.tail = (0, 0, 2)
+        lower.parent = upper
+        lower.use_connect = True
+        bpy.ops.object.mode_set(mode='OBJECT')
+
+        self.pole = bpy.data.objects.new("Pole", None)
+        self.pole.location = (0, -2, 1)
+        scene.collection.objects.link(self.pole)
+
+        ik = self.rig.pose.bones["Lower"].constraints.new('IK')
+        ik.target = self.pole
+        ik.pole_target = self.pole
+        ik.chain_count = 2
+
+        mesh_data = bpy.data.meshes.new("Body")
+        mesh_data.from_pydata([(0, 0, 0), (1, 0, 0), (0, 1, 0)], [], [(0, 1, 2)])
+        self.body = bpy.data.objects.new("Body", mesh_data)
+        scene.collection.objects.link(self.body)
+        armature_cons = self.body.constraints.new('ARMATURE')
+        armature_target = armature_cons.targets.new()
+        armature_target.target = self.rig
+        armature_target.subtarget = "Upper"
+        mirror = self.body.modifiers.new("Mirror", 'MIRROR')
+        mirror.mirror_object = self.pole
+
+        # Driver that read the pole location
+        driver = self.body.driver_add("location", 0).driver
+        variable = driver.variables.new()
+        variable.targets[0].id = self.pole
+        variable.targets[0].data_path = "location.x"
+        driver.expression = variable.name
+
+        bpy.ops.object.select_all(action='DESELECT')
+        for obj in [self.rig, self.pole, self.body]:
+            obj.select_set(True)
+        bpy.context.view_layer.objects.active = self.rig
+
+    def test_references_use_the_duplicated_objects(self):
+        duplicate_data = self.export_utils.DuplicateSelectForExport()
+        duplicates = {obj.name: obj for obj in duplicate_data.duplicate_select.user_selecteds}
+        originals = {self.rig, self.pole, self.body}
+        new_rig = bpy.context.view_layer.objects.active
+        self.assertNotIn(new_rig, originals)
+        new_body = [obj for obj in duplicates.values() if obj.type == 'MESH'][0]
+        new_pole = [obj for obj in duplicates.values() if obj.type == 'EMPTY'][0]
+
+        ik = new_rig.pose.bones["Lower"].constraints[0]
+        self.assertEqual(ik.target, new_pole)
+        self.assertEqual(ik.pole_target, new_pole)
+        self.assertEqual(new_body.constraints[0].targets[0].target, new_rig)
+        self.assertEqual(new_body.modifiers["Mirror"].mirror_object, new_pole)
+        variable = new_body.animation_data.drivers[0].driver.variables[0]
+        self.assertEqual(variable.targets[0].id, new_pole)
+
+        # The original rig is unchanged
+        self.assertEqual(self.rig.pose.bones["Lower"].constraints[0].pole_target, self.pole)
+
+
+if __name__ == "__main__":
+    # Blender arguments are before "--"
+    argv = sys.argv[sys.argv.index("--"):] if "--" in sys.argv else sys.argv[:1]
+    unittest.main(argv=argv, exit=bpy is None)
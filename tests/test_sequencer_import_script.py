@@ -0,0 +1,73 @@
+# Tests of the camera key reduction of the Unreal sequencer import script with a mock unreal module.
+# Run with: python -m pytest tests
+
+import os
+import sys
+import types
+import unittest
+import importlib.util
+
+
+script_path = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "blender-for-unrealengine", "import", "sequencer_import_script.py")
+
+
+class MockChannel():
+    # Records the keys added with add_key()
+
+    def __init__(self):
+        self.keys = []
+
+    def add_key(self, frame_number, value):
+        self.keys.append((frame_number, value))
+
+
+class SequencerKeyReductionTest(unittest.TestCase):
+
+    def setUp(self):
+        sys.modules["unreal"] = types.ModuleType("unreal")
+        spec = importlib.util.spec_from_file_location("sequencer_import_script", script_path)
+        self.script = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(self.script)
+
+    def tearDown(self):
+        sys.modules.pop("unreal", None)
+
+    def test_empty_channel(self):
+        self.assertEqual(self.script.GetReducedKeyIndices([]), [])
+
+    def test_constant_channel_keep_one_key(self):
+        self.assertEqual(self.script.GetReducedKeyIndices([0.5] * 10), [0])
+        self.assertEqual(self.script.GetReducedKeyIndices([True]), [0])
+
+    def test_single_frame_change(self):
+        values = [0.0] * 10
+        values[5] = 1.0
+        self.assertEqual(self.script.GetReducedKeyIndices(values), [0, 3, 4, 5, 6, 7, 9])
+
+    def test_keys_at_two_frames_from_a_change_are_kept(self):
+        # The value change between the keys 4 and 5
+        values = [0.0] * 5 + [1.0] * 5
+        self.assertEqual(self.script.GetReducedKeyIndices(values), [0, 3, 4, 5, 6, 9])
+
+    def test_changing_channel_keep_all_keys(self):
+        values = [float(x) for x in range(6)]
+        self.assertEqual(self.script.GetReducedKeyIndices(values), list(range(6)))
+
+    def test_add_reduced_keys_to_channel(self):
+        channel = MockChannel()
+        frame_numbers = list(range(100, 110))
+        values = [0.0] * 5 + [1.0] * 5
+        self.script.AddSequencerChannelKeys(channel, frame_numbers, values)
+        self.assertEqual(channel.keys, [
+            (100, 0.0),
+            (103, 0.0),
+            (104, 0.0),
+            (105, 1.0),
+            (106, 1.0),
+            (109, 1.0)])
+
+
+if __name__ == "__main__":
+    unittest.main()